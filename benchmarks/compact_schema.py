@@ -0,0 +1,116 @@
+"""
+Compare memory use and join time of the default string schema against the
+compact integer-coded schema.
+
+Usage:
+
+    python benchmarks/compact_schema.py --paper-file examples/small_fake_paper_series.csv \
+        --review-file examples/small_fake_review_series.csv \
+        --human-file examples/small_fake_human.csv
+"""
+import argparse
+import json
+import os
+import timeit
+
+import pandas as pd
+
+from chandra_bot import ChandraBot as cbot
+
+example_dir = os.path.join(os.path.dirname(__file__), os.pardir, "examples")
+
+
+def _memory(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _string_joins(bot):
+    # reviews joined to reviewers, then to the authors of the reviewed paper
+    review_human_df = bot.review_df.merge(
+        bot.human_df[["hash_id", "verified"]],
+        how="left",
+        left_on="reviewer_human_hash_id",
+        right_on="hash_id",
+    )
+    author_df = (
+        bot.paper_df.reset_index()[["paper_id", "author_ids"]]
+        .assign(author_id=lambda df: df["author_ids"].str.split(","))
+        .explode("author_id")
+    )
+    return review_human_df.merge(
+        author_df[["paper_id", "author_id"]], how="left", on="paper_id"
+    )
+
+
+def _compact_joins(tables):
+    review_human_df = tables.review_df.merge(
+        tables.human_df[["hash_code", "verified"]],
+        how="left",
+        left_on="reviewer_code",
+        right_on="hash_code",
+    )
+    return review_human_df.merge(
+        tables.paper_author_df[["paper_code", "author_id"]],
+        how="left",
+        on="paper_code",
+    )
+
+
+def run(paper_file: str, review_file: str, human_file: str, repeat: int = 5):
+    bot = cbot.create_bot(
+        paper_file=paper_file, review_file=review_file, human_file=human_file
+    )
+    tables = bot.make_compact_tables()
+
+    string_memory = {
+        "paper_df": _memory(bot.paper_df),
+        "review_df": _memory(bot.review_df),
+        "human_df": _memory(bot.human_df),
+    }
+    compact_memory = tables.memory_usage()
+
+    string_join = min(
+        timeit.repeat(lambda: _string_joins(bot), number=1, repeat=repeat)
+    )
+    compact_join = min(
+        timeit.repeat(lambda: _compact_joins(tables), number=1, repeat=repeat)
+    )
+
+    return {
+        "rows": {
+            "paper": len(bot.paper_df),
+            "review": len(bot.review_df),
+            "human": len(bot.human_df),
+        },
+        "memory_bytes": {
+            "string": string_memory,
+            "string_total": sum(string_memory.values()),
+            "compact": compact_memory,
+            "compact_total": sum(compact_memory.values()),
+        },
+        "join_seconds": {"string": string_join, "compact": compact_join},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--paper-file",
+        default=os.path.join(example_dir, "small_fake_paper_series.csv"),
+    )
+    parser.add_argument(
+        "--review-file",
+        default=os.path.join(example_dir, "small_fake_review_series.csv"),
+    )
+    parser.add_argument(
+        "--human-file", default=os.path.join(example_dir, "small_fake_human.csv")
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.paper_file, args.review_file, args.human_file, args.repeat)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
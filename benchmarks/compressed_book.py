@@ -0,0 +1,135 @@
+"""
+Compare the size and read/write throughput of the raw and compressed
+PaperBook formats.
+
+A synthetic dataset (see chandra_bot.synth) is assembled into a PaperBook
+and written raw, as a compressed container without a dictionary, and as a
+compressed container with a trained dictionary. Each file is read back and
+checked against the book, and the time to read single papers from the
+containers is measured.
+
+Usage:
+
+    python benchmarks/compressed_book.py --scale 1 --repeat 3
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.compressed import CompressedBookReader, write_compressed_book
+from chandra_bot.synth import make_fake_data
+
+
+def _best(function, repeat: int) -> float:
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def _write_raw(paper_book, path: str):
+    with open(path, "wb") as file_pointer:
+        file_pointer.write(paper_book.SerializeToString())
+
+
+def _read_raw(path: str):
+    paper_book = dm.PaperBook()
+    with open(path, "rb") as file_pointer:
+        paper_book.ParseFromString(file_pointer.read())
+    return paper_book
+
+
+def _read_compressed(path: str):
+    with CompressedBookReader(path) as reader:
+        return reader.read_paper_book()
+
+
+def _random_papers(path: str, numbers: list):
+    with CompressedBookReader(path) as reader:
+        for number in numbers:
+            reader.paper(number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--level", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+    )
+    bot = data.to_bot()
+    bot.assemble_paper_book()
+    paper_book = bot.paper_book
+    numbers = random.Random(args.seed).choices(
+        [paper.number for paper in paper_book.paper], k=args.lookups
+    )
+
+    formats = {
+        "raw": (_write_raw, _read_raw),
+        "zstd": (
+            lambda book, path: write_compressed_book(book, path, args.level, 0),
+            _read_compressed,
+        ),
+        "zstd_dictionary": (
+            lambda book, path: write_compressed_book(book, path, args.level),
+            _read_compressed,
+        ),
+    }
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (write, read) in formats.items():
+            path = os.path.join(directory, name)
+            write_seconds = _best(lambda: write(paper_book, path), args.repeat)
+            read_seconds = _best(lambda: read(path), args.repeat)
+            size = os.path.getsize(path)
+            result = {
+                "format": name,
+                "bytes": size,
+                "write_seconds": write_seconds,
+                "read_seconds": read_seconds,
+                "write_mb_per_second": paper_book.ByteSize() / write_seconds / 1e6,
+                "read_mb_per_second": paper_book.ByteSize() / read_seconds / 1e6,
+                "identical": read(path) == paper_book,
+            }
+            if name != "raw":
+                result["compression_ratio"] = paper_book.ByteSize() / size
+                result["paper_lookup_microseconds"] = (
+                    _best(lambda: _random_papers(path, numbers), args.repeat)
+                    / args.lookups
+                    * 1e6
+                )
+            results.append(result)
+
+    print(
+        json.dumps(
+            {
+                "papers": len(paper_book.paper),
+                "reviews": len(data.review_df),
+                "book_bytes": paper_book.ByteSize(),
+                "formats": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Fixtures for the ChandraBot benchmark suite.
+
+The suite generates synthetic datasets (see chandra_bot.synth) that are
+whole multiples of the size of examples/fake_paper_series.csv, then times each
+public ChandraBot method with pytest-benchmark and records peak traced
+memory in each benchmark's extra_info. See benchmarks/README.md.
+"""
+import os
+import tracemalloc
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.synth import make_fake_data
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("chandra-bot benchmarks")
+    group.addoption(
+        "--bench-scale",
+        default="1",
+        help="comma-separated multiples of fake_paper_series.csv to benchmark, "
+        "e.g. 1,10,100 (default: 1)",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=1,
+        help="timed rounds per benchmark (default: 1)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = [int(s) for s in metafunc.config.getoption("bench_scale").split(",")]
+        metafunc.parametrize(
+            "scale", scales, ids=[f"{s}x" for s in scales], scope="session"
+        )
+
+
+def make_scaled_dataset(scale: int, output_dir: str, seed: int = 0) -> dict:
+    """
+    Generate a dataset scale times the size of examples/fake_paper_series.csv
+    (200 papers a year from 2000 to 2020 by 500 humans) and write it as CSV.
+
+    args:
+        scale: multiple of the example data size
+        output_dir: directory for the paper, review, and human CSV files
+        seed: random seed for the synthetic data
+
+    returns: a dictionary of paper_file, review_file, and human_file paths
+    """
+    data = make_fake_data(
+        number_humans=500 * scale, papers_per_year=200 * scale, seed=seed
+    )
+
+    return data.write_csv(output_dir)
+
+
+@pytest.fixture(scope="session")
+def dataset(scale, tmp_path_factory):
+    """
+    Paths to the paper, review, human, and assembled book files at a scale.
+    """
+    output_dir = str(tmp_path_factory.mktemp(f"scale_{scale}x"))
+    files = make_scaled_dataset(scale, output_dir)
+
+    bot = cbot.create_bot(**files)
+    bot.assemble_paper_book(bulk=True)
+    files["book_file"] = os.path.join(output_dir, "book.bin")
+    bot.write_paper_book(output_file=files["book_file"])
+
+    return files
+
+
+@pytest.fixture(scope="session")
+def warm_start_file(dataset, tmp_path_factory):
+    """
+    A warm-start snapshot of a bot over the CSV DataFrames and the
+    assembled book.
+    """
+    bot = cbot.create_bot(
+        paper_file=dataset["paper_file"],
+        review_file=dataset["review_file"],
+        human_file=dataset["human_file"],
+    )
+    bot.assemble_paper_book(bulk=True)
+    output_file = str(tmp_path_factory.mktemp("warm_start") / "bot.cbw")
+    bot.write_warm_start(output_file)
+
+    return output_file
+
+
+@pytest.fixture
+def book_bot(dataset):
+    """
+    A function returning a fresh bot over the assembled book, without
+    DataFrames.
+    """
+
+    def _book_bot():
+        paper_book = dm.PaperBook()
+        with open(dataset["book_file"], "rb") as file_pointer:
+            paper_book.ParseFromString(file_pointer.read())
+        return cbot(input_paper_book=paper_book)
+
+    return _book_bot
+
+
+@pytest.fixture
+def csv_bot(dataset):
+    """
+    A function returning a fresh bot over the CSV DataFrames, without an
+    assembled book.
+    """
+
+    def _csv_bot():
+        return cbot.create_bot(
+            paper_file=dataset["paper_file"],
+            review_file=dataset["review_file"],
+            human_file=dataset["human_file"],
+        )
+
+    return _csv_bot
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """
+    Time a target with pytest-benchmark and record its peak traced memory.
+
+    The returned function takes the target, which is called with the
+    positional arguments returned by setup, and a setup function that is
+    re-run, untimed, before every round. Peak memory is measured in one
+    extra untimed round so tracemalloc does not distort the timings.
+    """
+    rounds = request.config.getoption("bench_rounds")
+
+    def _measure(target, setup=lambda: ()):
+        args = setup()
+        tracemalloc.start()
+        try:
+            target(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_bytes"] = peak
+
+        return benchmark.pedantic(
+            target, setup=lambda: (setup(), {}), rounds=rounds, iterations=1
+        )
+
+    return _measure
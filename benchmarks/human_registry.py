@@ -0,0 +1,112 @@
+"""
+Compare PaperBooks with embedded humans against books with a human registry.
+
+A synthetic dataset (see chandra_bot.synth) is assembled in both schema
+modes. For each mode the serialized size, the bulk assembly time, the time
+to serialize and parse the book, and the time of make_dataframe("human")
+are reported, along with the time of the migrations between the modes.
+
+Usage:
+
+    python benchmarks/human_registry.py --scale 1 --repeat 3
+"""
+import argparse
+import json
+import time
+
+from chandra_bot import ChandraBot
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.registry import deduplicate_humans, embed_humans
+from chandra_bot.synth import make_fake_data
+
+
+def _best(function, repeat: int):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def _assemble(data, human_registry: bool) -> ChandraBot:
+    bot = data.to_bot()
+    bot.assemble_paper_book(bulk=True, human_registry=human_registry)
+    return bot
+
+
+def _parse(data: bytes) -> dm.PaperBook:
+    paper_book = dm.PaperBook()
+    paper_book.ParseFromString(data)
+    return paper_book
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+    )
+
+    results = []
+    books = {}
+    for human_registry in [False, True]:
+        assemble_seconds, bot = _best(
+            lambda: _assemble(data, human_registry), args.repeat
+        )
+        serialize_seconds, serialized = _best(
+            bot.paper_book.SerializeToString, args.repeat
+        )
+        parse_seconds, _ = _best(lambda: _parse(serialized), args.repeat)
+        human_seconds, human_df = _best(
+            lambda: bot.make_dataframe("human"), args.repeat
+        )
+        books[human_registry] = bot.paper_book
+        results.append(
+            {
+                "human_registry": human_registry,
+                "bytes": len(serialized),
+                "humans": len(human_df),
+                "assemble_seconds": assemble_seconds,
+                "serialize_seconds": serialize_seconds,
+                "parse_seconds": parse_seconds,
+                "make_human_dataframe_seconds": human_seconds,
+            }
+        )
+
+    deduplicate_seconds, deduplicated = _best(
+        lambda: deduplicate_humans(books[False]), args.repeat
+    )
+    embed_seconds, embedded = _best(lambda: embed_humans(books[True]), args.repeat)
+
+    print(
+        json.dumps(
+            {
+                "papers": len(data.paper_df),
+                "reviews": len(data.review_df),
+                "modes": results,
+                "size_ratio": results[1]["bytes"] / results[0]["bytes"],
+                "deduplicate_seconds": deduplicate_seconds,
+                "embed_seconds": embed_seconds,
+                "deduplicate_matches_assembly": deduplicated == books[True],
+                "embed_round_trip": deduplicate_humans(embedded) == books[True],
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measure the speedup of process-pool PaperBook assembly over serial assembly.
+
+A synthetic dataset (see chandra_bot.synth) is assembled serially and then
+with each worker count. Every parallel book is checked to be byte-identical
+to the serial one. Speedup is bounded by the number of cores, which is
+reported alongside the timings.
+
+Usage:
+
+    python benchmarks/parallel_assembly.py --scale 10 --workers 1,2,4,8
+"""
+import argparse
+import json
+import os
+import time
+
+from chandra_bot.synth import make_fake_data
+
+
+def _assemble(data, bulk: bool, workers: int):
+    bot = data.to_bot()
+    start = time.perf_counter()
+    bot.assemble_paper_book(bulk=bulk, workers=workers)
+    return time.perf_counter() - start, bot.paper_book.SerializeToString()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--bulk", action="store_true", help="use bulk assembly")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+    )
+
+    serial_seconds, serial_book = min(
+        (_assemble(data, args.bulk, 1) for _ in range(args.repeat)),
+        key=lambda result: result[0],
+    )
+    results = []
+    for workers in [int(w) for w in args.workers.split(",")]:
+        seconds, book = min(
+            (_assemble(data, args.bulk, workers) for _ in range(args.repeat)),
+            key=lambda result: result[0],
+        )
+        results.append(
+            {
+                "workers": workers,
+                "seconds": seconds,
+                "speedup": serial_seconds / seconds,
+                "identical": book == serial_book,
+            }
+        )
+
+    print(
+        json.dumps(
+            {
+                "cpu_count": os.cpu_count(),
+                "papers": len(data.paper_df),
+                "reviews": len(data.review_df),
+                "bulk": args.bulk,
+                "serial_seconds": serial_seconds,
+                "parallel": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Compare PaperBook assembly and serialization throughput across protobuf
+backends (pure Python, cpp, and upb), using both the attribute-setter and
+bulk assembly modes.
+
+Each backend runs in its own interpreter, because the backend is fixed when
+google.protobuf is first imported. Backends that are not available in the
+installed protobuf release are reported as such.
+
+Usage:
+
+    python benchmarks/protobuf_backend.py --paper-file examples/small_fake_paper_series.csv \
+        --review-file examples/small_fake_review_series.csv \
+        --human-file examples/small_fake_human.csv
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+BACKENDS = ["python", "cpp", "upb"]
+
+example_dir = os.path.join(os.path.dirname(__file__), os.pardir, "examples")
+
+
+def _time(function, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def worker(args) -> dict:
+    from chandra_bot import ChandraBot as cbot
+    from chandra_bot import data_model_pb2 as dm
+
+    backend = cbot.protobuf_backend()
+    if backend != args.backend:
+        return {"backend": args.backend, "available": False, "active": backend}
+
+    def assemble(bulk: bool):
+        bot = cbot.create_bot(
+            paper_file=args.paper_file,
+            review_file=args.review_file,
+            human_file=args.human_file,
+        )
+        start = time.perf_counter()
+        bot.assemble_paper_book(bulk=bulk)
+        return time.perf_counter() - start, bot
+
+    setter_seconds = min(assemble(False)[0] for _ in range(args.repeat))
+    bulk_seconds, bot = assemble(True)
+    for _ in range(args.repeat - 1):
+        bulk_seconds = min(bulk_seconds, assemble(True)[0])
+
+    data = bot.paper_book.SerializeToString()
+    serialize_seconds = _time(bot.paper_book.SerializeToString, args.repeat)
+    parse_seconds = _time(lambda: dm.PaperBook().ParseFromString(data), args.repeat)
+
+    papers = len(bot.paper_book.paper)
+    megabytes = len(data) / 1e6
+    return {
+        "backend": backend,
+        "available": True,
+        "papers": papers,
+        "book_megabytes": megabytes,
+        "assemble_seconds": {"setter": setter_seconds, "bulk": bulk_seconds},
+        "assemble_papers_per_second": {
+            "setter": papers / setter_seconds,
+            "bulk": papers / bulk_seconds,
+        },
+        "serialize_megabytes_per_second": megabytes / serialize_seconds,
+        "parse_megabytes_per_second": megabytes / parse_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--paper-file",
+        default=os.path.join(example_dir, "small_fake_paper_series.csv"),
+    )
+    parser.add_argument(
+        "--review-file",
+        default=os.path.join(example_dir, "small_fake_review_series.csv"),
+    )
+    parser.add_argument(
+        "--human-file", default=os.path.join(example_dir, "small_fake_human.csv")
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend is not None:
+        print(json.dumps(worker(args)))
+        return
+
+    results = []
+    for backend in BACKENDS:
+        env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+        command = [sys.executable, __file__, "--backend", backend]
+        command += ["--paper-file", args.paper_file]
+        command += ["--review-file", args.review_file]
+        command += ["--human-file", args.human_file]
+        command += ["--repeat", str(args.repeat)]
+        completed = subprocess.run(command, env=env, capture_output=True, text=True)
+        if completed.returncode == 0:
+            results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        else:
+            error = completed.stderr.strip().splitlines()
+            results.append(
+                {
+                    "backend": backend,
+                    "available": False,
+                    "error": error[-1] if error else "",
+                }
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Compare the load time of yearly CSV inputs against yearly RDS inputs.
+
+A synthetic dataset (see chandra_bot.synth) is split into one paper file
+and one review file per year and written both as CSV and as RDS. Each
+route is then loaded with ChandraBot.create_bot, the RDS route with each
+thread count, and the resulting DataFrames are checked to be equal. For
+reference, the yearly RDS files are also read one at a time and appended
+to a growing DataFrame, the bind_rows pattern of the R scripts.
+
+Usage:
+
+    python benchmarks/rds_inputs.py --scale 10 --workers 1,2,4
+
+Needs pip install pyreadr.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+import pyreadr
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.inputs import read_rds
+from chandra_bot.synth import make_fake_data
+
+
+def _write_inputs(data, output_dir: str, suffix: str, write) -> dict:
+    files = {"paper_file": [], "review_file": []}
+    years = data.paper_df.set_index("paper_id")["year"]
+    review_years = data.review_df["paper_id"].map(years)
+    for year in sorted(years.unique()):
+        for key, year_df in [
+            ("paper_file", data.paper_df.loc[data.paper_df["year"] == year]),
+            ("review_file", data.review_df.loc[review_years == year]),
+        ]:
+            files[key].append(os.path.join(output_dir, f"{key}-{year}{suffix}"))
+            write(files[key][-1], year_df.reset_index(drop=True))
+    files["human_file"] = os.path.join(output_dir, "human_file" + suffix)
+    write(files["human_file"], data.human_df)
+
+    return files
+
+
+def _write_rds(output_file: str, input_df: pd.DataFrame):
+    # pyreadr writes missing strings from None, not pd.NA
+    output_df = input_df.copy()
+    for column in output_df.columns:
+        if output_df[column].dtype == object:
+            values = output_df[column]
+            output_df[column] = values.where(values.notna(), None)
+    pyreadr.write_rds(output_file, output_df)
+
+
+def _load(files: dict, workers: int):
+    start = time.perf_counter()
+    bot = cbot.create_bot(workers=workers, **files)
+    return time.perf_counter() - start, bot
+
+
+def _load_incrementally(files: dict) -> float:
+    start = time.perf_counter()
+    for key, dtypes in [
+        ("paper_file", cbot.PAPER_DICT),
+        ("review_file", cbot.REVIEW_DICT),
+    ]:
+        output_df = pd.DataFrame()
+        for input_file in files[key]:
+            output_df = pd.concat([output_df, read_rds(input_file, dtypes)])
+    read_rds(files["human_file"], cbot.HUMAN_DICT)
+    return time.perf_counter() - start
+
+
+def _equal(bot, other) -> bool:
+    for name in ["paper_df", "review_df", "human_df"]:
+        try:
+            pd.testing.assert_frame_equal(getattr(bot, name), getattr(other, name))
+        except AssertionError:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        csv_files = _write_inputs(
+            data,
+            output_dir,
+            ".csv",
+            lambda output_file, df: df.to_csv(output_file, index=False),
+        )
+        rds_files = _write_inputs(data, output_dir, ".RDS", _write_rds)
+
+        csv_seconds, csv_bot = min(
+            (_load(csv_files, 1) for _ in range(args.repeat)),
+            key=lambda result: result[0],
+        )
+        results = []
+        for workers in [int(w) for w in args.workers.split(",")]:
+            seconds, rds_bot = min(
+                (_load(rds_files, workers) for _ in range(args.repeat)),
+                key=lambda result: result[0],
+            )
+            results.append(
+                {
+                    "workers": workers,
+                    "seconds": seconds,
+                    "speedup": csv_seconds / seconds,
+                    "equal": _equal(csv_bot, rds_bot),
+                }
+            )
+        incremental_seconds = min(
+            _load_incrementally(rds_files) for _ in range(args.repeat)
+        )
+
+        sizes = {
+            suffix: sum(
+                os.path.getsize(os.path.join(output_dir, name))
+                for name in os.listdir(output_dir)
+                if name.endswith(suffix)
+            )
+            for suffix in [".csv", ".RDS"]
+        }
+
+    print(
+        json.dumps(
+            {
+                "papers": len(data.paper_df),
+                "reviews": len(data.review_df),
+                "yearly_files": len(csv_files["paper_file"]),
+                "csv_bytes": sizes[".csv"],
+                "rds_bytes": sizes[".RDS"],
+                "csv_seconds": csv_seconds,
+                "rds": results,
+                "rds_incremental_seconds": incremental_seconds,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
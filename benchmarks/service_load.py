@@ -0,0 +1,126 @@
+"""
+Measure the latency and throughput of chandra_bot.service under concurrency.
+
+A synthetic dataset (see chandra_bot.synth) is assembled into a PaperBook
+and served on a local port. Clients then send a mix of paper summary,
+reviewer summary, and conflict requests, with a fixed number in flight,
+and the p50 and p99 latency and the throughput are reported for each
+concurrency level.
+
+Usage:
+
+    python benchmarks/service_load.py --scale 1 --requests 2000 --concurrency 1,10,50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+import numpy as np
+from aiohttp import ClientSession, web
+
+from chandra_bot.service import BotService
+from chandra_bot.synth import make_fake_data
+
+
+def _paths(service: BotService, number: int, seed: int) -> list:
+    rng = random.Random(seed)
+    paper_ids = list(service.state.index.by_number)
+    hash_ids = list(service.state.index.by_reviewer)
+    paths = []
+    for _ in range(number):
+        kind = rng.random()
+        if kind < 0.5:
+            paths.append("/papers/" + rng.choice(paper_ids))
+        elif kind < 0.8:
+            paths.append("/reviewers/" + rng.choice(hash_ids))
+        else:
+            paths.append("/conflicts/" + rng.choice(paper_ids))
+    return paths
+
+
+async def _load(base_url: str, paths: list, concurrency: int) -> dict:
+    latencies = []
+    queue = list(reversed(paths))
+
+    async def client(session):
+        while queue:
+            path = queue.pop()
+            start = time.perf_counter()
+            async with session.get(base_url + path) as response:
+                await response.read()
+                assert response.status == 200, path
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    async with ClientSession() as session:
+        await asyncio.gather(*(client(session) for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "requests_per_second": len(latencies) / seconds,
+    }
+
+
+async def _run(service: BotService, args) -> list:
+    runner = web.AppRunner(service.make_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        # warm the collaboration cache and the connections
+        await _load(base_url, _paths(service, 200, args.seed + 1), 10)
+        results = []
+        for concurrency in [int(c) for c in args.concurrency.split(",")]:
+            paths = _paths(service, args.requests, args.seed)
+            results.append(await _load(base_url, paths, concurrency))
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", default="1,10,50")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+    )
+    bot = data.to_bot()
+    bot.assemble_paper_book()
+    service = BotService(bot=bot)
+
+    print(
+        json.dumps(
+            {
+                "cpu_count": os.cpu_count(),
+                "papers": len(bot.paper_book.paper),
+                "results": asyncio.run(_run(service, args)),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
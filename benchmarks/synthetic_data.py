@@ -0,0 +1,96 @@
+"""
+Time generating a synthetic dataset, writing it as CSV, and assembling it
+into a PaperBook.
+
+The default scale, 48 times the size of examples/fake_paper_series.csv, is
+about a million reviews. The CSV files are written with pyarrow, as
+SyntheticData.write_csv does when pyarrow is installed, and with
+DataFrame.to_csv for reference. The book is assembled in bulk mode, with
+and without the human registry; pass --no-book to skip it.
+
+Usage:
+
+    python benchmarks/synthetic_data.py --scale 48 --workers 1
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.synth import load_sources, make_fake_data
+
+
+def _seconds(function) -> float:
+    # the result is dropped, so that a million-review book is freed before
+    # the next one is built
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _write_pandas(data, output_dir: str):
+    for name, output_df in [
+        ("paper", data.paper_df),
+        ("review", data.review_df),
+        ("human", data.human_df),
+    ]:
+        output_df.to_csv(os.path.join(output_dir, f"pandas_{name}.csv"), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=48,
+        help="multiple of the size of examples/fake_paper_series.csv",
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-book", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sources = load_sources()
+    start = time.perf_counter()
+    data = make_fake_data(
+        number_humans=500 * args.scale,
+        papers_per_year=200 * args.scale,
+        seed=args.seed,
+        sources=sources,
+    )
+    generate_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        csv_seconds = _seconds(lambda: data.write_csv(output_dir))
+        pandas_csv_seconds = _seconds(lambda: _write_pandas(data, output_dir))
+        csv_bytes = sum(
+            os.path.getsize(os.path.join(output_dir, name))
+            for name in os.listdir(output_dir)
+            if not name.startswith("pandas_")
+        )
+
+    results = {
+        "protobuf_backend": cbot.protobuf_backend(),
+        "papers": len(data.paper_df),
+        "reviews": len(data.review_df),
+        "humans": len(data.human_df),
+        "generate_seconds": generate_seconds,
+        "write_csv_seconds": csv_seconds,
+        "pandas_to_csv_seconds": pandas_csv_seconds,
+        "csv_bytes": csv_bytes,
+    }
+    if not args.no_book:
+        for name, human_registry in [("book", False), ("registry_book", True)]:
+            results[f"{name}_seconds"] = _seconds(
+                lambda: data.to_paper_book(
+                    workers=args.workers, human_registry=human_registry
+                )
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+def test_create_bot(measure, dataset):
+    measure(
+        lambda: cbot.create_bot(
+            paper_file=dataset["paper_file"],
+            review_file=dataset["review_file"],
+            human_file=dataset["human_file"],
+        )
+    )
+
+
+@pytest.mark.parametrize("bulk", [False, True], ids=["setter", "bulk"])
+def test_assemble_paper_book(measure, csv_bot, bulk):
+    measure(lambda bot: bot.assemble_paper_book(bulk=bulk), lambda: (csv_bot(),))
+
+
+def test_compute_normalized_scores(measure, book_bot):
+    measure(lambda bot: bot.compute_normalized_scores(), lambda: (book_bot(),))
+
+
+def test_compute_normalized_scores_dataframe(measure, csv_bot):
+    measure(
+        lambda bot: bot.compute_normalized_scores(dataframe_only=True),
+        lambda: (csv_bot(),),
+    )
+
+
+@pytest.mark.parametrize("dataframe_only", [False, True], ids=["book", "dataframe"])
+def test_compute_normalized_scores_window(measure, book_bot, csv_bot, dataframe_only):
+    make_bot = csv_bot if dataframe_only else book_bot
+    measure(
+        lambda bot: bot.compute_normalized_scores(
+            dataframe_only=dataframe_only, window=3
+        ),
+        lambda: (make_bot(),),
+    )
+
+
+@pytest.mark.parametrize("dataframe_only", [False, True], ids=["book", "dataframe"])
+def test_make_reliability_tables(measure, book_bot, csv_bot, dataframe_only):
+    make_bot = csv_bot if dataframe_only else book_bot
+    measure(
+        lambda bot: bot.make_reliability_tables(dataframe_only=dataframe_only),
+        lambda: (make_bot(),),
+    )
+
+
+def test_bootstrap_paper_scores(measure, book_bot):
+    # one year is a 200 * scale paper cycle
+    measure(
+        lambda bot: bot.bootstrap_paper_scores(
+            number_resamples=10000, capacity=50, year=2020, seed=0
+        ),
+        lambda: (book_bot(),),
+    )
+
+
+def test_cluster_paper_topics(measure, book_bot):
+    pytest.importorskip("sklearn")
+    measure(
+        lambda bot: bot.cluster_paper_topics(number_topics=40, seed=0),
+        lambda: (book_bot(),),
+    )
+
+
+def test_schedule_sessions(measure, book_bot, scale):
+    # the 2020 accepted papers, about 100 * scale, in lectern sessions of
+    # eight with six in parallel, plus one poster session per slot
+    number_slots = 2 * scale + 1
+    session_df = pd.DataFrame(
+        {
+            "capacity": ([8] * 6 + [12]) * number_slots,
+            "slot": np.repeat(np.arange(number_slots), 7),
+        }
+    )
+    measure(
+        lambda bot: bot.schedule_sessions(session_df, year=2020, seed=0),
+        lambda: (book_bot(),),
+    )
+
+
+@pytest.mark.parametrize("dataframe_name", ["paper", "review", "human"])
+def test_make_dataframe(measure, book_bot, dataframe_name):
+    measure(lambda bot: bot.make_dataframe(dataframe_name), lambda: (book_bot(),))
+
+
+def test_count_former_coauthors(measure, book_bot):
+    measure(lambda bot: bot.count_former_coauthors(), lambda: (book_bot(),))
+
+
+def test_count_former_coauthors_dataframe(measure, csv_bot):
+    measure(
+        lambda bot: bot.count_former_coauthors(dataframe_only=True),
+        lambda: (csv_bot(),),
+    )
+
+
+def test_append_verified_reviewer(measure, book_bot):
+    measure(
+        lambda bot: bot.append_verified_reviewer(min_count=2), lambda: (book_bot(),)
+    )
+
+
+def test_append_verified_reviewer_dataframe(measure, csv_bot):
+    measure(
+        lambda bot: bot.append_verified_reviewer(min_count=2, dataframe_only=True),
+        lambda: (csv_bot(),),
+    )
+
+
+def test_write_paper_book(measure, book_bot, tmp_path):
+    output_file = os.path.join(tmp_path, "book.bin")
+    measure(lambda bot: bot.write_paper_book(output_file), lambda: (book_bot(),))
+
+
+def test_read_paper_book(measure, dataset):
+    measure(lambda: cbot.read_paper_book(dataset["book_file"]))
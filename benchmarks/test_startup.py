@@ -0,0 +1,39 @@
+"""
+Start-up costs of a fresh process: the import time of the package, and the
+time to the first query result when opening a paper book or a warm-start
+snapshot. Each round runs in a new interpreter, so the timings include
+interpreter start-up; the "pass" statement measures it alone.
+"""
+import subprocess
+import sys
+
+import pytest
+
+FIRST_QUERY = """
+from chandra_bot import ChandraBot
+bot = ChandraBot.{reader}({file!r})
+bot.query("papers").filter("year", "==", 2010).select("paper_id").run()
+"""
+
+
+def _run(statement: str):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["pass", "import chandra_bot", "from chandra_bot import ChandraBot"],
+    ids=["interpreter", "package", "bot"],
+)
+def test_import_time(measure, statement):
+    measure(lambda: _run(statement))
+
+
+def test_first_query_paper_book(measure, dataset):
+    statement = FIRST_QUERY.format(reader="read_paper_book", file=dataset["book_file"])
+    measure(lambda: _run(statement))
+
+
+def test_first_query_warm_start(measure, warm_start_file):
+    statement = FIRST_QUERY.format(reader="read_warm_start", file=warm_start_file)
+    measure(lambda: _run(statement))
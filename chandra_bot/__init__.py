@@ -1,7 +1,16 @@
 version = "0.0.1"
 
-from .chandra_bot import ChandraBot
-
 __all__ = [
     "ChandraBot",
 ]
+
+
+def __getattr__(name):
+    # ChandraBot is imported on first use, so that importing the package, or
+    # a submodule that does not need the bot, stays fast
+    if name == "ChandraBot":
+        from .chandra_bot import ChandraBot
+
+        globals()[name] = ChandraBot
+        return ChandraBot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
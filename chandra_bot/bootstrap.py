@@ -0,0 +1,230 @@
+"""
+Bootstrap intervals for paper scores and acceptance probabilities.
+
+A paper's mean score comes from three or four reviews, so papers near the
+acceptance cutoff could land on either side of it with a different panel.
+The bootstrap redraws each paper's reviews, with replacement, from its own
+reviews and recomputes the mean of every paper. The spread of the
+resampled means gives each paper a score interval, and applying the
+decision rule, a score threshold or a number of accepted papers, to every
+resample gives each paper an acceptance probability.
+
+With reviewer effects, each score is split into the reviewer's bias, the
+mean difference between the reviewer's scores and the other scores of the
+same papers, and the remainder. A resampled score is a remainder drawn
+from the paper plus a bias drawn from the whole panel, which also
+simulates being assigned other reviewers.
+
+Resamples are drawn in batches as (batch, reviews) index arrays, and the
+paper means of a batch are one np.add.reduceat over the reviews sorted by
+paper. Every batch has its own seed spawned from the seed of the run, so
+the result does not depend on the number of worker processes.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .lazy import np, pd
+
+BOOTSTRAP_COLUMNS = [
+    "number_of_reviews",
+    "mean_score",
+    "score_low",
+    "score_high",
+    "accept_probability",
+]
+
+
+def reviewer_biases(paper_codes: np.ndarray, reviewer_codes: np.ndarray, scores):
+    """
+    returns: the bias of the reviewer of each score, the mean of the
+        reviewer's scores minus the mean of the other scores of the same
+        papers, or 0 for reviewers who share no paper
+    """
+    paper_count = np.bincount(paper_codes)
+    paper_sum = np.bincount(paper_codes, weights=scores)
+    shared = paper_count[paper_codes] > 1
+    others = np.zeros(len(scores))
+    others[shared] = (paper_sum[paper_codes[shared]] - scores[shared]) / (
+        paper_count[paper_codes[shared]] - 1
+    )
+
+    count = np.bincount(reviewer_codes[shared], minlength=reviewer_codes.max() + 1)
+    total = np.bincount(
+        reviewer_codes[shared],
+        weights=scores[shared] - others[shared],
+        minlength=len(count),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bias = np.where(count > 0, total / count, 0.0)
+
+    return bias[reviewer_codes]
+
+
+def resample_means(
+    starts: np.ndarray,
+    counts: np.ndarray,
+    scores: np.ndarray,
+    biases: np.ndarray,
+    number_resamples: int,
+    seed,
+) -> np.ndarray:
+    """
+    Draw one batch of resamples.
+
+    args:
+        starts, counts: the first position and number of reviews of each
+            paper in scores
+        scores: the scores, sorted by paper
+        biases: the reviewer bias of each score, or None to resample the
+            scores as they are
+        number_resamples: the number of resamples in the batch
+        seed: a seed or SeedSequence for the NumPy random generator
+
+    returns: a (number_resamples, papers) float32 array of paper means
+    """
+    rng = np.random.default_rng(seed)
+    slot_counts = np.repeat(counts, counts)
+    slot_starts = np.repeat(starts, counts)
+    positions = slot_starts + rng.integers(
+        0, slot_counts, size=(number_resamples, len(scores))
+    )
+
+    if biases is None:
+        sampled = scores[positions]
+    else:
+        panel = rng.integers(0, len(biases), size=positions.shape)
+        sampled = (scores - biases)[positions] + biases[panel]
+
+    return (np.add.reduceat(sampled, starts, axis=1) / counts).astype(np.float32)
+
+
+def accept_probability(
+    means: np.ndarray, threshold: float = None, capacity: int = None
+) -> np.ndarray:
+    """
+    args:
+        means: a (resamples, papers) array of paper means
+        threshold: papers with a mean at or above it are accepted
+        capacity: the papers with the capacity highest means are accepted;
+            papers tied at the cutoff share the remaining places
+
+    returns: the share of resamples in which each paper is accepted
+    """
+    if threshold is not None:
+        return (means >= threshold).mean(axis=0)
+
+    number_papers = means.shape[1]
+    if capacity >= number_papers:
+        return np.ones(number_papers)
+    cutoff = np.partition(means, number_papers - capacity, axis=1)[
+        :, [number_papers - capacity]
+    ]
+    above = means > cutoff
+    tied = means == cutoff
+    places = (capacity - above.sum(axis=1)) / tied.sum(axis=1)
+
+    return (above + tied * places[:, None]).mean(axis=0)
+
+
+class ScoreBootstrap(object):
+    """
+    Bootstrap score intervals and acceptance probabilities of papers.
+
+    Typical usage:
+
+        bootstrap = bot.bootstrap_paper_scores(
+            number_resamples=10000, capacity=250, year=2023
+        )
+        bootstrap.paper_df.sort_values("accept_probability")
+
+    Attributes:
+        paper_df (DataFrame): BOOTSTRAP_COLUMNS indexed by paper_id, for
+            the papers with at least one score. score_low and score_high
+            bound the central confidence share of the resampled means;
+            accept_probability is missing without a decision rule.
+
+        means (ndarray): the (number_resamples, papers) float32 resampled
+            means, in the order of paper_df
+    """
+
+    def __init__(
+        self,
+        paper_ids,
+        reviewer_ids,
+        scores,
+        number_resamples: int = 1000,
+        confidence: float = 0.9,
+        threshold: float = None,
+        capacity: int = None,
+        reviewer_effects: bool = False,
+        seed: int = None,
+        workers: int = 1,
+        batch_size: int = 1000,
+    ):
+        """
+        args:
+            paper_ids: the paper_id of each review
+            reviewer_ids: the reviewer hash_id of each review
+            scores: the score of each review; reviews without one are
+                skipped
+            number_resamples: the number of resamples
+            confidence: the share of the resampled means inside the interval
+            threshold, capacity: the decision rule, see accept_probability
+            reviewer_effects: if True, also resample reviewer biases
+            seed: seed of the run
+            workers: the number of processes drawing batches
+            batch_size: the number of resamples drawn at a time
+        """
+        if threshold is not None and capacity is not None:
+            raise ValueError("give a threshold or a capacity, not both")
+
+        scores = np.asarray(scores, dtype=np.float64)
+        scored = ~np.isnan(scores)
+        paper_codes, paper_uniques = pd.factorize(np.asarray(paper_ids)[scored])
+        reviewer_codes = pd.factorize(np.asarray(reviewer_ids)[scored])[0]
+        order = np.argsort(paper_codes, kind="stable")
+        paper_codes = paper_codes[order]
+        reviewer_codes = reviewer_codes[order]
+        scores = scores[scored][order]
+
+        counts = np.bincount(paper_codes, minlength=len(paper_uniques))
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        biases = None
+        if reviewer_effects and len(scores):
+            biases = reviewer_biases(paper_codes, reviewer_codes, scores)
+
+        sizes = [
+            min(batch_size, number_resamples - start)
+            for start in range(0, number_resamples, batch_size)
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        batches = [
+            (starts, counts, scores, biases, size, batch_seed)
+            for size, batch_seed in zip(sizes, seeds)
+        ]
+        if workers > 1 and len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(resample_means, *zip(*batches)))
+        else:
+            parts = [resample_means(*batch) for batch in batches]
+        self.means = np.concatenate(parts) if parts else np.empty((0, len(counts)))
+
+        low, high = np.quantile(
+            self.means, [(1 - confidence) / 2, (1 + confidence) / 2], axis=0
+        )
+        if threshold is None and capacity is None:
+            probability = np.full(len(counts), np.nan)
+        else:
+            probability = accept_probability(self.means, threshold, capacity)
+
+        self.paper_df = pd.DataFrame(
+            {
+                "number_of_reviews": counts,
+                "mean_score": np.add.reduceat(scores, starts) / counts,
+                "score_low": low,
+                "score_high": high,
+                "accept_probability": probability,
+            },
+            index=pd.Index(np.asarray(paper_uniques), name="paper_id"),
+        )
@@ -1,14 +1,103 @@
 """
 Module docstring
 """
-from __future__ import print_function
+from __future__ import annotations, print_function
 
-import itertools
+from concurrent.futures import ProcessPoolExecutor
 
-import numpy as np
-import pandas as pd
+from google.protobuf.internal import api_implementation
 
 from . import data_model_pb2 as dm
+from .bootstrap import ScoreBootstrap
+from .changelog import (
+    BookChanges,
+    append_changes,
+    make_changes,
+    needs_compaction,
+    remove_log,
+    replay_changes,
+)
+from .compressed import CompressedBookReader, is_compressed_book, write_compressed_book
+from .index import PaperBookIndex
+from .inputs import read_input_files
+from .lazy import np, pd
+from .profiling import Profiler, profiled
+from .query import Query
+from .registry import (
+    deduplicate_humans,
+    has_human_registry,
+    make_registry,
+    reviewer_human,
+)
+from .reliability import REVIEWER_RELIABILITY_COLUMNS, ReliabilityTables
+from .rolling import (
+    aggregate_reviewer_years,
+    lookup_stats,
+    update_reviewer_years,
+    window_stats,
+)
+from .schedule import Schedule
+from .sql import SqlView
+from .summary import REVIEW_KEYS, SummaryTables
+from .text import TEXT_FIELDS, count_pattern
+from .topics import TopicModel, paper_texts
+from .warm_start import read_snapshot, write_snapshot
+
+
+class _DtypeDict(object):
+    # A class attribute built on first access, so that importing the module
+    # does not import pandas
+
+    def __init__(self, make):
+        self.make = make
+        self.value = None
+
+    def __get__(self, bot, owner) -> dict:
+        if self.value is None:
+            self.value = self.make()
+        return self.value
+
+
+def _count_papers(bot, result, arguments) -> int:
+    return len(bot.paper_book.paper)
+
+
+def _count_reviews(bot, result, arguments) -> int:
+    if arguments.get("dataframe_only"):
+        return len(bot.review_df)
+    return sum(len(paper.reviews) for paper in bot.paper_book.paper)
+
+
+def _count_texts(bot, result, arguments) -> int:
+    if TEXT_FIELDS.get(arguments["field"]) == "paper":
+        if arguments["dataframe_only"]:
+            return len(bot.paper_df)
+        return len(bot.paper_book.paper)
+    return _count_reviews(bot, result, arguments)
+
+
+def _count_dataframe_rows(bot, result, arguments) -> int:
+    bot = result if isinstance(result, ChandraBot) else bot
+    return sum(len(df) for df in bot._dataframes.values() if df is not None)
+
+
+def _class_profiler(args):
+    return ChandraBot.profiler
+
+
+def _assemble_partition(
+    paper_df: pd.DataFrame,
+    review_df: pd.DataFrame,
+    human_df: pd.DataFrame,
+    paper_author_df: pd.DataFrame,
+    bulk: bool,
+) -> bytes:
+    # runs in a worker process; returns a serialized partial PaperBook
+    bot = ChandraBot(paper_df=paper_df, review_df=review_df, human_df=human_df)
+    bot.paper_author_df = paper_author_df
+    bot.assemble_paper_book(bulk=bulk)
+
+    return bot.paper_book.SerializeToString()
 
 
 class ChandraBot(object):
@@ -50,42 +139,89 @@ class ChandraBot(object):
            of the paper, review, and human data. See the ProtoBuf
            file for details.
 
+        paper_author_df (DataFrame): one row per paper author with
+           paper_id, author_position, and author_id columns, kept in
+           the same order as the authors in paper_book
+
+        For a bot made from a paper book, the four DataFrames above are
+        built from the book on first access and rebuilt after the book
+        changes; see invalidate_dataframes. For a bot read with
+        read_warm_start, paper_book is parsed on first access.
+
+        compact_tables (CompactTables): the opt-in integer-coded
+           schema, set by make_compact_tables
+
+        paper_index (PaperBookIndex): lookups by paper number, year,
+           author, and reviewer, set by index_paper_book
+
+        reliability_tables (ReliabilityTables): panel agreement and
+           reviewer reliability, set by make_reliability_tables
+
+        reviewer_year_df (DataFrame): the number, sum, and sum of squares
+           of each reviewer's scores per paper year, kept by the windowed
+           compute_normalized_scores; see chandra_bot.rolling
+
+        topic_model (TopicModel): the topic clusters of the papers, set by
+           cluster_paper_topics
+
+        sql_view (SqlView): the DuckDB connection used by sql, created on
+           first use
+
+        summary_tables (SummaryTables): reviewer and paper summaries kept
+           up to date by update_reviews and update_papers, set by
+           make_summary_tables
+
+        profiler (Profiler): records timing and memory statistics for
+           each public method call while set; see enable_profiling. Set
+           the class attribute to profile every bot and the static
+           constructors.
+
     """
 
-    PAPER_DICT = {
-        "paper_id": pd.StringDtype(),
-        "authors": pd.StringDtype(),
-        "author_ids": pd.StringDtype(),
-        "title": pd.StringDtype(),
-        "year": np.int32,
-        "committee_publication_decision": pd.StringDtype(),
-        "committee_presentation_decision": pd.StringDtype(),
-        "abstract": pd.StringDtype(),
-        "body": pd.StringDtype(),
-    }
-
-    REVIEW_DICT = {
-        "paper_id": pd.StringDtype(),
-        "presentation_score": np.float32,
-        "commentary_to_author": pd.StringDtype(),
-        "commentary_to_chair": pd.StringDtype(),
-        "reviewer_human_hash_id": pd.StringDtype(),
-        "presentation_recommend": pd.StringDtype(),
-        "publication_recommend": pd.StringDtype(),
-    }
-
-    HUMAN_DICT = {
-        "name": pd.StringDtype(),
-        "aliases": pd.StringDtype(),
-        "hash_id": pd.StringDtype(),
-        "current_affiliation": pd.StringDtype(),
-        "previous_affiliation": pd.StringDtype(),
-        "last_degree_affiliation": pd.StringDtype(),
-        "orcid_url": pd.StringDtype(),
-        "orcid": pd.StringDtype(),
-        "author_id": pd.StringDtype(),
-        "verified": "bool",
-    }
+    PAPER_DICT = _DtypeDict(
+        lambda: {
+            "paper_id": pd.StringDtype(),
+            "authors": pd.StringDtype(),
+            "author_ids": pd.StringDtype(),
+            "title": pd.StringDtype(),
+            "year": np.int32,
+            "committee_publication_decision": pd.StringDtype(),
+            "committee_presentation_decision": pd.StringDtype(),
+            "abstract": pd.StringDtype(),
+            "body": pd.StringDtype(),
+        }
+    )
+
+    REVIEW_DICT = _DtypeDict(
+        lambda: {
+            "paper_id": pd.StringDtype(),
+            "presentation_score": np.float32,
+            "commentary_to_author": pd.StringDtype(),
+            "commentary_to_chair": pd.StringDtype(),
+            "reviewer_human_hash_id": pd.StringDtype(),
+            "presentation_recommend": pd.StringDtype(),
+            "publication_recommend": pd.StringDtype(),
+        }
+    )
+
+    HUMAN_DICT = _DtypeDict(
+        lambda: {
+            "name": pd.StringDtype(),
+            "aliases": pd.StringDtype(),
+            "hash_id": pd.StringDtype(),
+            "current_affiliation": pd.StringDtype(),
+            "previous_affiliation": pd.StringDtype(),
+            "last_degree_affiliation": pd.StringDtype(),
+            "orcid_url": pd.StringDtype(),
+            "orcid": pd.StringDtype(),
+            "author_id": pd.StringDtype(),
+            "verified": "bool",
+        }
+    )
+
+    LAZY_DATAFRAMES = ["paper", "review", "human", "paper_author"]
+
+    profiler: Profiler = None
 
     def __init__(
         self,
@@ -97,14 +233,107 @@ class ChandraBot(object):
         """
         Constructor
         """
+        self.paper_index = None
+        self.sql_view = None
+        self.summary_tables = None
+        self.reliability_tables = None
+        self.topic_model = None
+        self.reviewer_year_df = None
+        self._human_registry = None
+        # the link table last matched to the book, and the book's (paper_id,
+        # position, hash_id) sequence at the time
+        self._paper_author_key = None
+        # DataFrames by name, and the names of those derived from the paper
+        # book, which are built on first access and dropped when it changes
+        self._dataframes = {}
+        self._lazy_dataframes = set()
+        # the serialized paper book of a warm-start snapshot, parsed on
+        # first access of paper_book
+        self._paper_book_data = None
+
         if input_paper_book is None:
             self.paper_df: pd.DataFrame = paper_df
             self.review_df: pd.DataFrame = review_df
             self.human_df: pd.DataFrame = human_df
 
             self.paper_book = dm.PaperBook()
+
+            if paper_df is not None and "author_ids" in paper_df.columns:
+                from .compact import make_paper_author_df
+
+                self.paper_author_df = make_paper_author_df(paper_df)
+            else:
+                self.paper_author_df = None
         else:
             self.paper_book: dm.PaperBook = input_paper_book
+            self._lazy_dataframes.update(ChandraBot.LAZY_DATAFRAMES)
+
+    def _get_dataframe(self, name: str) -> pd.DataFrame:
+        if name not in self._dataframes and name in self._lazy_dataframes:
+            if name == "paper_author":
+                self._dataframes[name] = self._make_paper_author_df_from_book()
+            else:
+                self._dataframes[name] = self.make_dataframe(dataframe_name=name)
+        return self._dataframes.get(name)
+
+    def _set_dataframe(self, name: str, value: pd.DataFrame, lazy: bool = False):
+        self._dataframes[name] = value
+        if lazy:
+            self._lazy_dataframes.add(name)
+        else:
+            self._lazy_dataframes.discard(name)
+
+    def materialized_dataframe(self, name: str) -> pd.DataFrame:
+        """
+        args:
+            name: "paper", "review", "human" or "paper_author"
+
+        returns: the DataFrame if it is set or already built, None otherwise.
+            Unlike the attribute, this never builds it from the paper book.
+        """
+        return self._dataframes.get(name)
+
+    def invalidate_dataframes(self) -> None:
+        """
+        Drop the DataFrames derived from the paper book, so that they are
+        rebuilt on next access. Call this after modifying the book outside
+        of the bot; the bot's own methods do so already. DataFrames that
+        were set directly are kept.
+        """
+        for name in self._lazy_dataframes:
+            self._dataframes.pop(name, None)
+
+    def _get_paper_book(self) -> dm.PaperBook:
+        if self._paper_book_data is not None:
+            paper_book = dm.PaperBook()
+            paper_book.ParseFromString(self._paper_book_data)
+            self._paper_book = paper_book
+            self._paper_book_data = None
+            if self.paper_index is not None and self.paper_index.paper_book is None:
+                self.paper_index.paper_book = paper_book
+        return self._paper_book
+
+    def _set_paper_book(self, value: dm.PaperBook):
+        self._paper_book = value
+        self._paper_book_data = None
+
+    paper_book = property(_get_paper_book, _set_paper_book)
+    paper_df = property(
+        lambda self: self._get_dataframe("paper"),
+        lambda self, value: self._set_dataframe("paper", value),
+    )
+    review_df = property(
+        lambda self: self._get_dataframe("review"),
+        lambda self, value: self._set_dataframe("review", value),
+    )
+    human_df = property(
+        lambda self: self._get_dataframe("human"),
+        lambda self, value: self._set_dataframe("human", value),
+    )
+    paper_author_df = property(
+        lambda self: self._get_dataframe("paper_author"),
+        lambda self, value: self._set_dataframe("paper_author", value),
+    )
 
     def _attribute_paper(self, paper: dm.Paper, row: list) -> None:
 
@@ -254,7 +483,201 @@ class ChandraBot(object):
 
         return
 
-    def assemble_paper_book(self):
+    @staticmethod
+    def _enum_values(series: pd.Series, values: dict, default: int) -> list:
+        return (
+            series.astype(object).str.lower().map(values).fillna(default).astype(int)
+        ).tolist()
+
+    def _assemble_paper_book_bulk(
+        self, author_rows: dict, paper_authors: pd.Series, human_registry: bool
+    ):
+        # Each distinct author and reviewer is attributed once, then copied
+        # into every paper and review.
+        authors = {}
+        for author_id, human_row in author_rows.items():
+            authors[author_id] = dm.Author()
+            self._attribute_author(authors[author_id], human_row)
+
+        reviewers = {}
+        for hash_id, human_row in self.human_df.groupby("hash_id", sort=False):
+            review = dm.Review()
+            self._attribute_reviewer(review, human_row)
+            reviewers[hash_id] = review.reviewer
+
+        review_df = self.review_df
+        if human_registry:
+            # the registry holds each person once and the papers hold stubs
+            reviewing = set(review_df["reviewer_human_hash_id"])
+            self.paper_book.humans.extend(
+                make_registry(
+                    [r.human for h, r in reviewers.items() if h in reviewing],
+                    [
+                        authors[author_id].human
+                        for author_ids in paper_authors
+                        for author_id in author_ids
+                    ],
+                )
+            )
+            authors = {
+                author_id: dm.Author(human=dm.Human(hash_id=author.human.hash_id))
+                for author_id, author in authors.items()
+            }
+            reviewers = {
+                hash_id: dm.Reviewer(
+                    human=dm.Human(hash_id=hash_id), verified=reviewer.verified
+                )
+                for hash_id, reviewer in reviewers.items()
+            }
+
+        presentation_recommend = ChandraBot._enum_values(
+            review_df["presentation_recommendation"],
+            {
+                "reject": dm.PRESENTATION_REC_REJECT,
+                "accept": dm.PRESENTATION_REC_ACCEPT,
+            },
+            dm.PRESENTATION_REC_NONE,
+        )
+        # matches the publication recommendation fallback in _attribute_review
+        publication_recommend = ChandraBot._enum_values(
+            review_df["publication_recommendation"],
+            {"reject": dm.PUBLICATION_REC_REJECT, "accept": dm.PUBLICATION_REC_ACCEPT},
+            dm.PRESENTATION_REC_NONE,
+        )
+
+        # the columns are iterated as lists, which is much faster than
+        # iterating extension arrays such as StringDtype
+        paper_reviews = {}
+        for row in zip(
+            review_df["paper_id"].tolist(),
+            review_df["presentation_score"].tolist(),
+            review_df["commentary_to_author"].astype(object).fillna("").tolist(),
+            review_df["commentary_to_chair"].astype(object).fillna("").tolist(),
+            review_df["reviewer_human_hash_id"].tolist(),
+            presentation_recommend,
+            publication_recommend,
+        ):
+            paper_reviews.setdefault(row[0], []).append(row[1:])
+
+        paper_df = self.paper_df
+        presentation_decision = ChandraBot._enum_values(
+            paper_df["committee_presentation_decision"],
+            {
+                "reject": dm.PRESENTATION_REC_REJECT,
+                "accept": dm.PRESENTATION_REC_ACCEPT,
+            },
+            dm.PRESENTATION_REC_NONE,
+        )
+        publication_decision = ChandraBot._enum_values(
+            paper_df["committee_publication_decision"],
+            {
+                "reject": dm.PUBLICATION_REC_REJECT,
+                "accept": dm.PUBLICATION_REC_ACCEPT,
+                "accept_correct": dm.PUBLICATION_REC_ACCEPT_CORRECT,
+            },
+            dm.PUBLICATION_REC_NONE,
+        )
+        if "abstract" in paper_df.columns:
+            abstracts = paper_df["abstract"].tolist()
+        else:
+            abstracts = ["Missing"] * len(paper_df)
+        if "body" in paper_df.columns:
+            bodies = paper_df["body"].astype(str).tolist()
+        else:
+            bodies = ["Missing"] * len(paper_df)
+
+        # Messages are added to the book and filled in place: a message passed
+        # to a constructor or to extend is copied, which dominates the run
+        # time with the pure Python protobuf backend.
+        for paper_id, title, year, presentation, publication, abstract, body in zip(
+            paper_df.index.tolist(),
+            paper_df["title"].tolist(),
+            paper_df["year"].tolist(),
+            presentation_decision,
+            publication_decision,
+            abstracts,
+            bodies,
+        ):
+            paper = self.paper_book.paper.add(
+                number=paper_id,
+                title=title,
+                year=int(year),
+                committee_presentation_decision=presentation,
+                committee_publication_decision=publication,
+            )
+            paper.authors.extend(authors[a] for a in paper_authors.get(paper_id, []))
+            for (
+                score,
+                to_author,
+                to_chair,
+                hash_id,
+                presentation_rec,
+                publication_rec,
+            ) in paper_reviews.get(paper_id, []):
+                review = paper.reviews.add(
+                    presentation_score=score,
+                    presentation_recommend=presentation_rec,
+                    publication_recommend=publication_rec,
+                )
+                reviewer = reviewers.get(hash_id)
+                if reviewer is not None:
+                    review.reviewer.MergeFrom(reviewer)
+                review.commentary_to_author.text = to_author
+                review.commentary_to_chair.text = to_chair
+            paper.abstract.text = abstract
+            paper.body.text = body
+
+    def _assembly_partitions(self, number_partitions: int):
+        # contiguous slices of the papers with the reviews, humans, and
+        # author links each slice needs, in paper order
+        paper_ids = self.paper_df.index
+        review_groups = self.review_df.groupby("paper_id", sort=False).indices
+        author_ids = self.human_df["author_id"].astype("Int64")
+        bounds = np.linspace(0, len(paper_ids), number_partitions + 1).astype(int)
+
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start == end:
+                continue
+            partition_ids = paper_ids[start:end]
+            review_positions = [
+                review_groups[paper_id]
+                for paper_id in partition_ids
+                if paper_id in review_groups
+            ]
+            review_df = self.review_df.iloc[
+                np.sort(np.concatenate(review_positions)) if review_positions else []
+            ]
+            if self.paper_author_df is not None:
+                link_df = self.paper_author_df.loc[
+                    self.paper_author_df["paper_id"].isin(partition_ids)
+                ]
+                partition_authors = link_df["author_id"].astype("int64")
+            else:
+                link_df = None
+                partition_authors = []
+            human_df = self.human_df.loc[
+                self.human_df["hash_id"].isin(review_df["reviewer_human_hash_id"])
+                | author_ids.isin(partition_authors).fillna(False).astype(bool)
+            ]
+            yield self.paper_df.iloc[start:end], review_df, human_df, link_df
+
+    def _assemble_paper_book_parallel(self, bulk: bool, workers: int):
+        # Protobuf repeated fields merge by concatenation, so the serialized
+        # partial books are joined in partition order and parsed once.
+        number_partitions = min(len(self.paper_df), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_assemble_partition, *partition, bulk)
+                for partition in self._assembly_partitions(number_partitions)
+            ]
+            parts = [future.result() for future in futures]
+
+        self.paper_book.MergeFromString(b"".join(parts))
+
+    @profiled(rows=_count_papers)
+    def assemble_paper_book(
+        self, bulk: bool = False, workers: int = 1, human_registry: bool = False
+    ):
         """
         Assemble the input databases into the serialized data
         object defined in the protobuffer. Calling this method
@@ -262,22 +685,64 @@ class ChandraBot(object):
         data objects rather than via DataFrames.
 
         args:
-           None
+           bulk: if True, attribute each author and reviewer once and
+              copy them into Papers added to the book and filled in place,
+              instead of attributing every row. The resulting book is the
+              same; bulk assembly is much cheaper on every protobuf
+              backend (see protobuf_backend), but the pure Python backend
+              still builds each message in Python.
+           workers: if greater than 1, split the papers into contiguous
+              partitions and assemble them in a pool of this many
+              processes. The partial books are merged in paper order, so
+              the result is the same as a serial assembly.
+           human_registry: if True, store each person once in
+              paper_book.humans and only their hash_id in each Author and
+              Reviewer; see chandra_bot.registry. Bulk assembly builds the
+              registry directly; the other modes convert the book after
+              assembling it.
         """
+        human_author_df = self.human_df.loc[self.human_df["author_id"].notna()]
+        author_rows = {
+            int(author_id): human_row
+            for author_id, human_row in human_author_df.groupby(
+                human_author_df["author_id"].astype("int64"), sort=False
+            )
+        }
+
+        if self.paper_author_df is not None:
+            link_df = self.paper_author_df.loc[
+                self.paper_author_df["author_id"].isin(author_rows.keys())
+            ].copy()
+            link_df["author_position"] = (
+                link_df.groupby("paper_id", sort=False).cumcount().astype(np.int32)
+            )
+            self.paper_author_df = link_df.reset_index(drop=True)
+            paper_authors = self.paper_author_df.groupby("paper_id", sort=False)[
+                "author_id"
+            ].agg(list)
+        else:
+            paper_authors = pd.Series(dtype=object)
+
+        if workers > 1 and len(self.paper_df) > 1:
+            self._assemble_paper_book_parallel(bulk, workers)
+        elif bulk:
+            self._assemble_paper_book_bulk(author_rows, paper_authors, human_registry)
+            return
+        else:
+            self._assemble_paper_book_serial(author_rows, paper_authors)
+
+        if human_registry:
+            self.paper_book = deduplicate_humans(self.paper_book)
+
+    def _assemble_paper_book_serial(self, author_rows: dict, paper_authors: pd.Series):
         for paper_id in self.paper_df.index:
             paper = self.paper_book.paper.add()
             paper.number = paper_id
             paper_row = self.paper_df.loc[paper_id]
             self._attribute_paper(paper, paper_row)
 
-            if "author_ids" in self.paper_df.columns:
-                if not pd.isnull(paper_row.author_ids):
-                    for author_id in paper_row.author_ids.split(","):
-                        if self.human_df["author_id"].eq(author_id).any():
-                            human_row = self.human_df.loc[
-                                self.human_df["author_id"] == author_id
-                            ]
-                            self._attribute_author(paper.authors.add(), human_row)
+            for author_id in paper_authors.get(paper_id, []):
+                self._attribute_author(paper.authors.add(), author_rows[author_id])
 
             paper_review_df = self.review_df.loc[self.review_df["paper_id"] == paper_id]
             paper_review_df.set_index("reviewer_human_hash_id")
@@ -290,118 +755,363 @@ class ChandraBot(object):
                 self._attribute_review(review, review_row)
                 self._attribute_reviewer(review, human_row)
 
+    def resolve_human(self, human: dm.Human) -> dm.Human:
+        """
+        Look up the full Human for the Human of an Author or Reviewer. In a
+        book with a human registry these hold only a hash_id; in other
+        books they are returned as they are.
+
+        returns: the registry entry with the same hash_id, or human
+        """
+        humans = self.paper_book.humans
+        if not has_human_registry(self.paper_book):
+            return human
+        if self._human_registry is None or self._human_registry[0] != (
+            id(self.paper_book),
+            len(humans),
+        ):
+            self._human_registry = (
+                (id(self.paper_book), len(humans)),
+                {h.hash_id: h for h in humans},
+            )
+
+        return self._human_registry[1].get(human.hash_id, human)
+
     @staticmethod
-    def create_bot(paper_file: str, review_file: str, human_file: str):
+    def protobuf_backend() -> str:
+        """
+        Report which protobuf runtime backs the data model messages. Set the
+        PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION environment variable before
+        importing chandra_bot to choose a different backend.
+
+        returns: "upb", "cpp", or "python"
+        """
+        return api_implementation.Type()
+
+    def enable_profiling(
+        self, log_file: str = None, trace_memory: bool = True
+    ) -> Profiler:
+        """
+        Record wall time, CPU time, rows processed, and peak allocated memory
+        for every public method called on this bot.
+
+        args:
+            log_file: optional JSON-lines file to append one record per call
+            trace_memory: measure peak memory with tracemalloc, which slows
+                the profiled calls down
+
+        returns: the Profiler, also stored in the profiler attribute
+        """
+        self.profiler = Profiler(log_file=log_file, trace_memory=trace_memory)
+
+        return self.profiler
+
+    def disable_profiling(self) -> Profiler:
+        """
+        Stop profiling this bot.
+
+        returns: the Profiler that was attached, or None
+        """
+        profiler = self.profiler
+        self.profiler = None
+
+        return profiler
+
+    @staticmethod
+    @profiled(
+        rows=lambda bot, result, arguments: len(result.review_df),
+        get_profiler=_class_profiler,
+    )
+    def create_bot(paper_file, review_file, human_file, workers: int = 1):
         """
         Create a ChandraBot object from separate paper, review, and
-        human CSV files.
+        human CSV or RDS files.
 
         args:
-            paper_file: input CSV file consistent with the PAPER_DICT
-                definition
-            review_file: input CSV file consistent with the REVIEW_DICT
-                definition
-            human_file: input CSV file consistent wit the HUMAN_DICT
-               definition
+            paper_file: input CSV or RDS file consistent with the
+                PAPER_DICT definition, or a list of them, e.g. one per year
+            review_file: input CSV or RDS file consistent with the
+                REVIEW_DICT definition, or a list of them
+            human_file: input CSV or RDS file consistent wit the HUMAN_DICT
+               definition, or a list of them
+            workers: number of threads reading the files of each list;
+                see chandra_bot.inputs. RDS files require pyreadr.
 
         returns: a Chandra Bot example
         """
 
-        paper_df = pd.read_csv(
-            paper_file, dtype=ChandraBot.PAPER_DICT, index_col="paper_id"
+        paper_df = read_input_files(
+            paper_file, ChandraBot.PAPER_DICT, index_col="paper_id", workers=workers
+        )
+        review_df = read_input_files(
+            review_file, ChandraBot.REVIEW_DICT, workers=workers
         )
-        review_df = pd.read_csv(review_file, dtype=ChandraBot.REVIEW_DICT)
-        human_df = pd.read_csv(human_file, dtype=ChandraBot.HUMAN_DICT)
+        human_df = read_input_files(human_file, ChandraBot.HUMAN_DICT, workers=workers)
 
         bot = ChandraBot(paper_df=paper_df, review_df=review_df, human_df=human_df)
 
         return bot
 
     @staticmethod
+    @profiled(
+        rows=lambda bot, result, arguments: len(result.paper_book.paper),
+        get_profiler=_class_profiler,
+    )
     def read_paper_book(input_file: str):
         """
-        read_paper_book
+        Read a paper book snapshot and replay its change log, if any. See
+        write_paper_book_changes.
         """
         paper_book = dm.PaperBook()
-        try:
-            with open(input_file, "rb") as file_pointer:
-                paper_book.ParseFromString(file_pointer.read())
-        except IOError:
-            print(input_file + ": File not found.")
+        if is_compressed_book(input_file):
+            with CompressedBookReader(input_file) as reader:
+                paper_book = reader.read_paper_book()
+        else:
+            try:
+                with open(input_file, "rb") as file_pointer:
+                    paper_book.ParseFromString(file_pointer.read())
+            except IOError:
+                print(input_file + ": File not found.")
+        replay_changes(input_file, paper_book)
+
+        # the DataFrames are built from the book on first access
+        return ChandraBot(input_paper_book=paper_book)
+
+    @profiled(rows=_count_papers)
+    def write_paper_book(self, output_file: str, compress: bool = False):
+        """
+        Write the whole paper book as a snapshot. Any change log of the file
+        is removed, so this also compacts a snapshot and its log.
 
-        bot = ChandraBot(input_paper_book=paper_book)
-        bot.paper_df = bot.make_dataframe(dataframe_name="paper")
-        bot.review_df = bot.make_dataframe(dataframe_name="review")
-        bot.human_df = bot.make_dataframe(dataframe_name="human")
+        args:
+            output_file: the paper book file
+            compress: if True, write a container of zstd-compressed papers
+                that read_paper_book also reads; see chandra_bot.compressed.
+                Requires zstandard.
+        """
+        if compress:
+            write_compressed_book(self.paper_book, output_file)
+        else:
+            with open(output_file, "wb") as file_pointer:
+                file_pointer.write(self.paper_book.SerializeToString())
+        remove_log(output_file)
+
+    @profiled(
+        rows=lambda bot, result, arguments: len(arguments["papers"] or [])
+        + len(arguments["reviews"] or [])
+    )
+    def write_paper_book_changes(
+        self,
+        output_file: str,
+        papers: list = None,
+        reviews: list = None,
+        max_log_ratio: float = 0.5,
+    ):
+        """
+        Add or replace papers and reviews in the paper book and append them
+        to the change log of output_file, which must hold this book. Papers
+        are keyed by number and reviews by paper number and reviewer
+        hash_id. When the log grows larger than max_log_ratio times the
+        snapshot, a fresh snapshot is written instead. The DataFrames are
+        not updated; rebuild them with make_dataframe.
 
-        return bot
+        args:
+            output_file: the paper book file
+            papers: added or changed Paper messages
+            reviews: (paper number, Review message) pairs
+            max_log_ratio: log to snapshot size ratio that triggers
+                compaction
+
+        returns: True if the book was compacted
+        """
+        changes = make_changes(papers, reviews)
+        book_changes = BookChanges(self.paper_book)
+        for change in changes:
+            book_changes.apply(change)
+        self.paper_index = None
+        if papers:
+            self._lazy_dataframes.add("paper_author")
+        self.invalidate_dataframes()
+
+        append_changes(output_file, changes)
+        if needs_compaction(output_file, max_log_ratio):
+            self.write_paper_book(output_file, is_compressed_book(output_file))
+            return True
+        return False
+
+    @profiled(rows=_count_dataframe_rows)
+    def write_warm_start(self, output_file: str) -> int:
+        """
+        Write a warm-start snapshot of the bot. The DataFrames derived from
+        the paper book and the index are built first and stored with the
+        book and any summary tables, so that a bot read back with
+        read_warm_start rebuilds none of them. See chandra_bot.warm_start.
+
+        args:
+            output_file: the snapshot file
+
+        returns: the number of bytes written
+        """
+        for name in list(self._lazy_dataframes):
+            self._get_dataframe(name)
+        if self._paper_book_data is None:
+            self.index_paper_book()
 
-    def write_paper_book(self, output_file: str):
+        return write_snapshot(self, output_file)
+
+    @staticmethod
+    @profiled(rows=_count_dataframe_rows, get_profiler=_class_profiler)
+    def read_warm_start(input_file: str, memory_map: bool = True):
         """
-        write_paper_book
+        Read a warm-start snapshot written by write_warm_start. The paper
+        book is parsed on first use, so opening a snapshot and querying
+        its DataFrames does not parse the book.
+
+        args:
+            input_file: the snapshot file
+            memory_map: if True, the DataFrame arrays and the book are
+                memory-mapped copy-on-write instead of read
         """
-        with open(output_file, "wb") as file_pointer:
-            file_pointer.write(self.paper_book.SerializeToString())
+        bot = ChandraBot()
+        read_snapshot(bot, input_file, memory_map)
+
+        return bot
 
     def _compute_normalized_scores(self, min_number_reviews: int):
-        scores_df = pd.DataFrame()
-        for paper in self.paper_book.paper:
-            for review in paper.reviews:
-                row_series = pd.Series(
-                    {
-                        "paper_id": paper.number,
-                        "reviewer_id": review.reviewer.human.hash_id,
-                        "score": review.presentation_score,
-                    }
-                )
-                row_df = pd.DataFrame([row_series])
-                scores_df = pd.concat([scores_df, row_df], ignore_index=True)
+        index = self.index_paper_book()
+        papers = self.paper_book.paper
 
-        mean_df = (
-            scores_df.groupby("reviewer_id")
-            .mean(numeric_only=True)[["score"]]
-            .rename(columns={"score": "mean"})
-        )
-        std_df = (
-            scores_df.groupby("reviewer_id")
-            .std(numeric_only=True)[["score"]]
-            .rename(columns={"score": "std"})
-        )
-        count_df = (
-            scores_df.groupby("reviewer_id")
-            .count()[["score"]]
-            .rename(columns={"score": "count"})
-        )
-        normalized_df = mean_df.join(std_df, on="reviewer_id").join(
-            count_df, on="reviewer_id"
+        # only the first review by each reviewer is updated
+        for positions in index.by_reviewer.values():
+            scores = np.array(
+                [papers[p].reviews[r].presentation_score for p, r in positions]
+            )
+            mean = scores.mean()
+            std = scores.std(ddof=1) if len(scores) > 1 else np.nan
+
+            paper_position, review_position = positions[0]
+            review = papers[paper_position].reviews[review_position]
+            review.reviewer.mean_present_score = mean
+            review.reviewer.std_dev_present_score = std
+            review.reviewer.number_of_reviews = len(scores)
+
+            if len(scores) >= min_number_reviews:
+                review.normalized_present_score = (
+                    review.presentation_score - mean
+                ) / std
+            else:
+                review.ClearField("normalized_present_score")
+        self.invalidate_dataframes()
+
+    def _review_years(self, review_df: pd.DataFrame) -> pd.Series:
+        paper_df = self.paper_df
+        if "paper_id" in paper_df.columns:
+            paper_df = paper_df.set_index("paper_id")
+        return review_df["paper_id"].map(paper_df["year"])
+
+    def _compute_windowed_scores(
+        self, min_number_reviews: int, dataframe_only: bool, window: int, years
+    ):
+        if dataframe_only:
+            review_df = self.review_df.copy()
+            review_years = self._review_years(review_df)
+            if years is None:
+                mask = review_years.notna().to_numpy()
+            else:
+                mask = review_years.isin(years).to_numpy()
+            hash_ids = review_df["reviewer_human_hash_id"].to_numpy(object)[mask]
+            scores = review_df["presentation_score"].to_numpy(np.float64)[mask]
+            review_years = review_years.to_numpy()[mask]
+        else:
+            if years is None:
+                papers = self.paper_book.paper
+            else:
+                index = self.index_paper_book()
+                papers = [
+                    paper for year in years for paper in index.papers_in_year(year)
+                ]
+            reviews = [(paper, review) for paper in papers for review in paper.reviews]
+            hash_ids = [review.reviewer.human.hash_id for _, review in reviews]
+            scores = [review.presentation_score for _, review in reviews]
+            review_years = [paper.year for paper, _ in reviews]
+
+        slice_df = aggregate_reviewer_years(hash_ids, review_years, scores)
+        if years is None:
+            self.reviewer_year_df = slice_df.sort_index()
+        else:
+            self.reviewer_year_df = update_reviewer_years(
+                self.reviewer_year_df, slice_df, years
+            )
+
+        stats_df = lookup_stats(
+            window_stats(self.reviewer_year_df, window), hash_ids, review_years
         )
+        mean = stats_df["mean_present_score"].to_numpy(np.float64)
+        std = stats_df["std_dev_present_score"].to_numpy(np.float64)
+        count = stats_df["number_of_reviews"].fillna(0).to_numpy(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(
+                count >= min_number_reviews, (np.asarray(scores) - mean) / std, np.nan
+            )
 
-        matched_reviewer = []
-        for paper in self.paper_book.paper:
-            for review in paper.reviews:
-                hash_id = review.reviewer.human.hash_id
-                if hash_id not in matched_reviewer:
-                    matched_reviewer.append(hash_id)
-                    if hash_id in normalized_df.index:
-                        row = normalized_df.loc[hash_id]
-                        review.reviewer.mean_present_score = row["mean"]
-                        review.reviewer.std_dev_present_score = row["std"]
-                        review.reviewer.number_of_reviews = int(row["count"])
-
-                        if row["count"] >= min_number_reviews:
-                            review.normalized_present_score = (
-                                review.presentation_score - row["mean"]
-                            ) / row["std"]
-                        else:
-                            review.normalized_present_score = None
+        if dataframe_only:
+            for column, values in [
+                ("mean_present_score", mean),
+                ("std_dev_present_score", std),
+                ("number_of_reviews", count),
+                ("normalized_present_score", normalized),
+            ]:
+                if column in review_df.columns:
+                    column_values = review_df[column].to_numpy(np.float64, copy=True)
+                else:
+                    column_values = np.full(len(review_df), np.nan)
+                column_values[mask] = values
+                review_df[column] = column_values
+            self.review_df = review_df
+        else:
+            for (_, review), row in zip(
+                reviews, zip(mean.tolist(), std.tolist(), count.tolist(), normalized)
+            ):
+                review.reviewer.mean_present_score = row[0]
+                review.reviewer.std_dev_present_score = row[1]
+                review.reviewer.number_of_reviews = row[2]
+                if np.isnan(row[3]):
+                    review.ClearField("normalized_present_score")
+                else:
+                    review.normalized_present_score = row[3]
+            self.invalidate_dataframes()
 
+    @profiled(rows=_count_reviews)
     def compute_normalized_scores(
-        self, min_number_reviews: int = 10, dataframe_only: bool = False
+        self,
+        min_number_reviews: int = 10,
+        dataframe_only: bool = False,
+        window: int = None,
+        years: list = None,
     ):
         """
         compute_normalized_scores
+
+        args:
+            min_number_reviews: reviewers with fewer scores get no normalized
+                score; with window, fewer scores in the window. Only the
+                protobuf and windowed modes apply it.
+            dataframe_only: if True, add the columns to review_df instead
+                of setting the fields of the paper book
+            window: if set, normalize each review against the reviewer's
+                scores in the window paper years up to and including the
+                year of its paper, rather than all of them, and set the
+                reviewer statistics of every review. See
+                chandra_bot.rolling.
+            years: with window, only aggregate the scores and normalize the
+                reviews of these years, e.g. the year of a new review
+                cycle; reviews of other years are left as they are
         """
-        if dataframe_only:
+        if window is not None:
+            self._compute_windowed_scores(
+                min_number_reviews, dataframe_only, window, years
+            )
+        elif dataframe_only:
             temp_df = self.review_df.copy()
             mean_df = (
                 temp_df.groupby("reviewer_human_hash_id")
@@ -437,6 +1147,7 @@ class ChandraBot(object):
         else:
             self._compute_normalized_scores(min_number_reviews)
 
+    @profiled(rows=lambda bot, result, arguments: len(result))
     def make_dataframe(self, dataframe_name: str):
         """
         make_dataframe
@@ -444,23 +1155,20 @@ class ChandraBot(object):
         output_df = pd.DataFrame()
 
         if dataframe_name == "paper":
-            author_id_df = self._make_author_id_df()
+            self._sync_paper_author_df()
+            author_ids = (
+                self.paper_author_df.astype({"author_id": str})
+                .groupby("paper_id", sort=False)["author_id"]
+                .agg(",".join)
+            )
 
             for paper in self.paper_book.paper:
                 authors = []
-                author_ids = []
                 for author in paper.authors:
-                    authors.append(author.human.name)
-                    author_ids.append(
-                        str(
-                            author_id_df.loc[
-                                author_id_df["hash_id"] == author.human.hash_id
-                            ]["author_id"].values[0]
-                        )
-                    )
+                    authors.append(self.resolve_human(author.human).name)
 
                 authors_string = ",".join(authors)
-                authors_id_string = ",".join(author_ids)
+                authors_id_string = author_ids.get(paper.number, "")
 
                 row_series = pd.Series(
                     {
@@ -497,14 +1205,18 @@ class ChandraBot(object):
                     row_df = pd.DataFrame([row_series])
                     output_df = pd.concat([output_df, row_df], ignore_index=True)
 
+        elif dataframe_name == "human" and has_human_registry(self.paper_book):
+            output_df = self._make_human_df_from_registry()
+
         elif dataframe_name == "human":
             author_id_df = self._make_author_id_df()
+            author_id_dict = dict(
+                zip(author_id_df["hash_id"], author_id_df["author_id"])
+            )
             for paper in self.paper_book.paper:
                 authors_df = pd.DataFrame()
                 for author in paper.authors:
-                    author_id = author_id_df.loc[
-                        author_id_df["hash_id"] == author.human.hash_id
-                    ]["author_id"].values[0]
+                    author_id = author_id_dict[author.human.hash_id]
                     alias_str = ",".join(author.human.aliases)
                     affil_list = []
                     for affil in author.human.previous_affiliation:
@@ -566,46 +1278,669 @@ class ChandraBot(object):
 
         return output_df
 
-    def _make_author_id_df(self):
-        author_list = []
+    def _make_human_df_from_registry(self) -> pd.DataFrame:
+        # one row per registry entry, so no person is read more than once;
+        # like the embedded path, a person is spelled as their first copy in
+        # the book, with a paper's authors before its reviewers
+        author_id_df = self._make_author_id_df()
+        author_ids = dict(zip(author_id_df["hash_id"], author_id_df["author_id"]))
+        verified = {}
+        first_as_reviewer = {}
         for paper in self.paper_book.paper:
             for author in paper.authors:
-                if author.human.hash_id not in author_list:
-                    author_list.append(author.human.hash_id)
-        return_df = pd.DataFrame({"hash_id": author_list})
-        return_df["author_id"] = np.arange(len(return_df)) + 1
+                first_as_reviewer.setdefault(author.human.hash_id, False)
+            for review in paper.reviews:
+                hash_id = review.reviewer.human.hash_id
+                verified.setdefault(hash_id, review.reviewer.verified)
+                first_as_reviewer.setdefault(hash_id, True)
+
+        rows = []
+        for human in self.paper_book.humans:
+            if first_as_reviewer.get(human.hash_id, False):
+                human = reviewer_human(human)
+            rows.append(
+                (
+                    human.hash_id,
+                    human.name,
+                    ",".join(human.aliases),
+                    human.current_affiliation.name,
+                    ",".join(affil.name for affil in human.previous_affiliation),
+                    human.last_degree_affiliation.name,
+                    human.orcid_url,
+                    human.orcid,
+                    author_ids.get(human.hash_id, np.nan),
+                    verified.get(human.hash_id, np.nan),
+                )
+            )
+        output_df = pd.DataFrame(
+            rows,
+            columns=[
+                "hash_id",
+                "name",
+                "aliases",
+                "current_affiliation",
+                "previous_affiliation",
+                "last_degree_affiliation",
+                "orcid_url",
+                "orcid",
+                "author_id",
+                "verified",
+            ],
+        )
+        # float64, as author_id is in the embedded path, where reviewers who
+        # are not authors of the paper join a missing author_id
+        return output_df.astype({"author_id": np.float64})
+
+    def _make_paper_author_df_from_book(self) -> pd.DataFrame:
+        author_id_dict = {}
+        paper_ids = []
+        positions = []
+        author_ids = []
+        for paper in self.paper_book.paper:
+            for position, author in enumerate(paper.authors):
+                author_id = author_id_dict.setdefault(
+                    author.human.hash_id, len(author_id_dict) + 1
+                )
+                paper_ids.append(paper.number)
+                positions.append(position)
+                author_ids.append(author_id)
+
+        return pd.DataFrame(
+            {
+                "paper_id": paper_ids,
+                "author_position": np.array(positions, dtype=np.int32),
+                "author_id": np.array(author_ids, dtype=np.int32),
+            }
+        )
+
+    def _book_authors(self) -> tuple:
+        paper_ids = []
+        positions = []
+        hash_ids = []
+        for paper in self.paper_book.paper:
+            for position, author in enumerate(paper.authors):
+                paper_ids.append(paper.number)
+                positions.append(position)
+                hash_ids.append(author.human.hash_id)
+
+        return paper_ids, positions, hash_ids
+
+    def _paper_author_df_matches(self, paper_ids, positions, hash_ids) -> bool:
+        link_df = self.paper_author_df
+        if link_df is None or len(link_df) != len(hash_ids):
+            return False
+        if self._paper_author_key is not None and self._paper_author_key[0] is link_df:
+            return self._paper_author_key[1] == (paper_ids, positions, hash_ids)
+        if (
+            list(link_df["paper_id"]) != paper_ids
+            or list(link_df["author_position"]) != positions
+        ):
+            return False
+
+        # each hash_id must have one author_id, and each author_id one hash_id
+        pairs_df = pd.DataFrame(
+            {"hash_id": hash_ids, "author_id": link_df["author_id"].values}
+        ).drop_duplicates()
+        return pairs_df["hash_id"].nunique() == len(pairs_df) and pairs_df[
+            "author_id"
+        ].nunique() == len(pairs_df)
+
+    def _sync_paper_author_df(self) -> list:
+        # The link table holds one row per Author message, in book order. If
+        # the book's (paper_id, position, hash_id) sequence has changed since
+        # the table was last matched to it, e.g. because the book was
+        # modified outside of the bot, rebuild the table.
+        paper_ids, positions, hash_ids = self._book_authors()
+        if not self._paper_author_df_matches(paper_ids, positions, hash_ids):
+            self._set_dataframe(
+                "paper_author", self._make_paper_author_df_from_book(), lazy=True
+            )
+        self._paper_author_key = (
+            self.paper_author_df,
+            (paper_ids, positions, hash_ids),
+        )
+
+        return hash_ids
+
+    def _make_author_id_df(self):
+        hash_ids = self._sync_paper_author_df()
+        return_df = pd.DataFrame(
+            {"hash_id": hash_ids, "author_id": self.paper_author_df["author_id"].values}
+        ).drop_duplicates(subset=["hash_id"], ignore_index=True)
 
         return return_df
 
-    def count_former_coauthors(self, dataframe_only: bool = False):
+    @profiled(rows=lambda bot, result, arguments: len(result.review_df))
+    def make_compact_tables(self) -> CompactTables:
         """
-        count former coauthors
+        Build the opt-in compact schema, in which hash IDs and paper IDs are
+        int32 codes backed by shared dictionaries, recommendations are
+        categoricals, and author_ids is an exploded int32 link table.
+        The result is also stored in the compact_tables attribute.
+
+        returns: a CompactTables object
+        """
+        from .compact import CompactTables
+
+        self.compact_tables = CompactTables(
+            paper_df=self.paper_df, review_df=self.review_df, human_df=self.human_df
+        )
+
+        return self.compact_tables
+
+    @profiled(rows=lambda bot, result, arguments: len(result))
+    def index_paper_book(self) -> PaperBookIndex:
+        """
+        Index the paper book by paper number, year, author hash_id, and
+        reviewer hash_id. The index is built on the first call and only
+        the papers appended since are indexed on later calls. Call
+        paper_index.rebuild() after other edits to the book.
+
+        returns: the PaperBookIndex, also stored in the paper_index attribute
+        """
+        if self.paper_index is None or self.paper_index.paper_book is not (
+            self.paper_book
+        ):
+            self.paper_index = PaperBookIndex(self.paper_book)
+        else:
+            self.paper_index.update()
+
+        return self.paper_index
+
+    def query(self, table: str) -> Query:
+        """
+        Start a query over the papers, reviews, or humans. Filters, column
+        selections, and aggregations are added to the returned Query and
+        nothing is read until Query.run is called. See chandra_bot.query.
+
+        args:
+            table: "papers", "reviews", or "humans"
+
+        returns: a Query
+        """
+        return Query(self, table)
+
+    @profiled(rows=lambda bot, result, arguments: len(result))
+    def sql(self, query: str, parameters: list = None) -> pd.DataFrame:
+        """
+        Run a SQL query with DuckDB against views of the bot tables: papers,
+        reviews, humans, paper_author_links, and the derived reviewer_stats,
+        paper_authors, collaborations, and conflicts views. See
+        chandra_bot.sql. Requires duckdb.
+
+        args:
+            query: DuckDB SQL
+            parameters: optional values for ? placeholders in the query
+
+        returns: the result as a DataFrame
+        """
+        if self.sql_view is None:
+            self.sql_view = SqlView(self)
+
+        return self.sql_view.execute(query, parameters)
+
+    @profiled(rows=lambda bot, result, arguments: len(result.review_summary_df))
+    def make_summary_tables(
+        self, min_number_reviews: int = 10, min_verified_reviews: int = 1
+    ) -> SummaryTables:
+        """
+        Build the reviewer and paper summaries read by the Tableau
+        workbooks. Later calls to update_reviews and update_papers update
+        them incrementally. See chandra_bot.summary.
+
+        args:
+            min_number_reviews: reviewers with fewer reviews get no
+                normalized scores
+            min_verified_reviews: papers with fewer reviews by verified
+                reviewers get no verified means
+
+        returns: the SummaryTables, also stored in the summary_tables
+            attribute
+        """
+        self.summary_tables = SummaryTables(
+            self, min_number_reviews, min_verified_reviews
+        )
+
+        return self.summary_tables
+
+    @profiled(rows=_count_reviews)
+    def make_reliability_tables(
+        self, dataframe_only: bool = False
+    ) -> ReliabilityTables:
+        """
+        Measure the agreement of the review panel and the reliability of
+        each reviewer against the other reviewers of the same papers. See
+        chandra_bot.reliability.
+
+        args:
+            dataframe_only: if True, read the reviews from review_df and
+                leave the paper book alone; otherwise also set the
+                consensus fields of every Reviewer in the paper book
+
+        returns: the ReliabilityTables, also stored in the
+            reliability_tables attribute
         """
         if dataframe_only:
-            temp_df = self.paper_df[["paper_id", "author_ids"]].copy()
-            temp_df = (
-                pd.concat(
-                    [
-                        temp_df["paper_id"].reset_index(drop=True),
-                        temp_df.author_ids.str.split(",", expand=True),
-                    ],
-                    axis=1,
+            from .compact import (
+                PRESENTATION_REC_DTYPE,
+                as_categorical,
+                recommendation_column,
+            )
+
+            review_df = self.review_df
+            column = recommendation_column(review_df, "presentation_recommend")
+            if column is None:
+                recommends = np.full(len(review_df), dm.PRESENTATION_REC_NONE)
+            else:
+                recommends = as_categorical(
+                    review_df[column], PRESENTATION_REC_DTYPE
+                ).cat.codes.to_numpy()
+            self.reliability_tables = ReliabilityTables(
+                review_df["paper_id"].to_numpy(object),
+                review_df["reviewer_human_hash_id"].to_numpy(object),
+                review_df["presentation_score"].to_numpy(np.float64),
+                recommends,
+            )
+            return self.reliability_tables
+
+        reviews = [
+            (paper.number, review)
+            for paper in self.paper_book.paper
+            for review in paper.reviews
+        ]
+        self.reliability_tables = ReliabilityTables(
+            [paper_id for paper_id, _ in reviews],
+            [review.reviewer.human.hash_id for _, review in reviews],
+            [review.presentation_score for _, review in reviews],
+            [review.presentation_recommend for _, review in reviews],
+        )
+
+        reviewer_df = self.reliability_tables.reviewer_df
+        rows = dict(
+            zip(
+                reviewer_df.index,
+                reviewer_df[REVIEWER_RELIABILITY_COLUMNS].itertuples(index=False),
+            )
+        )
+        for _, review in reviews:
+            row = rows.get(review.reviewer.human.hash_id)
+            if row is None:
+                continue
+            for field, value in zip(REVIEWER_RELIABILITY_COLUMNS, row):
+                if field == "number_of_consensus_reviews":
+                    setattr(review.reviewer, field, int(value))
+                elif np.isnan(value):
+                    review.reviewer.ClearField(field)
+                else:
+                    setattr(review.reviewer, field, value)
+        self.invalidate_dataframes()
+
+        return self.reliability_tables
+
+    @profiled(rows=_count_reviews)
+    def bootstrap_paper_scores(
+        self,
+        number_resamples: int = 1000,
+        confidence: float = 0.9,
+        threshold: float = None,
+        capacity: int = None,
+        reviewer_effects: bool = False,
+        normalized: bool = False,
+        year: int = None,
+        seed: int = None,
+        workers: int = 1,
+        dataframe_only: bool = False,
+    ) -> ScoreBootstrap:
+        """
+        Resample the reviews of each paper to get score intervals and, with
+        a threshold or a capacity, acceptance probabilities. See
+        chandra_bot.bootstrap.
+
+        args:
+            number_resamples: the number of resamples
+            confidence: the share of the resampled means inside the interval
+            threshold: accept the papers with a mean score at or above it
+            capacity: accept this many papers, those with the highest means
+            reviewer_effects: if True, also resample reviewer biases
+            normalized: if True, use normalized scores instead of
+                presentation_score. With dataframe_only, the
+                normalized_present_score column set by
+                compute_normalized_scores; otherwise each score is
+                normalized by the mean and standard deviation of all the
+                reviewer's scores in the book, as compute_normalized_scores
+                does with dataframe_only, since the book only keeps a
+                normalized score on each reviewer's first review
+            year: if set, only the papers of this year
+            seed: seed of the random generator
+            workers: the number of processes drawing resamples
+            dataframe_only: if True, read the reviews from review_df
+
+        returns: a ScoreBootstrap
+        """
+        if dataframe_only:
+            field = "normalized_present_score" if normalized else "presentation_score"
+            review_df = self.review_df
+            if year is not None:
+                review_df = review_df.loc[self._review_years(review_df) == year]
+            paper_ids = review_df["paper_id"].to_numpy(object)
+            reviewer_ids = review_df["reviewer_human_hash_id"].to_numpy(object)
+            scores = review_df[field].to_numpy(np.float64)
+        else:
+            if year is None:
+                papers = self.paper_book.paper
+            else:
+                papers = self.index_paper_book().papers_in_year(year)
+            reviews = [
+                (paper.number, review) for paper in papers for review in paper.reviews
+            ]
+            paper_ids = [paper_id for paper_id, _ in reviews]
+            reviewer_ids = [review.reviewer.human.hash_id for _, review in reviews]
+            scores = [review.presentation_score for _, review in reviews]
+            if normalized:
+                scores = self._book_normalized_scores(reviewer_ids, scores)
+
+        return ScoreBootstrap(
+            paper_ids,
+            reviewer_ids,
+            scores,
+            number_resamples=number_resamples,
+            confidence=confidence,
+            threshold=threshold,
+            capacity=capacity,
+            reviewer_effects=reviewer_effects,
+            seed=seed,
+            workers=workers,
+        )
+
+    def _book_normalized_scores(self, reviewer_ids: list, scores: list) -> list:
+        # the scores normalized by the statistics of each reviewer's scores
+        # in the whole book; NaN for reviewers with a single review
+        book_df = pd.DataFrame(
+            {
+                "hash_id": [
+                    review.reviewer.human.hash_id
+                    for paper in self.paper_book.paper
+                    for review in paper.reviews
+                ],
+                "score": [
+                    review.presentation_score
+                    for paper in self.paper_book.paper
+                    for review in paper.reviews
+                ],
+            }
+        )
+        stats_df = book_df.groupby("hash_id")["score"].agg(["mean", "std"])
+        stats_df = stats_df.reindex(reviewer_ids)
+
+        return (
+            (np.asarray(scores, dtype=np.float64) - stats_df["mean"].to_numpy())
+            / stats_df["std"].to_numpy()
+        ).tolist()
+
+    def _topic_papers(self, year, accepted_only: bool, dataframe_only: bool):
+        # the selected papers, as paper_df positions or Paper messages
+        if dataframe_only:
+            from .compact import PRESENTATION_REC_DTYPE, as_categorical
+
+            paper_df = self.paper_df
+            mask = np.ones(len(paper_df), dtype=bool)
+            if year is not None:
+                mask &= (paper_df["year"] == year).to_numpy()
+            if accepted_only:
+                decisions = as_categorical(
+                    paper_df["committee_presentation_decision"], PRESENTATION_REC_DTYPE
                 )
-                .set_index("paper_id")
-                .stack()
-                .reset_index(level=[0, 1])
-                .rename(columns={0: "author_id"})
-                .drop(columns=["level_1"])
-                .set_index("paper_id")
-                .join(self.paper_df[["paper_id", "year"]].set_index("paper_id"))
+                mask &= (decisions.cat.codes == dm.PRESENTATION_REC_ACCEPT).to_numpy()
+            return np.flatnonzero(mask)
+
+        if year is None:
+            papers = self.paper_book.paper
+        else:
+            papers = self.index_paper_book().papers_in_year(year)
+        if accepted_only:
+            papers = [
+                paper
+                for paper in papers
+                if paper.committee_presentation_decision == dm.PRESENTATION_REC_ACCEPT
+            ]
+        return list(papers)
+
+    def _topic_texts(self, papers, dataframe_only: bool) -> list:
+        if dataframe_only:
+            return paper_texts(
+                self.paper_df["title"].iloc[papers].astype(object),
+                self.paper_df["abstract"].iloc[papers].astype(object),
             )
+        return paper_texts(
+            [paper.title for paper in papers], [paper.abstract.text for paper in papers]
+        )
+
+    def _set_topics(self, papers, topics, dataframe_only: bool):
+        top_terms = self.topic_model.top_terms
+        if dataframe_only:
+            paper_df = self.paper_df.copy()
+            if "topic" not in paper_df.columns:
+                paper_df["topic"] = 0
+                paper_df["topic_terms"] = ""
+            topic_values = paper_df["topic"].to_numpy(np.int64, copy=True)
+            topic_values[papers] = topics
+            term_values = paper_df["topic_terms"].to_numpy(object, copy=True)
+            term_values[papers] = [",".join(top_terms[t - 1]) for t in topics]
+            paper_df["topic"] = topic_values
+            paper_df["topic_terms"] = term_values
+            self.paper_df = paper_df
+        else:
+            for paper, topic in zip(papers, topics):
+                paper.topic = topic
+                paper.topic_terms[:] = top_terms[topic - 1]
+
+    @profiled(rows=lambda bot, result, arguments: len(result))
+    def cluster_paper_topics(
+        self,
+        number_topics: int = 20,
+        number_terms: int = 8,
+        year: int = None,
+        accepted_only: bool = False,
+        seed: int = None,
+        dataframe_only: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Cluster papers into topics by their titles and abstracts, and set
+        the topic and topic_terms of each paper. The fitted model is kept
+        in the topic_model attribute. Requires scikit-learn; see
+        chandra_bot.topics.
+
+        args:
+            number_topics: the number of topics
+            number_terms: the number of top terms per topic
+            year: if set, only cluster the papers of this year
+            accepted_only: if True, only cluster the papers accepted for
+                presentation
+            seed: seed of the clustering
+            dataframe_only: if True, add topic and topic_terms columns to
+                paper_df instead of setting the fields of the paper book
+
+        returns: the topics with their top terms and number of papers
+        """
+        papers = self._topic_papers(year, accepted_only, dataframe_only)
+        self.topic_model = TopicModel(
+            number_topics=number_topics, number_terms=number_terms, seed=seed
+        )
+        topics = self.topic_model.fit(self._topic_texts(papers, dataframe_only))
+        self._set_topics(papers, topics, dataframe_only)
+
+        return self.topic_model.topic_df(topics)
+
+    @profiled(rows=lambda bot, result, arguments: result)
+    def assign_paper_topics(
+        self,
+        year: int = None,
+        accepted_only: bool = False,
+        dataframe_only: bool = False,
+    ) -> int:
+        """
+        Assign the papers without a topic, e.g. late papers, to the topics
+        of topic_model without refitting it.
+
+        args:
+            year, accepted_only, dataframe_only: see cluster_paper_topics
+
+        returns: the number of papers assigned
+        """
+        if self.topic_model is None:
+            print("Call cluster_paper_topics before assign_paper_topics.")
+            return 0
+
+        papers = self._topic_papers(year, accepted_only, dataframe_only)
+        if dataframe_only:
+            if "topic" in self.paper_df.columns:
+                topic_values = self.paper_df["topic"].to_numpy()[papers]
+                papers = papers[topic_values == 0]
+        else:
+            papers = [paper for paper in papers if paper.topic == 0]
+        topics = self.topic_model.assign(self._topic_texts(papers, dataframe_only))
+        self._set_topics(papers, topics, dataframe_only)
+
+        return len(papers)
+
+    @profiled(rows=lambda bot, result, arguments: len(result.paper_df))
+    def schedule_sessions(
+        self,
+        session_df: pd.DataFrame,
+        year: int = None,
+        topic_weight: float = 1.0,
+        clash_weight: float = 100.0,
+        time_limit: float = 5.0,
+        seed: int = None,
+        dataframe_only: bool = False,
+    ) -> Schedule:
+        """
+        Pack the papers accepted for presentation into sessions, keeping
+        each session on one topic and each author out of parallel sessions.
+        Topics come from cluster_paper_topics; papers without one share a
+        topic. See chandra_bot.schedule.
+
+        args:
+            session_df: one row per session, indexed by session name, with
+                a capacity column and an optional slot column
+            year: if set, only the papers of this year
+            topic_weight, clash_weight: the weights of the objective
+            time_limit: the longest the local search runs, in seconds
+            seed: seed of the local search
+            dataframe_only: if True, read the papers from paper_df
+
+        returns: a Schedule with the assignments, objective, and runtime
+        """
+        papers = self._topic_papers(year, True, dataframe_only)
+        if dataframe_only:
+            paper_df = self.paper_df.iloc[papers]
+            if "paper_id" in paper_df.columns:
+                paper_ids = paper_df["paper_id"].to_numpy(object)
+            else:
+                paper_ids = paper_df.index.to_numpy(object)
+            if "topic" in paper_df.columns:
+                topics = paper_df["topic"].to_numpy()
+            else:
+                topics = np.zeros(len(paper_df), dtype=np.int64)
+            authors = [[] for _ in paper_ids]
+            if self.paper_author_df is not None:
+                links_df = self.paper_author_df.dropna(subset=["author_id"])
+                paper_authors = (
+                    links_df.loc[links_df["paper_id"].isin(paper_ids)]
+                    .groupby("paper_id", sort=False)["author_id"]
+                    .agg(list)
+                )
+                authors = [paper_authors.get(paper_id, []) for paper_id in paper_ids]
+        else:
+            paper_ids = [paper.number for paper in papers]
+            topics = [paper.topic for paper in papers]
+            authors = [
+                [author.human.hash_id for author in paper.authors] for paper in papers
+            ]
+
+        return Schedule(
+            paper_ids,
+            topics,
+            authors,
+            session_df,
+            topic_weight=topic_weight,
+            clash_weight=clash_weight,
+            time_limit=time_limit,
+            seed=seed,
+        )
+
+    @profiled(rows=lambda bot, result, arguments: len(arguments["review_df"]))
+    def update_reviews(self, review_df: pd.DataFrame):
+        """
+        Add reviews to review_df, replacing any with the same paper_id and
+        reviewer_human_hash_id, and update the summary tables.
+
+        args:
+            review_df: new or changed reviews with the review_df columns
+        """
+        columns = list(self.review_df.columns)
+        current_df = self.review_df.set_index(REVIEW_KEYS)
+        new_df = review_df.set_index(REVIEW_KEYS)
+        current_df.update(new_df)
+        self.review_df = pd.concat(
+            [current_df, new_df.loc[~new_df.index.isin(current_df.index)]]
+        ).reset_index()[columns]
+
+        if self.summary_tables is not None:
+            self.summary_tables.apply(review_df=review_df)
+
+    @profiled(rows=lambda bot, result, arguments: len(arguments["paper_df"]))
+    def update_papers(self, paper_df: pd.DataFrame):
+        """
+        Add papers to paper_df, replacing any with the same paper_id, and
+        update the paper-author links and the summary tables.
+
+        args:
+            paper_df: new or changed papers with the paper_df columns,
+                indexed by paper_id
+        """
+        current_df = self.paper_df.copy()
+        current_df.update(paper_df)
+        self.paper_df = pd.concat(
+            [current_df, paper_df.loc[~paper_df.index.isin(current_df.index)]]
+        )[current_df.columns]
+
+        from .compact import make_paper_author_df
+
+        links_df = make_paper_author_df(paper_df)
+        if self.paper_author_df is not None:
+            links_df = pd.concat(
+                [
+                    self.paper_author_df.loc[
+                        ~self.paper_author_df["paper_id"].isin(paper_df.index)
+                    ],
+                    links_df,
+                ],
+                ignore_index=True,
+            )
+        self.paper_author_df = links_df
+
+        if self.summary_tables is not None:
+            self.summary_tables.apply(paper_df=paper_df)
+
+    @profiled(rows=_count_reviews)
+    def count_former_coauthors(self, dataframe_only: bool = False):
+        """
+        count former coauthors
+        """
+        if dataframe_only:
+            if "paper_id" in self.paper_df.columns:
+                year_df = self.paper_df[["paper_id", "year"]]
+            else:
+                year_df = self.paper_df[["year"]].reset_index()
 
             h_df = self.human_df.reset_index()[["hash_id", "author_id"]].astype(
                 {"author_id": "int64"}
             )
             auth_df = (
-                temp_df.astype({"author_id": "int64"})
-                .reset_index()
+                self.paper_author_df[["paper_id", "author_id"]]
+                .astype({"author_id": "int64"})
+                .merge(year_df, on="paper_id", how="left")
                 .merge(h_df, on="author_id", how="left")
             )
 
@@ -655,75 +1990,166 @@ class ChandraBot(object):
             ).fillna(0)
 
         else:
-            pairs_df = pd.DataFrame()
-            for paper in self.paper_book.paper:
-                a_list = []
-                for author in paper.authors:
-                    a_list.append(author.human.hash_id)
-                pairs = [a_list, a_list]
-                data = list(itertools.product(*pairs))
-                idx = [f"{i}" for i in range(1, len(data) + 1)]
-                temp_df = pd.DataFrame(data, index=idx, columns=list("ab"))
-                temp_df = temp_df[temp_df.a != temp_df.b].copy()
-                temp_df["year"] = paper.year
-                pairs_df = pd.concat([pairs_df, temp_df])
-
-            count_df = (
-                pairs_df.groupby(["a", "b"]).size().reset_index(name="paper_count")
-            )
-            first_df = (
-                pairs_df.groupby(["a", "b"])
-                .min()[["year"]]
-                .rename(columns={"year": "year_first_collab"})
-            )
-            pairs_df = count_df.join(first_df, on=["a", "b"])
-
+            index = self.index_paper_book()
+            collaborations = {}
             for paper in self.paper_book.paper:
                 a_list = []
                 for author in paper.authors:
                     a_list.append(author.human.hash_id)
                 for review in paper.reviews:
                     r_hash_id = review.reviewer.human.hash_id
-                    temp_df = pairs_df[pairs_df["a"] == r_hash_id]
+                    if r_hash_id not in collaborations:
+                        collaborations[r_hash_id] = self._collaborations(
+                            index, r_hash_id
+                        )
+                    r_collaborations = collaborations[r_hash_id]
                     for auth in a_list:
-                        a_df = temp_df[
-                            (temp_df.b == auth) & temp_df.year_first_collab
-                            <= paper.year
-                        ].copy()
-                        review.papers_written_with_authors += sum(a_df["paper_count"])
+                        if auth in r_collaborations:
+                            paper_count, year_first_collab = r_collaborations[auth]
+                            if year_first_collab <= paper.year:
+                                review.papers_written_with_authors += paper_count
+            self.invalidate_dataframes()
+
+    def _collaborations(self, index: PaperBookIndex, hash_id: str) -> dict:
+        # coauthor hash_id -> [papers written together, year of the first]
+        collaborations = {}
+        for paper in index.papers_by_author(hash_id):
+            for author in paper.authors:
+                coauthor = author.human.hash_id
+                if coauthor == hash_id:
+                    continue
+                if coauthor in collaborations:
+                    collaborations[coauthor][0] += 1
+                    collaborations[coauthor][1] = min(
+                        collaborations[coauthor][1], paper.year
+                    )
+                else:
+                    collaborations[coauthor] = [1, paper.year]
+
+        return collaborations
 
     @staticmethod
-    def _count_words_in_text(key_words, output_col_name, input_df, input_col_name):
+    def _count_words_in_text(
+        key_words,
+        output_col_name,
+        input_df,
+        input_col_name,
+        workers: int = 1,
+        executor: str = "process",
+    ):
         look_for = "|".join(key_words)
-        input_df[output_col_name] = input_df[input_col_name].str.count(look_for)
+        input_df[output_col_name] = count_pattern(
+            input_df[input_col_name], look_for, workers=workers, executor=executor
+        )
         return input_df
 
-    def count_words_in_paper_abstract(
-        self, key_words, column_name: str, dataframe_only: bool = True
+    def _text_contents(self, field: str) -> list:
+        if TEXT_FIELDS[field] == "paper":
+            return [getattr(paper, field) for paper in self.paper_book.paper]
+        return [
+            getattr(review, field)
+            for paper in self.paper_book.paper
+            for review in paper.reviews
+        ]
+
+    @profiled(rows=_count_texts)
+    def count_words_in_text(
+        self,
+        key_words,
+        column_name: str,
+        field: str,
+        dataframe_only: bool = True,
+        workers: int = 1,
+        executor: str = "process",
     ):
         """
-        count words in paper abstract
+        Count the key words in a text field of every paper or review,
+        optionally splitting the texts into chunks across a pool of workers.
+        The counts are the same whatever the number of workers.
+
+        args:
+            key_words: regular expressions, counted as alternatives
+            column_name: name of the output column, or of the word_counts
+                entry in each Content message
+            field: "abstract", "body", "commentary_to_author", or
+                "commentary_to_chair"
+            dataframe_only: if True, add a column to paper_df or review_df;
+                otherwise store the counts in the paper book
+            workers: number of workers; 1 counts serially
+            executor: "process" or "thread"; see chandra_bot.text
         """
-        if dataframe_only:
-            self.paper_df = ChandraBot._count_words_in_text(
-                key_words, column_name, self.paper_df, "abstract"
+        if field not in TEXT_FIELDS:
+            print(
+                "field must be 'abstract', 'body', 'commentary_to_author', "
+                "or 'commentary_to_chair'"
             )
+            return
+
+        if dataframe_only:
+            if TEXT_FIELDS[field] == "paper":
+                self.paper_df = ChandraBot._count_words_in_text(
+                    key_words, column_name, self.paper_df, field, workers, executor
+                )
+            else:
+                self.review_df = ChandraBot._count_words_in_text(
+                    key_words, column_name, self.review_df, field, workers, executor
+                )
         else:
-            print("dataframe_only must be True")
+            contents = self._text_contents(field)
+            texts = pd.Series([content.text for content in contents], dtype=object)
+            counts = count_pattern(
+                texts, "|".join(key_words), workers=workers, executor=executor
+            )
+            for content, count in zip(contents, counts.tolist()):
+                content.word_counts[column_name] = count
+            self.invalidate_dataframes()
 
+    @profiled(
+        rows=lambda bot, result, arguments: _count_texts(
+            bot, result, dict(arguments, field="abstract")
+        )
+    )
+    def count_words_in_paper_abstract(
+        self,
+        key_words,
+        column_name: str,
+        dataframe_only: bool = True,
+        workers: int = 1,
+        executor: str = "process",
+    ):
+        """
+        count words in paper abstract; see count_words_in_text
+        """
+        self.count_words_in_text(
+            key_words, column_name, "abstract", dataframe_only, workers, executor
+        )
+
+    @profiled(
+        rows=lambda bot, result, arguments: _count_texts(
+            bot, result, dict(arguments, field="commentary_to_author")
+        )
+    )
     def count_words_in_review_commentary(
-        self, key_words, column_name: str, dataframe_only: bool = True
+        self,
+        key_words,
+        column_name: str,
+        dataframe_only: bool = True,
+        workers: int = 1,
+        executor: str = "process",
     ):
         """
-        count words in review commentary
+        count words in review commentary; see count_words_in_text
         """
-        if dataframe_only:
-            self.review_df = ChandraBot._count_words_in_text(
-                key_words, column_name, self.review_df, "commentary_to_author"
-            )
-        else:
-            print("dataframe_only must be True")
+        self.count_words_in_text(
+            key_words,
+            column_name,
+            "commentary_to_author",
+            dataframe_only,
+            workers,
+            executor,
+        )
 
+    @profiled(rows=_count_reviews)
     def append_verified_reviewer(self, min_count: int, dataframe_only: bool = False):
         """
         append verified reviewer
@@ -761,5 +2187,6 @@ class ChandraBot(object):
                     paper.mean_verified_score = np.mean(v_list)
                 else:
                     paper.mean_verified_score = np.nan
+            self.invalidate_dataframes()
 
         return
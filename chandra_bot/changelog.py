@@ -0,0 +1,202 @@
+"""
+An append-only change log kept alongside a PaperBook file.
+
+A book file holds a snapshot. Papers and reviews added or changed since the
+snapshot are appended to "<book file>.log" as PaperBookChange records, so a
+write costs the size of the changes rather than the size of the book.
+Reading replays the log over the snapshot. Compaction writes a fresh
+snapshot and removes the log.
+
+Each record is a 4-byte little-endian length followed by a serialized
+PaperBookChange. A record cut short by an interrupted write is ignored
+when the log is read, and cut off before the next append so the records
+after it are not lost. An append finds a torn tail by walking the length
+headers only, from the end of the records it last wrote or read, so it
+costs the size of the changes rather than the size of the log.
+"""
+import os
+import struct
+
+from . import data_model_pb2 as dm
+
+_LENGTH = struct.Struct("<I")
+
+# log file -> (inode, offset after the records last appended or read)
+_record_ends = {}
+
+
+def log_file_name(book_file: str) -> str:
+    """
+    returns: the change log file of a book file
+    """
+    return book_file + ".log"
+
+
+class BookChanges(object):
+    """
+    Applies changes to a PaperBook in memory. Papers are keyed by number and
+    the reviews of a paper by reviewer hash_id; a change to an existing key
+    replaces the message, and any other change appends it.
+    """
+
+    def __init__(self, paper_book: dm.PaperBook):
+        self.paper_book = paper_book
+        self.positions = {
+            paper.number: position for position, paper in enumerate(paper_book.paper)
+        }
+
+    def paper(self, paper: dm.Paper) -> None:
+        position = self.positions.get(paper.number)
+        if position is None:
+            self.positions[paper.number] = len(self.paper_book.paper)
+            self.paper_book.paper.add().CopyFrom(paper)
+        else:
+            self.paper_book.paper[position].CopyFrom(paper)
+
+    def review(self, paper_number: str, review: dm.Review) -> None:
+        position = self.positions.get(paper_number)
+        if position is None:
+            raise KeyError(f"no paper {paper_number} in the book")
+
+        reviews = self.paper_book.paper[position].reviews
+        hash_id = review.reviewer.human.hash_id
+        for existing in reviews:
+            if existing.reviewer.human.hash_id == hash_id:
+                existing.CopyFrom(review)
+                return
+        reviews.add().CopyFrom(review)
+
+    def apply(self, change: dm.PaperBookChange) -> None:
+        if change.WhichOneof("change") == "paper":
+            self.paper(change.paper)
+        else:
+            self.review(change.paper_number, change.review)
+
+
+def make_changes(papers: list = None, reviews: list = None) -> list:
+    """
+    args:
+        papers: added or changed Paper messages
+        reviews: (paper number, Review message) pairs
+
+    returns: PaperBookChange messages, papers first
+    """
+    changes = [dm.PaperBookChange(paper=paper) for paper in papers or []]
+    changes += [
+        dm.PaperBookChange(paper_number=number, review=review)
+        for number, review in reviews or []
+    ]
+    return changes
+
+
+def _records_end(data: bytes) -> int:
+    # the offset after the last complete record
+    offset = 0
+    while offset + _LENGTH.size <= len(data):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        if offset + _LENGTH.size + length > len(data):
+            break
+        offset += _LENGTH.size + length
+    return offset
+
+
+def _headers_end(file_pointer, offset: int, size: int) -> int:
+    # the offset after the last complete record from offset on, reading
+    # only the length headers
+    while offset + _LENGTH.size <= size:
+        file_pointer.seek(offset)
+        (length,) = _LENGTH.unpack(file_pointer.read(_LENGTH.size))
+        if offset + _LENGTH.size + length > size:
+            break
+        offset += _LENGTH.size + length
+    return offset
+
+
+def append_changes(book_file: str, changes: list) -> int:
+    """
+    Append changes to the log of a book file. A partial record left at the
+    end of the log by an interrupted append is removed first.
+
+    returns: the number of bytes written
+    """
+    records = []
+    for change in changes:
+        data = change.SerializeToString()
+        records.append(_LENGTH.pack(len(data)))
+        records.append(data)
+    data = b"".join(records)
+    log_file = os.path.abspath(log_file_name(book_file))
+    with open(log_file, "ab+") as file_pointer:
+        stat = os.fstat(file_pointer.fileno())
+        inode, start = _record_ends.get(log_file, (None, 0))
+        if inode != stat.st_ino or start > stat.st_size:
+            start = 0
+        end = _headers_end(file_pointer, start, stat.st_size)
+        if end < stat.st_size:
+            file_pointer.truncate(end)
+        file_pointer.write(data)
+    _record_ends[log_file] = (stat.st_ino, end + len(data))
+
+    return len(data)
+
+
+def read_changes(book_file: str) -> list:
+    """
+    returns: the PaperBookChange records in the log of a book file, in the
+        order written; an empty list if there is no log
+    """
+    log_file = os.path.abspath(log_file_name(book_file))
+    try:
+        with open(log_file, "rb") as file_pointer:
+            data = file_pointer.read()
+            inode = os.fstat(file_pointer.fileno()).st_ino
+    except FileNotFoundError:
+        return []
+
+    changes = []
+    offset = 0
+    end = _records_end(data)
+    _record_ends[log_file] = (inode, end)
+    while offset < end:
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        change = dm.PaperBookChange()
+        change.ParseFromString(data[offset : offset + length])
+        changes.append(change)
+        offset += length
+
+    return changes
+
+
+def replay_changes(book_file: str, paper_book: dm.PaperBook) -> int:
+    """
+    Apply the log of a book file to a PaperBook read from its snapshot.
+
+    returns: the number of changes applied
+    """
+    changes = read_changes(book_file)
+    book_changes = BookChanges(paper_book)
+    for change in changes:
+        book_changes.apply(change)
+
+    return len(changes)
+
+
+def needs_compaction(book_file: str, max_log_ratio: float) -> bool:
+    """
+    returns: True if the log of a book file is larger than max_log_ratio
+        times its snapshot
+    """
+    log_file = log_file_name(book_file)
+    if not os.path.exists(log_file):
+        return False
+    if not os.path.exists(book_file):
+        return True
+    return os.path.getsize(log_file) > max_log_ratio * os.path.getsize(book_file)
+
+
+def remove_log(book_file: str) -> None:
+    log_file = os.path.abspath(log_file_name(book_file))
+    _record_ends.pop(log_file, None)
+    if os.path.exists(log_file):
+        os.remove(log_file)
@@ -0,0 +1,485 @@
+"""
+The chandra-bot command line.
+
+Subcommands:
+
+    build       assemble a paper book from paper, review, and human CSV files
+    normalize   compute normalized presentation scores and write the book
+    conflicts   list reviewers who have written with the authors they review
+    summaries   write the reviewer and paper summary CSV files for Tableau
+    export      write the bot tables as CSV files or a warm-start snapshot
+
+The --book-file of a command is a paper book (see read_paper_book) or a
+warm-start snapshot (see read_warm_start).
+
+Loading a large book takes much longer than most commands. "chandra-bot
+--serve" starts a worker that keeps the bots it loads resident and runs
+commands sent over a local socket. While a worker is listening, other
+invocations send their command to it instead of running it themselves,
+so a book is loaded once per evening rather than once per command. A
+resident bot is reloaded when its book file changes. The worker runs one
+command at a time.
+
+Typical usage:
+
+    chandra-bot build --paper-file papers.csv --review-file reviews.csv \\
+        --human-file humans.csv --output-file book.bin
+    chandra-bot --serve --preload book.bin &
+    chandra-bot conflicts --book-file book.bin --year 2023
+    chandra-bot summaries --book-file book.bin --output-dir tableau
+    chandra-bot --stop
+"""
+import argparse
+import contextlib
+import csv
+import getpass
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+
+from .changelog import log_file_name
+from .compressed import is_compressed_book
+from .warm_start import is_snapshot
+
+CONFLICT_COLUMNS = [
+    "paper_id",
+    "reviewer_hash_id",
+    "author_hash_id",
+    "papers_written",
+    "year_first_collab",
+]
+
+COMMANDS = ["build", "normalize", "conflicts", "summaries", "export"]
+
+EXPORT_FILES = {
+    "paper": "{prefix}_paper_table.csv",
+    "review": "{prefix}_review_table.csv",
+    "human": "{prefix}_human_table.csv",
+}
+
+
+def default_socket() -> str:
+    """
+    returns: the CHANDRA_BOT_SOCKET environment variable, or a per-user
+        socket path in the temporary directory
+    """
+    if os.environ.get("CHANDRA_BOT_SOCKET"):
+        return os.environ["CHANDRA_BOT_SOCKET"]
+    return os.path.join(tempfile.gettempdir(), f"chandra-bot-{getpass.getuser()}.sock")
+
+
+def _signature(book_file: str) -> tuple:
+    # a resident bot is stale once its book file or change log changes
+    signature = []
+    for path in [book_file, log_file_name(book_file)]:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class ResidentBots(object):
+    """
+    Bots loaded from book files, kept until the file changes. A command
+    run directly uses a fresh ResidentBots and loads each book once; the
+    worker keeps one for its whole life.
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def _entry(self, book_file: str) -> dict:
+        from .chandra_bot import ChandraBot
+
+        path = os.path.abspath(book_file)
+        signature = _signature(path)
+        entry = self.entries.get(path)
+        if entry is None or entry["signature"] != signature:
+            if is_snapshot(path):
+                bot = ChandraBot.read_warm_start(path)
+            else:
+                bot = ChandraBot.read_paper_book(path)
+            entry = {"signature": signature, "bot": bot, "state": None}
+            self.entries[path] = entry
+        return entry
+
+    def bot(self, book_file: str):
+        """
+        returns: the ChandraBot of the book file
+        """
+        return self._entry(book_file)["bot"]
+
+    def service_state(self, book_file: str):
+        """
+        returns: a ServiceState over the bot, which caches the index,
+            reviewer statistics, and collaboration histories
+        """
+        from .service import ServiceState
+
+        entry = self._entry(book_file)
+        if entry["state"] is None:
+            entry["state"] = ServiceState(entry["bot"])
+        return entry["state"]
+
+    def written(self, book_file: str, bot) -> None:
+        """
+        Record that the bot has been written to the book file, so that it
+        stays resident instead of being read back.
+        """
+        path = os.path.abspath(book_file)
+        self.entries[path] = {"signature": _signature(path), "bot": bot, "state": None}
+
+    def forget(self, book_file: str) -> None:
+        """
+        Drop the bot of the book file, e.g. after changing it in memory
+        without writing it back.
+        """
+        self.entries.pop(os.path.abspath(book_file), None)
+
+
+def _write_book(bot, output_file: str, like_file: str) -> None:
+    # keep the format of the input file
+    if is_snapshot(like_file):
+        bot.write_warm_start(output_file)
+    else:
+        bot.write_paper_book(output_file, compress=is_compressed_book(like_file))
+
+
+def build(args, bots: ResidentBots) -> int:
+    from .chandra_bot import ChandraBot
+
+    bot = ChandraBot.create_bot(
+        paper_file=args.paper_file,
+        review_file=args.review_file,
+        human_file=args.human_file,
+    )
+    bot.assemble_paper_book(
+        bulk=args.bulk, workers=args.workers, human_registry=args.human_registry
+    )
+    if args.warm_start:
+        bot.write_warm_start(args.output_file)
+    else:
+        bot.write_paper_book(args.output_file, compress=args.compress)
+    bots.written(args.output_file, bot)
+    print(f"{args.output_file}: {len(bot.paper_book.paper)} papers")
+
+    return 0
+
+
+def normalize(args, bots: ResidentBots) -> int:
+    bot = bots.bot(args.book_file)
+    bot.compute_normalized_scores(min_number_reviews=args.min_number_reviews)
+    output_file = args.output_file or args.book_file
+    _write_book(bot, output_file, args.book_file)
+    bots.forget(args.book_file)
+    bots.written(output_file, bot)
+    print(f"{output_file}: {len(bot.index_paper_book().by_reviewer)} reviewers")
+
+    return 0
+
+
+def conflicts(args, bots: ResidentBots) -> int:
+    state = bots.service_state(args.book_file)
+    if args.paper_id:
+        paper_ids = args.paper_id
+    elif args.year is not None:
+        paper_ids = [paper.number for paper in state.index.papers_in_year(args.year)]
+    else:
+        paper_ids = [paper.number for paper in state.bot.paper_book.paper]
+
+    rows = []
+    for paper_id in paper_ids:
+        found = state.conflicts(paper_id)
+        if found is None:
+            print(paper_id + ": Paper not found.", file=sys.stderr)
+            return 1
+        rows.extend(dict(conflict, paper_id=paper_id) for conflict in found)
+
+    with contextlib.ExitStack() as stack:
+        if args.output_file:
+            output = stack.enter_context(open(args.output_file, "w", newline=""))
+        else:
+            output = sys.stdout
+        writer = csv.DictWriter(
+            output, fieldnames=CONFLICT_COLUMNS, lineterminator="\n"
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return 0
+
+
+def summaries(args, bots: ResidentBots) -> int:
+    bot = bots.bot(args.book_file)
+    summary = bot.summary_tables
+    if (
+        summary is None
+        or summary.min_number_reviews != args.min_number_reviews
+        or summary.min_verified_reviews != args.min_verified_reviews
+    ):
+        summary = bot.make_summary_tables(
+            min_number_reviews=args.min_number_reviews,
+            min_verified_reviews=args.min_verified_reviews,
+        )
+    os.makedirs(args.output_dir, exist_ok=True)
+    for path in summary.export(args.output_dir, prefix=args.prefix):
+        print(path)
+
+    return 0
+
+
+def export(args, bots: ResidentBots) -> int:
+    if not args.output_dir and not args.warm_start:
+        print("export needs --output-dir or --warm-start", file=sys.stderr)
+        return 1
+
+    bot = bots.bot(args.book_file)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for name, file_name in EXPORT_FILES.items():
+            path = os.path.join(args.output_dir, file_name.format(prefix=args.prefix))
+            getattr(bot, name + "_df").to_csv(path, na_rep="NA")
+            print(path)
+    if args.warm_start:
+        bot.write_warm_start(args.warm_start)
+        print(args.warm_start)
+
+    return 0
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="chandra-bot", description="Build and analyze paper books."
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run a worker that keeps loaded bots resident",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="the worker socket (default: $CHANDRA_BOT_SOCKET or a per-user "
+        "file in the temporary directory)",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        help="with --serve, a book file to load at start-up",
+    )
+    parser.add_argument("--stop", action="store_true", help="stop the worker")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="run the command in this process even if a worker is listening",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    build_parser = subparsers.add_parser(
+        "build", help="assemble a paper book from CSV files"
+    )
+    build_parser.add_argument("--paper-file", required=True)
+    build_parser.add_argument("--review-file", required=True)
+    build_parser.add_argument("--human-file", required=True)
+    build_parser.add_argument("--output-file", required=True)
+    build_parser.add_argument("--bulk", action="store_true")
+    build_parser.add_argument("--workers", type=int, default=1)
+    build_parser.add_argument("--human-registry", action="store_true")
+    build_parser.add_argument("--compress", action="store_true")
+    build_parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="write a warm-start snapshot instead of a paper book",
+    )
+    build_parser.set_defaults(run=build)
+
+    normalize_parser = subparsers.add_parser(
+        "normalize", help="compute normalized scores and write the book"
+    )
+    normalize_parser.add_argument("--book-file", required=True)
+    normalize_parser.add_argument("--min-number-reviews", type=int, default=10)
+    normalize_parser.add_argument(
+        "--output-file", help="default: overwrite the book file"
+    )
+    normalize_parser.set_defaults(run=normalize)
+
+    conflicts_parser = subparsers.add_parser(
+        "conflicts", help="list reviewers who have written with the authors"
+    )
+    conflicts_parser.add_argument("--book-file", required=True)
+    conflicts_parser.add_argument("--paper-id", action="append")
+    conflicts_parser.add_argument("--year", type=int)
+    conflicts_parser.add_argument("--output-file", help="default: standard output")
+    conflicts_parser.set_defaults(run=conflicts)
+
+    summaries_parser = subparsers.add_parser(
+        "summaries", help="write the summary CSV files for Tableau"
+    )
+    summaries_parser.add_argument("--book-file", required=True)
+    summaries_parser.add_argument("--output-dir", required=True)
+    summaries_parser.add_argument("--prefix", default="fake")
+    summaries_parser.add_argument("--min-number-reviews", type=int, default=10)
+    summaries_parser.add_argument("--min-verified-reviews", type=int, default=1)
+    summaries_parser.set_defaults(run=summaries)
+
+    export_parser = subparsers.add_parser(
+        "export", help="write the bot tables as CSV files or a snapshot"
+    )
+    export_parser.add_argument("--book-file", required=True)
+    export_parser.add_argument("--output-dir")
+    export_parser.add_argument("--prefix", default="fake")
+    export_parser.add_argument("--warm-start", help="a snapshot file to write")
+    export_parser.set_defaults(run=export)
+
+    return parser
+
+
+def run(argv: list, bots: ResidentBots) -> int:
+    """
+    Run one command in this process.
+
+    args:
+        argv: the command line arguments, without the program name
+        bots: the loaded bots to use
+
+    returns: the exit status
+    """
+    parser = make_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as error:
+        return error.code
+    if args.command is None:
+        parser.print_usage()
+        return 2
+
+    return args.run(args, bots)
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    # One request is a JSON line with argv and cwd. The reply is a JSON line
+    # with the exit status and the standard output and error of the command.
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        if request.get("stop"):
+            self.server.stopping = True
+            self._reply(0, "", "")
+            return
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        os.chdir(request["cwd"])
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                status = run(request["argv"], self.server.bots)
+            except Exception:
+                traceback.print_exc()
+                status = 1
+        self._reply(status, stdout.getvalue(), stderr.getvalue())
+
+    def _reply(self, status: int, stdout: str, stderr: str):
+        reply = {"status": status, "stdout": stdout, "stderr": stderr}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class Worker(socketserver.UnixStreamServer):
+    """
+    Runs commands sent by request over a Unix socket against resident
+    bots, one at a time, until a stop request.
+
+    Attributes:
+        bots (ResidentBots): the loaded bots
+    """
+
+    def __init__(self, socket_file: str, bots: ResidentBots = None):
+        if os.path.exists(socket_file):
+            os.remove(socket_file)
+        super().__init__(socket_file, _WorkerHandler)
+        self.bots = bots if bots is not None else ResidentBots()
+        self.stopping = False
+
+    def serve(self) -> None:
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            os.remove(self.server_address)
+
+
+def send(socket_file: str, request: dict) -> dict:
+    """
+    Send a request to a worker.
+
+    returns: the reply, or None if no worker is listening
+    """
+    if not os.path.exists(socket_file):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_file)
+    except OSError:
+        connection.close()
+        return None
+
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def _split_command(argv: list) -> list:
+    # the command starts at the first subcommand name that is not the value
+    # of a worker option
+    position = 0
+    while position < len(argv):
+        if argv[position] in COMMANDS:
+            return argv[position:]
+        position += 2 if argv[position] in ["--socket", "--preload"] else 1
+    return []
+
+
+def main(argv: list = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = make_parser().parse_args(argv)
+    socket_file = args.socket or default_socket()
+
+    if args.serve:
+        worker = Worker(socket_file)
+        for book_file in args.preload:
+            worker.bots.bot(book_file)
+        print(f"chandra-bot worker listening on {socket_file}")
+        sys.stdout.flush()
+        worker.serve()
+        return 0
+
+    if args.stop:
+        if send(socket_file, {"stop": True}) is None:
+            print(socket_file + ": No worker is listening.")
+            return 1
+        return 0
+
+    command_argv = _split_command(argv)
+    if not command_argv:
+        make_parser().print_usage()
+        return 2
+    if not args.local:
+        reply = send(socket_file, {"argv": command_argv, "cwd": os.getcwd()})
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            return reply["status"]
+
+    return run(command_argv, ResidentBots())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Compact, integer-coded versions of the paper, review, and human tables.
+
+The default ChandraBot schema stores every identifier as a string, so the
+same 40 character hash is repeated in every review and every join compares
+strings. The compact schema replaces identifiers with dense int32 codes held
+in shared IdDictionary objects, stores recommendations and decisions as
+categoricals whose codes match the protobuf enums, and replaces the
+comma-joined author_ids column with an exploded int32 link table.
+"""
+import numpy as np
+import pandas as pd
+
+PRESENTATION_REC_DTYPE = pd.CategoricalDtype(["Reject", "Accept", "None"])
+PUBLICATION_REC_DTYPE = pd.CategoricalDtype(
+    ["Reject", "Accept", "Accept_Correct", "None"]
+)
+
+
+class IdDictionary(object):
+    """
+    A dictionary that maps string identifiers to dense int32 codes.
+
+    Codes are assigned in order of first appearance and never change once
+    assigned, so a dictionary can be shared by every table that refers to
+    the same kind of identifier.
+    """
+
+    def __init__(self, values=None):
+        self.index = pd.Index([], dtype=object)
+        if values is not None:
+            self.add(values)
+
+    def __len__(self):
+        return len(self.index)
+
+    def add(self, values) -> None:
+        """
+        Add any identifiers not already in the dictionary.
+
+        args:
+            values: iterable of string identifiers; missing values are ignored
+        """
+        values = pd.Series(values, dtype=object).dropna().astype(str).unique()
+        new_values = pd.Index(values).difference(self.index, sort=False)
+        if len(new_values) > 0:
+            self.index = self.index.append(new_values)
+
+    def encode(self, values) -> np.ndarray:
+        """
+        Encode identifiers as int32 codes. Unknown identifiers map to -1.
+        """
+        return self.index.get_indexer(pd.Index(values, dtype=object)).astype(np.int32)
+
+    def decode(self, codes) -> np.ndarray:
+        """
+        Decode int32 codes back to identifiers. A code of -1 maps to None.
+        """
+        codes = np.asarray(codes)
+        output = np.full(len(codes), None, dtype=object)
+        known = codes >= 0
+        output[known] = self.index.values[codes[known]]
+        return output
+
+
+def as_categorical(series: pd.Series, dtype: pd.CategoricalDtype) -> pd.Series:
+    """
+    Map recommendation or decision labels onto a categorical dtype,
+    ignoring case.
+
+    args:
+        series: the labels
+        dtype: one of the recommendation dtypes; unknown or missing labels
+            become "None"
+
+    returns: the labels as a categorical Series
+    """
+    lookup = {category.lower(): category for category in dtype.categories}
+    labels = series.astype(object).str.lower().map(lookup).fillna("None")
+    return labels.astype(dtype)
+
+
+def recommendation_column(review_df: pd.DataFrame, name: str) -> str:
+    """
+    Find a recommendation column of review data. The REVIEW_DICT uses the
+    *_recommend spelling, the example files use *_recommendation; accept
+    either.
+
+    args:
+        review_df: review data
+        name: the *_recommend spelling, e.g. "presentation_recommend"
+
+    returns: the column name, or None if review_df has neither
+    """
+    for column in [name + "ation", name]:
+        if column in review_df.columns:
+            return column
+    return None
+
+
+def make_paper_author_df(paper_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Explode the comma-separated author_ids column into a link table.
+
+    args:
+        paper_df: paper data with paper_id (as a column or the index) and
+            author_ids columns
+
+    returns: a DataFrame with paper_id, author_position (zero-based), and
+        author_id (int32) columns, one row per paper author
+    """
+    if "paper_id" not in paper_df.columns:
+        paper_df = paper_df.reset_index()
+
+    author_ids = paper_df["author_ids"].astype(object).str.split(",")
+    link_df = (
+        pd.DataFrame({"paper_id": paper_df["paper_id"].values, "author_id": author_ids})
+        .explode("author_id")
+        .dropna(subset=["author_id"])
+    )
+    link_df["author_id"] = link_df["author_id"].str.strip()
+    link_df = link_df.loc[link_df["author_id"] != ""]
+    link_df["author_position"] = link_df.groupby(level=0).cumcount().astype(np.int32)
+    link_df["author_id"] = link_df["author_id"].astype(np.int32)
+
+    return link_df.reset_index(drop=True)[["paper_id", "author_position", "author_id"]]
+
+
+class CompactTables(object):
+    """
+    Integer-coded paper, review, human, and paper-author tables.
+
+    Attributes:
+        paper_ids (IdDictionary): codes for paper_id values
+
+        hash_ids (IdDictionary): codes for human hash_id values, shared by
+            authors and reviewers
+
+        paper_df (DataFrame): paper data keyed by paper_code
+
+        review_df (DataFrame): review data with paper_code and reviewer_code
+
+        human_df (DataFrame): human data with hash_code and a nullable
+            int32 author_id
+
+        paper_author_df (DataFrame): one row per paper author with
+            paper_code, author_position, author_id, and hash_code
+    """
+
+    def __init__(
+        self,
+        paper_df: pd.DataFrame,
+        review_df: pd.DataFrame,
+        human_df: pd.DataFrame,
+    ):
+        if "paper_id" not in paper_df.columns:
+            paper_df = paper_df.reset_index()
+
+        self.paper_ids = IdDictionary(paper_df["paper_id"])
+        self.paper_ids.add(review_df["paper_id"])
+        self.hash_ids = IdDictionary(human_df["hash_id"])
+        self.hash_ids.add(review_df["reviewer_human_hash_id"])
+
+        self.human_df = self._make_human_df(human_df)
+        self.paper_df = self._make_paper_df(paper_df)
+        self.review_df = self._make_review_df(review_df)
+        self.paper_author_df = self._make_paper_author_df(paper_df)
+
+    def _make_paper_df(self, paper_df: pd.DataFrame) -> pd.DataFrame:
+        output_df = pd.DataFrame(
+            {"paper_code": self.paper_ids.encode(paper_df["paper_id"])}
+        )
+        for column in paper_df.columns:
+            if column in ["paper_id", "authors", "author_ids"]:
+                continue
+            output_df[column] = paper_df[column].values
+
+        output_df["year"] = output_df["year"].astype(np.int16)
+        output_df["committee_presentation_decision"] = as_categorical(
+            output_df["committee_presentation_decision"], PRESENTATION_REC_DTYPE
+        )
+        output_df["committee_publication_decision"] = as_categorical(
+            output_df["committee_publication_decision"], PUBLICATION_REC_DTYPE
+        )
+
+        return output_df
+
+    def _make_review_df(self, review_df: pd.DataFrame) -> pd.DataFrame:
+        output_df = pd.DataFrame(
+            {
+                "paper_code": self.paper_ids.encode(review_df["paper_id"]),
+                "reviewer_code": self.hash_ids.encode(
+                    review_df["reviewer_human_hash_id"]
+                ),
+            }
+        )
+        for column in review_df.columns:
+            if column in ["paper_id", "reviewer_human_hash_id"]:
+                continue
+            output_df[column] = review_df[column].values
+
+        output_df["presentation_score"] = output_df["presentation_score"].astype(
+            np.float32
+        )
+        for name, dtype in [
+            ("presentation_recommend", PRESENTATION_REC_DTYPE),
+            ("publication_recommend", PUBLICATION_REC_DTYPE),
+        ]:
+            column = recommendation_column(review_df, name)
+            if column is not None:
+                output_df[column] = as_categorical(output_df[column], dtype)
+
+        return output_df
+
+    def _make_human_df(self, human_df: pd.DataFrame) -> pd.DataFrame:
+        output_df = pd.DataFrame(
+            {"hash_code": self.hash_ids.encode(human_df["hash_id"])}
+        )
+        for column in human_df.columns:
+            if column == "hash_id":
+                continue
+            output_df[column] = human_df[column].values
+
+        output_df["author_id"] = pd.to_numeric(
+            output_df["author_id"], errors="coerce"
+        ).astype("Int32")
+        output_df["verified"] = output_df["verified"].astype("boolean")
+
+        return output_df
+
+    def _make_paper_author_df(self, paper_df: pd.DataFrame) -> pd.DataFrame:
+        link_df = make_paper_author_df(paper_df)
+        author_df = self.human_df.loc[
+            self.human_df["author_id"].notna(), ["author_id", "hash_code"]
+        ].drop_duplicates(subset=["author_id"])
+
+        output_df = pd.DataFrame(
+            {
+                "paper_code": self.paper_ids.encode(link_df["paper_id"]),
+                "author_position": link_df["author_position"].values,
+                "author_id": link_df["author_id"].values,
+            }
+        )
+        hash_codes = pd.Series(
+            author_df["hash_code"].values,
+            index=author_df["author_id"].astype(np.int32).values,
+        )
+        output_df["hash_code"] = (
+            output_df["author_id"].map(hash_codes).fillna(-1).astype(np.int32)
+        )
+
+        return output_df
+
+    def memory_usage(self) -> dict:
+        """
+        Deep memory usage, in bytes, of each compact table and dictionary.
+        """
+        return {
+            "paper_df": int(self.paper_df.memory_usage(deep=True).sum()),
+            "review_df": int(self.review_df.memory_usage(deep=True).sum()),
+            "human_df": int(self.human_df.memory_usage(deep=True).sum()),
+            "paper_author_df": int(self.paper_author_df.memory_usage(deep=True).sum()),
+            "paper_ids": int(self.paper_ids.index.memory_usage(deep=True)),
+            "hash_ids": int(self.hash_ids.index.memory_usage(deep=True)),
+        }
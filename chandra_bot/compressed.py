@@ -0,0 +1,229 @@
+"""
+A compressed PaperBook container in which each Paper is a separate zstd
+frame, compressed with a dictionary trained on the papers of the book.
+
+The papers of a book repeat the same field names, Human messages, and
+phrases, so a shared dictionary compresses small records almost as well as
+compressing the whole book at once, while any one paper can still be read
+without decompressing the others. zstandard is an optional dependency:
+pip install zstandard.
+
+File layout, with little-endian integers:
+
+    b"CBZ1"
+    dictionary length (uint32), dictionary (empty if none was trained)
+    one zstd frame per paper
+    the human registry, a zstd frame of a PaperBook holding only humans
+        (absent if the book has no registry)
+    index: per paper, offset (uint64) and length (uint32) of its frame
+    paper numbers, joined by newlines, as UTF-8
+    index offset (uint64), number of papers (uint32),
+    paper number bytes (uint32), b"CBZ1"
+"""
+import struct
+
+from . import data_model_pb2 as dm
+
+MAGIC = b"CBZ1"
+_UINT32 = struct.Struct("<I")
+_ENTRY = struct.Struct("<QI")
+_FOOTER = struct.Struct("<QII4s")
+
+# zstd cannot train a dictionary from only a few samples
+MIN_TRAINING_PAPERS = 32
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "compressed paper books require zstandard: pip install zstandard"
+        )
+    return zstandard
+
+
+def is_compressed_book(book_file: str) -> bool:
+    """
+    returns: True if the file exists and is a compressed container
+    """
+    try:
+        with open(book_file, "rb") as file_pointer:
+            return file_pointer.read(len(MAGIC)) == MAGIC
+    except IOError:
+        return False
+
+
+def write_compressed_book(
+    paper_book: dm.PaperBook,
+    output_file: str,
+    level: int = 3,
+    dict_size: int = 112640,
+) -> int:
+    """
+    Write a PaperBook as a compressed container.
+
+    args:
+        paper_book: the book to write
+        output_file: the container file
+        level: zstd compression level
+        dict_size: maximum dictionary size in bytes; 0 for no dictionary
+
+    returns: the number of bytes written
+    """
+    zstd = _zstd()
+    records = [paper.SerializeToString() for paper in paper_book.paper]
+
+    dictionary = b""
+    if dict_size and len(records) >= MIN_TRAINING_PAPERS:
+        try:
+            dictionary = zstd.train_dictionary(dict_size, records).as_bytes()
+        except zstd.ZstdError:
+            dictionary = b""
+    if dictionary:
+        compressor = zstd.ZstdCompressor(
+            level=level, dict_data=zstd.ZstdCompressionDict(dictionary)
+        )
+    else:
+        compressor = zstd.ZstdCompressor(level=level)
+
+    with open(output_file, "wb") as file_pointer:
+        file_pointer.write(MAGIC + _UINT32.pack(len(dictionary)) + dictionary)
+        offset = len(MAGIC) + _UINT32.size + len(dictionary)
+        entries = []
+        for record in records:
+            frame = compressor.compress(record)
+            file_pointer.write(frame)
+            entries.append(_ENTRY.pack(offset, len(frame)))
+            offset += len(frame)
+
+        # the registry fills the space between the last paper and the index
+        if len(paper_book.humans):
+            registry = dm.PaperBook(humans=paper_book.humans)
+            frame = compressor.compress(registry.SerializeToString())
+            file_pointer.write(frame)
+            offset += len(frame)
+
+        numbers = "\n".join(paper.number for paper in paper_book.paper).encode()
+        file_pointer.write(b"".join(entries) + numbers)
+        file_pointer.write(_FOOTER.pack(offset, len(records), len(numbers), MAGIC))
+
+        return file_pointer.tell()
+
+
+class CompressedBookReader(object):
+    """
+    Random access to the papers of a compressed container.
+
+    Typical usage:
+
+        with CompressedBookReader("book.cbz") as reader:
+            paper = reader.paper("2021/345")
+            paper_book = reader.read_paper_book()
+
+    Attributes:
+        numbers (list): the paper numbers, in book order
+    """
+
+    def __init__(self, input_file: str):
+        zstd = _zstd()
+        self.file_pointer = open(input_file, "rb")
+        try:
+            self._read_index(zstd)
+        except Exception:
+            self.file_pointer.close()
+            raise
+
+    def _read_index(self, zstd) -> None:
+        file_pointer = self.file_pointer
+        if file_pointer.read(len(MAGIC)) != MAGIC:
+            raise ValueError("not a compressed paper book")
+        (dict_length,) = _UINT32.unpack(file_pointer.read(_UINT32.size))
+        dictionary = file_pointer.read(dict_length)
+        if dictionary:
+            self.decompressor = zstd.ZstdDecompressor(
+                dict_data=zstd.ZstdCompressionDict(dictionary)
+            )
+        else:
+            self.decompressor = zstd.ZstdDecompressor()
+
+        self.papers_offset = file_pointer.tell()
+        file_pointer.seek(-_FOOTER.size, 2)
+        index_offset, number_papers, numbers_length, magic = _FOOTER.unpack(
+            file_pointer.read(_FOOTER.size)
+        )
+        self.index_offset = index_offset
+        if magic != MAGIC:
+            raise ValueError("truncated compressed paper book")
+        file_pointer.seek(index_offset)
+        index = file_pointer.read(number_papers * _ENTRY.size)
+        self.entries = [
+            _ENTRY.unpack_from(index, i * _ENTRY.size) for i in range(number_papers)
+        ]
+        numbers = file_pointer.read(numbers_length).decode()
+        self.numbers = numbers.split("\n") if number_papers else []
+        self.positions = {number: i for i, number in enumerate(self.numbers)}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self.file_pointer.close()
+
+    def paper(self, key) -> dm.Paper:
+        """
+        args:
+            key: a paper number, or a position in the book
+
+        returns: the Paper, decompressed on its own
+        """
+        position = self.positions[key] if isinstance(key, str) else key
+        offset, length = self.entries[position]
+        self.file_pointer.seek(offset)
+        paper = dm.Paper()
+        paper.ParseFromString(
+            self.decompressor.decompress(self.file_pointer.read(length))
+        )
+        return paper
+
+    def read_humans(self, paper_book: dm.PaperBook = None) -> dm.PaperBook:
+        """
+        args:
+            paper_book: if set, the book to add the humans to
+
+        returns: a PaperBook with the human registry of the container
+        """
+        paper_book = dm.PaperBook() if paper_book is None else paper_book
+        if self.entries:
+            start = self.entries[-1][0] + self.entries[-1][1]
+        else:
+            start = self.papers_offset
+        if start < self.index_offset:
+            self.file_pointer.seek(start)
+            frame = self.file_pointer.read(self.index_offset - start)
+            paper_book.MergeFromString(self.decompressor.decompress(frame))
+        return paper_book
+
+    def read_paper_book(self) -> dm.PaperBook:
+        """
+        returns: a PaperBook with every paper and the human registry
+        """
+        paper_book = dm.PaperBook()
+        self.read_humans(paper_book)
+        if not self.entries:
+            return paper_book
+
+        start = self.entries[0][0]
+        end = self.entries[-1][0] + self.entries[-1][1]
+        self.file_pointer.seek(start)
+        data = self.file_pointer.read(end - start)
+        for offset, length in self.entries:
+            frame = data[offset - start : offset - start + length]
+            paper_book.paper.add().ParseFromString(self.decompressor.decompress(frame))
+        return paper_book
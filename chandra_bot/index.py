@@ -0,0 +1,122 @@
+"""
+Secondary indexes over the papers in a PaperBook.
+"""
+from . import data_model_pb2 as dm
+
+
+class PaperBookIndex(object):
+    """
+    Maps paper numbers, years, author hash IDs, and reviewer hash IDs to
+    positions in PaperBook.paper, so lookups do not scan the book.
+
+    Papers appended to the book are picked up by update. Edits that change
+    the papers already indexed (removing or reordering papers, or adding
+    authors or reviews to an indexed paper) need a rebuild.
+
+    Typical usage:
+
+        index = PaperBookIndex(bot.paper_book)
+        paper = index.paper("2021/345")
+        for paper, review in index.reviews_by_reviewer(hash_id):
+            ...
+
+    Attributes:
+        paper_book (PaperBook): the indexed book
+
+        by_number (dict): paper number to paper position
+
+        by_year (dict): year to a list of paper positions
+
+        by_author (dict): author hash_id to a list of paper positions
+
+        by_reviewer (dict): reviewer hash_id to a list of
+            (paper position, review position) tuples
+
+        indexed_papers (int): number of papers indexed so far
+    """
+
+    def __init__(self, paper_book: dm.PaperBook):
+        self.paper_book = paper_book
+        self.rebuild()
+
+    def __len__(self):
+        return self.indexed_papers
+
+    def rebuild(self) -> None:
+        """
+        Discard the indexes and index every paper in the book.
+        """
+        self.by_number = {}
+        self.by_year = {}
+        self.by_author = {}
+        self.by_reviewer = {}
+        self.indexed_papers = 0
+        self.update()
+
+    def update(self) -> int:
+        """
+        Index the papers appended to the book since the last update. The
+        indexes are rebuilt if the book has fewer papers than were indexed.
+
+        returns: the number of papers indexed
+        """
+        papers = self.paper_book.paper
+        if len(papers) < self.indexed_papers:
+            self.rebuild()
+            return self.indexed_papers
+
+        start = self.indexed_papers
+        for position in range(start, len(papers)):
+            paper = papers[position]
+            self.by_number[paper.number] = position
+            self.by_year.setdefault(paper.year, []).append(position)
+            for author in paper.authors:
+                self.by_author.setdefault(author.human.hash_id, []).append(position)
+            for review_position, review in enumerate(paper.reviews):
+                self.by_reviewer.setdefault(review.reviewer.human.hash_id, []).append(
+                    (position, review_position)
+                )
+        self.indexed_papers = len(papers)
+
+        return self.indexed_papers - start
+
+    def paper(self, number: str) -> dm.Paper:
+        """
+        returns: the paper with this number, or None
+        """
+        position = self.by_number.get(number)
+        if position is None:
+            return None
+        return self.paper_book.paper[position]
+
+    def papers_in_year(self, year: int) -> list:
+        """
+        returns: the papers from a year, in book order
+        """
+        papers = self.paper_book.paper
+        return [papers[position] for position in self.by_year.get(year, [])]
+
+    def papers_by_author(self, hash_id: str, year: int = None) -> list:
+        """
+        args:
+            hash_id: hash_id of the author
+            year: if given, only papers from this year
+
+        returns: the papers written by an author, in book order
+        """
+        papers = self.paper_book.paper
+        positions = self.by_author.get(hash_id, [])
+        if year is not None:
+            return [papers[p] for p in positions if papers[p].year == year]
+        return [papers[p] for p in positions]
+
+    def reviews_by_reviewer(self, hash_id: str) -> list:
+        """
+        returns: (paper, review) tuples for every review written by a
+            reviewer, in book order
+        """
+        papers = self.paper_book.paper
+        return [
+            (papers[p], papers[p].reviews[r])
+            for p, r in self.by_reviewer.get(hash_id, [])
+        ]
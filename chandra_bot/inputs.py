@@ -0,0 +1,132 @@
+"""
+Reading the paper, review, and human input tables.
+
+Inputs may be CSV files or RDS files written by the R scripts in
+src/scripts, so the yearly RDS files no longer need a CSV round trip.
+Each table may be split across several files, e.g. one per year: the
+files are read concurrently, each is cast to the table's schema (see
+ChandraBot.PAPER_DICT, REVIEW_DICT, and HUMAN_DICT), and the parts are
+concatenated once.
+
+RDS columns keep their R types, so they are cast to give the same
+DataFrame as reading the CSV with the schema: integer and whole-number
+columns become strings without a decimal point, and columns R left
+entirely NA become missing strings. pyreadr is an optional dependency:
+pip install pyreadr.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .lazy import np, pd
+
+RDS_SUFFIXES = (".rds",)
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def _pyreadr():
+    try:
+        import pyreadr
+    except ImportError:
+        raise ImportError("RDS inputs require pyreadr: pip install pyreadr")
+    return pyreadr
+
+
+def is_rds_file(input_file: str) -> bool:
+    return str(input_file).lower().endswith(RDS_SUFFIXES)
+
+
+def _as_strings(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.dropna()
+        if (values == np.floor(values)).all():
+            series = series.astype("Int64")
+    return series.astype(pd.StringDtype())
+
+
+def apply_schema(input_df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """
+    Cast the columns of an RDS table to the dtypes of a schema.
+
+    args:
+        input_df: the table as read from the RDS file
+        dtypes: the schema, e.g. ChandraBot.PAPER_DICT
+
+    returns: the cast table; columns not in the schema are kept as read
+    """
+    output_df = input_df.copy()
+    for column, dtype in dtypes.items():
+        if column not in output_df.columns:
+            continue
+        if isinstance(dtype, pd.StringDtype):
+            output_df[column] = _as_strings(output_df[column])
+        else:
+            output_df[column] = output_df[column].astype(dtype)
+
+    return output_df
+
+
+def read_rds(input_file: str, dtypes: dict = None) -> pd.DataFrame:
+    """
+    args:
+        input_file: an RDS file holding one data frame
+        dtypes: if set, the schema to cast the columns to
+
+    returns: the data frame, without R row names
+    """
+    input_df = _pyreadr().read_r(input_file)[None].reset_index(drop=True)
+    if dtypes is None:
+        return input_df
+
+    return apply_schema(input_df, dtypes)
+
+
+def read_input_file(input_file: str, dtypes: dict) -> pd.DataFrame:
+    """
+    returns: the table in a CSV or RDS file, with the schema dtypes
+    """
+    if is_rds_file(input_file):
+        return read_rds(input_file, dtypes)
+
+    return pd.read_csv(input_file, dtype=dtypes)
+
+
+def read_input_files(
+    input_files,
+    dtypes: dict,
+    index_col: str = None,
+    workers: int = 1,
+    executor: str = "thread",
+) -> pd.DataFrame:
+    """
+    Read a table split across CSV or RDS files.
+
+    args:
+        input_files: a file, or a list of files read in order
+        dtypes: the schema of the table
+        index_col: if set, the column to index the table by
+        workers: number of threads or processes reading files; 1 reads
+            them one after another
+        executor: "thread" or "process"
+
+    returns: the parts concatenated in order
+    """
+    if isinstance(input_files, str):
+        input_files = [input_files]
+    if executor not in EXECUTORS:
+        raise ValueError("executor must be 'thread' or 'process'")
+
+    if workers <= 1 or len(input_files) < 2:
+        parts = [read_input_file(input_file, dtypes) for input_file in input_files]
+    else:
+        with EXECUTORS[executor](max_workers=workers) as pool:
+            parts = list(
+                pool.map(read_input_file, input_files, [dtypes] * len(input_files))
+            )
+
+    output_df = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+    if index_col is not None:
+        output_df = output_df.set_index(index_col)
+
+    return output_df
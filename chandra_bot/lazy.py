@@ -0,0 +1,39 @@
+"""
+Deferred imports of heavy dependencies.
+
+pandas and NumPy take most of the time of importing chandra_bot, and jobs
+that only read a paper book or a warm-start snapshot never need them.
+Modules of the package bind pd and np from here instead of importing them,
+and the real module is imported on first attribute access. Annotations
+that name pd or np need "from __future__ import annotations".
+"""
+import importlib
+
+
+class LazyModule(object):
+    """
+    Stands in for a module that is imported on first attribute access.
+
+    Typical usage:
+
+        from .lazy import pd
+
+        def make_df(rows):
+            return pd.DataFrame(rows)
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
@@ -0,0 +1,228 @@
+"""
+Timing and memory instrumentation for ChandraBot methods.
+
+Every public ChandraBot method is wrapped with profiled. While no Profiler
+is attached the wrapper costs one attribute lookup and a comparison. Once a
+Profiler is attached, with ChandraBot.enable_profiling for one bot or by
+setting the ChandraBot.profiler class attribute for every bot and for the
+static constructors, each call records its wall time, CPU time, number of
+rows processed, and peak traced memory.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import time
+import tracemalloc
+
+from .lazy import pd
+
+
+class CallRecord(object):
+    """
+    The measurements for one call of an instrumented method.
+
+    Attributes:
+        method (str): name of the method
+        depth (int): 0 for a call made by the user, 1 for a call made by
+            another instrumented method, and so on
+        wall_time (float): elapsed seconds
+        cpu_time (float): process CPU seconds
+        rows (int): rows or messages processed, or None if the method does
+            not process records
+        peak_memory (int): peak bytes allocated during the call, above the
+            memory in use when it started, or None if memory is not traced
+        error (str): name of the exception raised by the call, or None
+    """
+
+    FIELDS = [
+        "method",
+        "depth",
+        "wall_time",
+        "cpu_time",
+        "rows",
+        "peak_memory",
+        "error",
+    ]
+
+    def __init__(self, method, depth, wall_time, cpu_time, rows, peak_memory, error):
+        self.method = method
+        self.depth = depth
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.rows = rows
+        self.peak_memory = peak_memory
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in CallRecord.FIELDS}
+
+    def __repr__(self):
+        return "CallRecord({})".format(
+            ", ".join("{}={!r}".format(k, v) for k, v in self.to_dict().items())
+        )
+
+
+class Profiler(object):
+    """
+    Collects a CallRecord for every instrumented call.
+
+    Typical usage:
+
+        profiler = bot.enable_profiling(log_file="profile.jsonl")
+        bot.assemble_paper_book()
+        bot.make_dataframe("review")
+        print(profiler.summary())
+
+    Attributes:
+        records (list): the CallRecord objects, in order of completion
+        log_file (str): if set, each record is also appended to this file
+            as one line of JSON
+        trace_memory (bool): if True, measure peak memory with tracemalloc.
+            Tracing slows Python allocation, so wall and CPU times measured
+            with it on are inflated.
+    """
+
+    def __init__(self, log_file: str = None, trace_memory: bool = True):
+        self.records = []
+        self.log_file = log_file
+        self.trace_memory = trace_memory
+        self._stack = []
+        self._started_tracing = False
+
+    def reset(self) -> None:
+        """
+        Discard the collected records.
+        """
+        self.records = []
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        returns: one row per call, in order of completion
+        """
+        return pd.DataFrame(
+            [record.to_dict() for record in self.records],
+            columns=CallRecord.FIELDS,
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Aggregate the records by method.
+
+        returns: a DataFrame indexed by method with the number of calls,
+           total and mean wall time, total CPU time, total rows, rows per
+           second, and the largest peak memory, slowest methods first
+        """
+        calls_df = self.to_dataframe()
+        summary_df = calls_df.groupby("method").agg(
+            calls=("wall_time", "size"),
+            wall_time=("wall_time", "sum"),
+            mean_wall_time=("wall_time", "mean"),
+            cpu_time=("cpu_time", "sum"),
+            rows=("rows", "sum"),
+            peak_memory=("peak_memory", "max"),
+        )
+        summary_df["rows_per_second"] = summary_df["rows"] / summary_df["wall_time"]
+
+        return summary_df.sort_values("wall_time", ascending=False)
+
+    def _enter(self) -> tuple:
+        current = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            # tracemalloc has a single peak counter. Carry the caller's peak
+            # so far on the stack before resetting it for this call.
+            if self._stack:
+                self._stack[-1][0] = max(self._stack[-1][0], peak)
+            tracemalloc.reset_peak()
+        self._stack.append([0, current])
+
+        return time.perf_counter(), time.process_time()
+
+    def _exit(self, method, start, count_rows, error) -> None:
+        wall_time = time.perf_counter() - start[0]
+        cpu_time = time.process_time() - start[1]
+        carried_peak, current = self._stack.pop()
+
+        peak_memory = None
+        if current is not None and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], carried_peak)
+            peak_memory = peak - current
+            if self._stack:
+                self._stack[-1][0] = max(self._stack[-1][0], peak)
+            elif self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        record = CallRecord(
+            method=method,
+            depth=len(self._stack),
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            rows=count_rows() if count_rows is not None else None,
+            peak_memory=peak_memory,
+            error=error,
+        )
+        self.records.append(record)
+
+        if self.log_file is not None:
+            with open(self.log_file, "a") as file_pointer:
+                file_pointer.write(json.dumps(record.to_dict()) + "\n")
+
+
+def _instance_profiler(args):
+    return args[0].profiler if args else None
+
+
+def profiled(rows=None, get_profiler=_instance_profiler):
+    """
+    Decorate a method so that calls are recorded by an attached Profiler.
+
+    args:
+        rows: optional function of (bot, result, arguments) returning the
+            number of rows processed, where arguments maps every parameter
+            name, defaults included, to its value. It is only called while
+            profiling.
+        get_profiler: function of the positional arguments returning the
+            Profiler or None. The default reads the profiler attribute of
+            the first argument; static methods supply their own.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            profiler = get_profiler(args)
+            if profiler is None:
+                return method(*args, **kwargs)
+
+            start = profiler._enter()
+            result = None
+            error = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            except BaseException as exception:
+                error = type(exception).__name__
+                raise
+            finally:
+                count_rows = None
+                if rows is not None and error is None:
+
+                    def count_rows():
+                        arguments = signature.bind(*args, **kwargs)
+                        arguments.apply_defaults()
+                        bot = args[0] if args else None
+                        return rows(bot, result, arguments.arguments)
+
+                profiler._exit(name, start, count_rows, error)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,510 @@
+"""
+A small declarative query API over the paper, review, and human tables.
+
+Queries are built with ChandraBot.query and only run when run is called,
+so the planner sees every filter and column before touching any data. It
+reads only the columns a query uses, applies each filter to its own table
+before any join, and, when the bot holds a PaperBook but no DataFrames,
+narrows the papers with the PaperBookIndex and extracts just the needed
+fields from them.
+
+Typical usage:
+
+    top_df = (
+        bot.query("reviews")
+        .filter("year", "==", 2020)
+        .filter("verified", "==", True)
+        .filter("papers_written_with_authors", "==", 0)
+        .group_by("paper_id")
+        .aggregate(mean_verified_score=("presentation_score", "mean"))
+        .having("mean_verified_score", ">", 3.5)
+        .run()
+    )
+"""
+from __future__ import annotations
+
+import operator
+
+from .lazy import pd
+from .profiling import profiled
+
+TABLES = ["papers", "reviews", "humans"]
+
+# tables each base table can reach, with the (left, right) join columns
+JOINS = {
+    "papers": {},
+    "reviews": {
+        "papers": ("paper_id", "paper_id"),
+        "humans": ("reviewer_human_hash_id", "hash_id"),
+    },
+    "humans": {},
+}
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, values: series.isin(values),
+    "not in": lambda series, values: ~series.isin(values),
+    "contains": lambda series, value: series.str.contains(value, regex=False),
+}
+
+PAPER_FIELDS = {
+    "paper_id": lambda paper: paper.number,
+    "authors": lambda paper: ",".join(a.human.name for a in paper.authors),
+    "title": lambda paper: paper.title,
+    "year": lambda paper: paper.year,
+    "committee_presentation_decision": (
+        lambda paper: paper.committee_presentation_decision
+    ),
+    "committee_publication_decision": (
+        lambda paper: paper.committee_publication_decision
+    ),
+    "abstract": lambda paper: paper.abstract.text,
+    "body": lambda paper: paper.body.text,
+    "mean_verified_score": lambda paper: paper.mean_verified_score,
+}
+
+REVIEW_FIELDS = {
+    "paper_id": lambda paper, review: paper.number,
+    "presentation_score": lambda paper, review: review.presentation_score,
+    "commentary_to_author": lambda paper, review: review.commentary_to_author.text,
+    "commentary_to_chair": lambda paper, review: review.commentary_to_chair.text,
+    "reviewer_human_hash_id": lambda paper, review: review.reviewer.human.hash_id,
+    "presentation_recommendation": (
+        lambda paper, review: review.presentation_recommend
+    ),
+    "publication_recommendation": lambda paper, review: review.publication_recommend,
+    "normalized_present_score": (lambda paper, review: review.normalized_present_score),
+    "papers_written_with_authors": (
+        lambda paper, review: review.papers_written_with_authors
+    ),
+    "mean_present_score": lambda paper, review: review.reviewer.mean_present_score,
+    "std_dev_present_score": (
+        lambda paper, review: review.reviewer.std_dev_present_score
+    ),
+    "number_of_reviews": lambda paper, review: review.reviewer.number_of_reviews,
+}
+
+HUMAN_FIELDS = {
+    "name": lambda human: human.name,
+    "aliases": lambda human: ",".join(human.aliases),
+    "hash_id": lambda human: human.hash_id,
+    "current_affiliation": lambda human: human.current_affiliation.name,
+    "previous_affiliation": (
+        lambda human: ",".join(a.name for a in human.previous_affiliation)
+    ),
+    "last_degree_affiliation": lambda human: human.last_degree_affiliation.name,
+    "orcid_url": lambda human: human.orcid_url,
+    "orcid": lambda human: human.orcid,
+}
+
+
+def _query_profiler(args):
+    return args[0].bot.profiler if args else None
+
+
+class Query(object):
+    """
+    A lazily evaluated query over one base table of a ChandraBot.
+
+    Columns are named as in the bot DataFrames. Columns of the tables a
+    base table joins to (papers and humans, from reviews) can be used
+    directly, or qualified as "papers.year" when a name is ambiguous.
+    Every builder method returns the query, so calls can be chained.
+
+    Attributes:
+        bot (ChandraBot): the bot to query
+
+        table (str): the base table, "papers", "reviews", or "humans"
+    """
+
+    def __init__(self, bot, table: str):
+        if table not in TABLES:
+            raise ValueError("table must be 'papers', 'reviews', or 'humans'")
+        self.bot = bot
+        self.table = table
+        self._filters = []
+        self._columns = None
+        self._group_by = []
+        self._aggregates = {}
+        self._having = []
+        self._order_by = []
+        self._limit = None
+
+    def filter(self, column: str, op: str, value):
+        """
+        Keep rows where column op value holds. op is one of ==, !=, <, <=,
+        >, >=, in, not in, or contains.
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"unknown operator: {op}")
+        table, column = self._resolve(column)
+        self._filters.append((table, column, op, value))
+        return self
+
+    def select(self, *columns):
+        """
+        Return only these columns, in this order.
+        """
+        self._columns = [self._resolve(column) for column in columns]
+        return self
+
+    def group_by(self, *columns):
+        self._group_by = [self._resolve(column) for column in columns]
+        return self
+
+    def aggregate(self, **aggregates):
+        """
+        Aggregate each group, with pandas named aggregations, e.g.
+        aggregate(n=("presentation_score", "size")).
+        """
+        for name, (column, function) in aggregates.items():
+            self._aggregates[name] = (self._resolve(column), function)
+        return self
+
+    def having(self, column: str, op: str, value):
+        """
+        Filter the aggregated rows.
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"unknown operator: {op}")
+        self._having.append((column, op, value))
+        return self
+
+    def order_by(self, column: str, ascending: bool = True):
+        self._order_by.append((column, ascending))
+        return self
+
+    def limit(self, number_rows: int):
+        self._limit = number_rows
+        return self
+
+    def _resolve(self, column: str) -> tuple:
+        # returns (table, column)
+        if "." in column:
+            table, name = column.split(".", 1)
+            if table != self.table and table not in JOINS[self.table]:
+                raise ValueError(f"{table} cannot be joined to {self.table}")
+            return table, name
+        for table in [self.table] + list(JOINS[self.table]):
+            if column in self._table_columns(table):
+                return table, column
+        raise ValueError(f"unknown column: {column}")
+
+    def _table_columns(self, table: str) -> list:
+        data_df = self._dataframe(table)
+        if data_df is not None:
+            columns = list(data_df.columns)
+            if data_df.index.name is not None:
+                columns.append(data_df.index.name)
+            return columns
+        if table == "papers":
+            return list(PAPER_FIELDS)
+        if table == "reviews":
+            return list(REVIEW_FIELDS)
+        return list(HUMAN_FIELDS) + ["verified"]
+
+    def _dataframe(self, table: str) -> pd.DataFrame:
+        # bots built from a PaperBook have no DataFrames until they are used;
+        # queries do not build them
+        name = {"papers": "paper", "reviews": "review", "humans": "human"}
+        return self.bot.materialized_dataframe(name[table])
+
+    def _needed_columns(self) -> dict:
+        needed = {self.table: []}
+        if self._columns is not None:
+            references = list(self._columns)
+        elif self._aggregates:
+            references = []
+        else:
+            references = [
+                (self.table, column) for column in self._table_columns(self.table)
+            ]
+        references += [(table, column) for table, column, _, _ in self._filters]
+        references += self._group_by
+        references += [reference for reference, _ in self._aggregates.values()]
+
+        for table, column in references:
+            columns = needed.setdefault(table, [])
+            if column not in columns:
+                columns.append(column)
+        for table in needed:
+            if table != self.table:
+                left, right = JOINS[self.table][table]
+                for owner, key in [(self.table, left), (table, right)]:
+                    if key not in needed[owner]:
+                        needed[owner].append(key)
+
+        return needed
+
+    def _use_book(self) -> bool:
+        return any(self._dataframe(table) is None for table in self._needed_columns())
+
+    def explain(self) -> list:
+        """
+        returns: the plan as a list of steps, in execution order
+        """
+        needed = self._needed_columns()
+        steps = []
+        if self._use_book():
+            for filter_ in self._index_filters():
+                steps.append("index lookup {}.{} {} {!r}".format(*filter_))
+            steps.append(
+                "extract {} from paper book: {}".format(
+                    self.table,
+                    ", ".join(f"{t}.{c}" for t in needed for c in needed[t]),
+                )
+            )
+            for table, column, op, value in self._filters:
+                steps.append(f"filter {table}.{column} {op} {value!r}")
+        else:
+            for table, columns in needed.items():
+                steps.append(f"scan {table}: {', '.join(columns)}")
+                for f_table, column, op, value in self._filters:
+                    if f_table == table:
+                        steps.append(f"filter {table}.{column} {op} {value!r}")
+            for table in needed:
+                if table != self.table:
+                    steps.append(
+                        "{} join {} on {}".format(
+                            self._join_type(table), table, JOINS[self.table][table]
+                        )
+                    )
+        if self._group_by or self._aggregates:
+            steps.append(
+                "aggregate {} by {}".format(
+                    ", ".join(self._aggregates),
+                    ", ".join(column for _, column in self._group_by) or "all rows",
+                )
+            )
+        for column, op, value in self._having:
+            steps.append(f"having {column} {op} {value!r}")
+        if self._order_by:
+            steps.append(f"order by {self._order_by}")
+        if self._limit is not None:
+            steps.append(f"limit {self._limit}")
+
+        return steps
+
+    def _join_type(self, table: str) -> str:
+        filtered = any(f_table == table for f_table, _, _, _ in self._filters)
+        return "inner" if filtered else "left"
+
+    def _index_filters(self) -> list:
+        # filters the PaperBookIndex can answer
+        keys = {
+            ("papers", "paper_id"),
+            ("papers", "year"),
+            ("reviews", "paper_id"),
+            ("reviews", "reviewer_human_hash_id"),
+            ("humans", "hash_id"),
+        }
+        return [
+            (table, column, op, value)
+            for table, column, op, value in self._filters
+            if (table, column) in keys and op in ["==", "in"]
+        ]
+
+    @profiled(
+        rows=lambda query, result, arguments: len(result),
+        get_profiler=_query_profiler,
+    )
+    def run(self) -> pd.DataFrame:
+        """
+        Plan and execute the query.
+
+        returns: a DataFrame with the selected or aggregated columns
+        """
+        if self._use_book():
+            output_df = self._run_book()
+        else:
+            output_df = self._run_dataframes()
+
+        if self._group_by or self._aggregates:
+            aggregates = {
+                name: (column, function)
+                for name, ((_, column), function) in self._aggregates.items()
+            }
+            if self._group_by:
+                output_df = (
+                    output_df.groupby([column for _, column in self._group_by])
+                    .agg(**aggregates)
+                    .reset_index()
+                )
+            else:
+                output_df = pd.DataFrame(
+                    [
+                        {
+                            name: output_df[column].agg(function)
+                            for name, (column, function) in aggregates.items()
+                        }
+                    ]
+                )
+        elif self._columns is not None:
+            output_df = output_df[[column for _, column in self._columns]]
+
+        for column, op, value in self._having:
+            output_df = output_df.loc[OPERATORS[op](output_df[column], value)]
+        if self._order_by:
+            output_df = output_df.sort_values(
+                [column for column, _ in self._order_by],
+                ascending=[ascending for _, ascending in self._order_by],
+            )
+        if self._limit is not None:
+            output_df = output_df.head(self._limit)
+
+        return output_df.reset_index(drop=True)
+
+    def _scan(self, table: str, columns: list) -> pd.DataFrame:
+        data_df = self._dataframe(table)
+        filters = [
+            (column, op, value)
+            for f_table, column, op, value in self._filters
+            if f_table == table
+        ]
+
+        # an equality filter on the index column is a lookup, not a scan
+        index_name = data_df.index.name
+        for column, op, value in filters:
+            if column == index_name and op in ["==", "in"]:
+                values = [value] if op == "==" else list(value)
+                data_df = data_df.loc[data_df.index.intersection(values)]
+        if index_name in columns:
+            data_df = data_df.reset_index()
+
+        data_df = data_df[columns]
+        for column, op, value in filters:
+            data_df = data_df.loc[OPERATORS[op](data_df[column], value)]
+
+        return data_df
+
+    def _run_dataframes(self) -> pd.DataFrame:
+        needed = self._needed_columns()
+        output_df = self._scan(self.table, needed[self.table])
+        for table, columns in needed.items():
+            if table == self.table:
+                continue
+            left, right = JOINS[self.table][table]
+            joined_df = self._scan(table, columns).drop_duplicates(subset=[right])
+            if left != right:
+                joined_df = joined_df.rename(columns={right: left})
+            output_df = output_df.merge(
+                joined_df,
+                how=self._join_type(table),
+                on=left,
+                suffixes=("", f"_{table}"),
+            )
+
+        return output_df
+
+    def _candidate_positions(self):
+        # paper positions, or (paper, review) positions for reviews, that
+        # satisfy the index filters; None when every paper is a candidate
+        index = self.bot.index_paper_book()
+        papers = None
+        reviews = None
+        for table, column, op, value in self._index_filters():
+            values = [value] if op == "==" else list(value)
+            if column == "paper_id":
+                found = {index.by_number[v] for v in values if v in index.by_number}
+            elif column == "year":
+                found = {p for v in values for p in index.by_year.get(v, [])}
+            elif column == "reviewer_human_hash_id":
+                pairs = {pr for v in values for pr in index.by_reviewer.get(v, [])}
+                reviews = pairs if reviews is None else reviews & pairs
+                found = {p for p, _ in pairs}
+            else:
+                found = {p for v in values for p in index.by_author.get(v, [])}
+                found |= {p for v in values for p, _ in index.by_reviewer.get(v, [])}
+            papers = found if papers is None else papers & found
+
+        if papers is None:
+            papers = range(len(self.bot.paper_book.paper))
+        else:
+            papers = sorted(papers)
+
+        return papers, reviews
+
+    def _run_book(self) -> pd.DataFrame:
+        needed = self._needed_columns()
+        for table, columns in needed.items():
+            fields = {
+                "papers": PAPER_FIELDS,
+                "reviews": REVIEW_FIELDS,
+                "humans": list(HUMAN_FIELDS) + ["verified"],
+            }[table]
+            for column in columns:
+                if column not in fields:
+                    raise ValueError(f"{table}.{column} is not in the paper book")
+        paper_columns = needed.get("papers", [])
+        human_columns = needed.get("humans", [])
+        positions, review_positions = self._candidate_positions()
+        book = self.bot.paper_book
+        resolve = self.bot.resolve_human
+
+        def paper_value(paper, column):
+            # authors and reviewers may hold only the hash_id of a registry
+            # entry; see chandra_bot.registry
+            if column == "authors":
+                return ",".join(resolve(a.human).name for a in paper.authors)
+            return PAPER_FIELDS[column](paper)
+
+        rows = []
+        if self.table == "papers":
+            for p in positions:
+                paper = book.paper[p]
+                rows.append([paper_value(paper, c) for c in paper_columns])
+            columns = paper_columns
+        elif self.table == "reviews":
+            review_columns = needed["reviews"]
+            for p in positions:
+                paper = book.paper[p]
+                for r, review in enumerate(paper.reviews):
+                    if review_positions is not None and (p, r) not in review_positions:
+                        continue
+                    rows.append(
+                        [REVIEW_FIELDS[c](paper, review) for c in review_columns]
+                        + [paper_value(paper, c) for c in paper_columns]
+                        + [
+                            review.reviewer.verified
+                            if c == "verified"
+                            else HUMAN_FIELDS[c](resolve(review.reviewer.human))
+                            for c in human_columns
+                        ]
+                    )
+            columns = review_columns + paper_columns + human_columns
+        else:
+            # authors carry no verified flag, so a human first seen as an
+            # author takes it from a later review, as in make_dataframe
+            found = {}
+            for p in positions:
+                paper = book.paper[p]
+                people = [(author.human, None) for author in paper.authors] + [
+                    (review.reviewer.human, review.reviewer.verified)
+                    for review in paper.reviews
+                ]
+                for human, verified in people:
+                    row = found.get(human.hash_id)
+                    if row is None:
+                        found[human.hash_id] = [
+                            verified
+                            if c == "verified"
+                            else HUMAN_FIELDS[c](resolve(human))
+                            for c in human_columns
+                        ]
+                    elif verified is not None and "verified" in human_columns:
+                        row[human_columns.index("verified")] = verified
+            rows = list(found.values())
+            columns = human_columns
+
+        # duplicated join keys appear once; the planner added them to both
+        output_df = pd.DataFrame(rows, columns=columns)
+        output_df = output_df.loc[:, ~output_df.columns.duplicated()]
+        for _, column, op, value in self._filters:
+            output_df = output_df.loc[OPERATORS[op](output_df[column], value)]
+
+        return output_df
@@ -0,0 +1,118 @@
+"""
+The human registry schema mode of a PaperBook.
+
+By default every Author and Reviewer embeds a full Human, so a person with
+200 reviews is stored 200 times. With a registry, PaperBook.humans holds
+each person once and the Human of each Author and Reviewer holds only the
+hash_id of the registry entry. Code that reads only hash_id works on both
+modes; other Human fields are read through ChandraBot.resolve_human.
+
+The embedded copies of one person differ only in how missing values are
+spelled: an Author gets "<NA>" (or "nan") for a missing last degree
+affiliation and keeps an "NA" alias, a Reviewer gets an empty affiliation
+and drops the alias. A person's registry entry is therefore their first
+Author copy if they author any paper in the book, and their first Reviewer
+copy otherwise; reviewer_human derives the Reviewer copy from it, so
+embed_humans restores both kinds of copies.
+"""
+from . import data_model_pb2 as dm
+
+MISSING_AFFILIATIONS = ("<NA>", "nan")
+
+
+def has_human_registry(paper_book: dm.PaperBook) -> bool:
+    return len(paper_book.humans) > 0
+
+
+def make_registry(reviewer_humans, author_humans) -> list:
+    """
+    args:
+        reviewer_humans: the embedded Human of each Reviewer
+        author_humans: the embedded Human of each Author
+
+    returns: one Human per hash_id, sorted by hash_id
+    """
+    humans = {}
+    for human in author_humans:
+        if human.hash_id:
+            humans.setdefault(human.hash_id, human)
+    for human in reviewer_humans:
+        if human.hash_id:
+            humans.setdefault(human.hash_id, human)
+
+    return [humans[hash_id] for hash_id in sorted(humans)]
+
+
+def reviewer_human(human: dm.Human) -> dm.Human:
+    """
+    args:
+        human: a registry entry or an embedded Author copy
+
+    returns: the Human as it is embedded in a Reviewer
+    """
+    output_human = dm.Human()
+    output_human.CopyFrom(human)
+    if output_human.last_degree_affiliation.name in MISSING_AFFILIATIONS:
+        output_human.last_degree_affiliation.name = ""
+    aliases = [alias for alias in output_human.aliases if alias != "NA"]
+    del output_human.aliases[:]
+    output_human.aliases.extend(aliases)
+    return output_human
+
+
+def _people(paper_book: dm.PaperBook):
+    reviewers = [
+        review.reviewer for paper in paper_book.paper for review in paper.reviews
+    ]
+    authors = [author for paper in paper_book.paper for author in paper.authors]
+    return reviewers, authors
+
+
+def deduplicate_humans(paper_book: dm.PaperBook) -> dm.PaperBook:
+    """
+    Convert a book with embedded humans to the registry mode.
+
+    returns: a new PaperBook; a copy if the book already has a registry
+    """
+    output_book = dm.PaperBook()
+    output_book.CopyFrom(paper_book)
+    if has_human_registry(output_book):
+        return output_book
+
+    reviewers, authors = _people(output_book)
+    registry = make_registry(
+        [reviewer.human for reviewer in reviewers],
+        [author.human for author in authors],
+    )
+    output_book.humans.extend(registry)
+    for person in reviewers + authors:
+        if person.human.hash_id:
+            person.human.CopyFrom(dm.Human(hash_id=person.human.hash_id))
+
+    return output_book
+
+
+def embed_humans(paper_book: dm.PaperBook) -> dm.PaperBook:
+    """
+    Convert a book in the registry mode to one with embedded humans.
+
+    returns: a new PaperBook; a copy if the book has no registry
+    """
+    output_book = dm.PaperBook()
+    output_book.CopyFrom(paper_book)
+    registry = {human.hash_id: human for human in output_book.humans}
+    reviewers, authors = _people(output_book)
+    for person in authors:
+        human = registry.get(person.human.hash_id)
+        if human is not None:
+            person.human.CopyFrom(human)
+    reviewer_humans = {}
+    for person in reviewers:
+        hash_id = person.human.hash_id
+        if hash_id in registry:
+            if hash_id not in reviewer_humans:
+                reviewer_humans[hash_id] = reviewer_human(registry[hash_id])
+            person.human.CopyFrom(reviewer_humans[hash_id])
+    del output_book.humans[:]
+
+    return output_book
@@ -0,0 +1,263 @@
+"""
+Inter-rater agreement of the review panel and the reliability of each
+reviewer.
+
+Panel metrics, over the papers with at least two scored reviews:
+
+    krippendorff_alpha  Krippendorff's alpha with the interval metric
+    icc                 the one-way random effects intraclass correlation,
+                        ICC(1), with the group size adjusted for papers
+                        with different numbers of reviews
+    recommend_consistency
+                        the share of (accept, reject) presentation
+                        recommendation pairs by the same reviewer in which
+                        the accepted paper got the higher score, ties
+                        counting half
+
+Reviewer metrics compare each score with the consensus, the mean score of
+the other reviewers of the same paper (the leave-one-out paper mean):
+the Pearson correlation, the mean absolute deviation, and the mean signed
+deviation (bias). recommend_consistency is also given per reviewer.
+
+Every metric is a grouped reduction with np.bincount over integer paper
+and reviewer codes, so 100,000 reviews take well under a second.
+"""
+from __future__ import annotations
+
+from .lazy import np, pd
+
+# codes of the PRESENTATION_REC enum
+RECOMMEND_REJECT = 0
+RECOMMEND_ACCEPT = 1
+
+REVIEWER_RELIABILITY_COLUMNS = [
+    "number_of_consensus_reviews",
+    "consensus_correlation",
+    "consensus_mean_abs_deviation",
+    "consensus_bias",
+    "recommend_consistency",
+]
+
+PAPER_AGREEMENT_COLUMNS = ["number_of_reviews", "mean_score", "std_dev_score"]
+
+
+def _sums(codes: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    return np.bincount(codes, weights=values, minlength=size)
+
+
+def _divide(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator != 0, numerator / denominator, np.nan)
+
+
+def krippendorff_alpha(paper_codes: np.ndarray, scores: np.ndarray) -> float:
+    """
+    args:
+        paper_codes: the paper of each score, as integer codes
+        scores: the scores
+
+    returns: Krippendorff's alpha with the interval metric
+    """
+    counts = np.bincount(paper_codes)
+    pairable = counts[paper_codes] > 1
+    paper_codes = paper_codes[pairable]
+    scores = scores[pairable]
+    n = len(scores)
+    if n < 2:
+        return np.nan
+
+    # the sum of squared differences over ordered pairs of m values is
+    # 2 * (m * sum(x^2) - sum(x)^2)
+    m = counts[counts > 1].astype(np.float64)
+    sum_x = _sums(paper_codes, scores, len(counts))[counts > 1]
+    sum_x2 = _sums(paper_codes, scores**2, len(counts))[counts > 1]
+    observed = np.sum(2 * (m * sum_x2 - sum_x**2) / (m - 1)) / n
+    expected = 2 * (n * np.sum(scores**2) - np.sum(scores) ** 2) / (n * (n - 1))
+
+    return float(1 - _divide(observed, expected))
+
+
+def icc(paper_codes: np.ndarray, scores: np.ndarray) -> float:
+    """
+    args:
+        paper_codes: the paper of each score, as integer codes
+        scores: the scores
+
+    returns: ICC(1) over the papers with at least two scores
+    """
+    counts = np.bincount(paper_codes)
+    keep = counts[paper_codes] > 1
+    paper_codes = np.unique(paper_codes[keep], return_inverse=True)[1]
+    scores = scores[keep]
+    m = np.bincount(paper_codes).astype(np.float64)
+    papers, n = len(m), len(scores)
+    if papers < 2:
+        return np.nan
+
+    means = _sums(paper_codes, scores, papers) / m
+    between = np.sum(m * (means - scores.mean()) ** 2) / (papers - 1)
+    within = np.sum((scores - means[paper_codes]) ** 2) / (n - papers)
+    group_size = (n - np.sum(m**2) / n) / (papers - 1)
+
+    return float(_divide(between - within, between + (group_size - 1) * within))
+
+
+def paper_agreement_df(
+    paper_ids: np.ndarray, paper_codes: np.ndarray, scores: np.ndarray
+) -> pd.DataFrame:
+    """
+    returns: number_of_reviews, mean_score, and std_dev_score (sample) of
+        each paper, indexed by paper_id
+    """
+    size = len(paper_ids)
+    count = np.bincount(paper_codes, minlength=size).astype(np.float64)
+    mean = _divide(_sums(paper_codes, scores, size), count)
+    squares = _sums(paper_codes, (scores - mean[paper_codes]) ** 2, size)
+
+    return pd.DataFrame(
+        {
+            "number_of_reviews": count.astype(np.int64),
+            "mean_score": mean,
+            "std_dev_score": np.sqrt(_divide(squares, count - 1)),
+        },
+        index=pd.Index(paper_ids, name="paper_id"),
+    )
+
+
+def _recommend_ranks(reviewer_codes, scores, recommends):
+    # the within-reviewer ranks of the scores of accepted and rejected
+    # papers, ties sharing their average rank
+    rated = (recommends == RECOMMEND_ACCEPT) | (recommends == RECOMMEND_REJECT)
+    ranks = (
+        pd.Series(scores[rated])
+        .groupby(reviewer_codes[rated])
+        .rank(method="average")
+        .to_numpy()
+    )
+    return reviewer_codes[rated], ranks, recommends[rated] == RECOMMEND_ACCEPT
+
+
+def reviewer_reliability_df(
+    reviewer_ids: np.ndarray,
+    paper_codes: np.ndarray,
+    reviewer_codes: np.ndarray,
+    scores: np.ndarray,
+    recommends: np.ndarray,
+) -> tuple:
+    """
+    args:
+        reviewer_ids: the hash_id of each reviewer code
+        paper_codes, reviewer_codes: the paper and reviewer of each score
+        scores: the scores
+        recommends: the PRESENTATION_REC code of each review
+
+    returns: a DataFrame with the REVIEWER_RELIABILITY_COLUMNS indexed by
+        hash_id, and the panel recommend_consistency
+    """
+    size = len(reviewer_ids)
+    paper_count = np.bincount(paper_codes)
+    paper_sum = _sums(paper_codes, scores, len(paper_count))
+
+    # the consensus of each review: the mean of the other scores of its paper
+    shared = paper_count[paper_codes] > 1
+    codes = reviewer_codes[shared]
+    x = scores[shared]
+    y = (paper_sum[paper_codes[shared]] - x) / (paper_count[paper_codes[shared]] - 1)
+
+    n = np.bincount(codes, minlength=size).astype(np.float64)
+    sum_x, sum_y = _sums(codes, x, size), _sums(codes, y, size)
+    covariance = n * _sums(codes, x * y, size) - sum_x * sum_y
+    variance_x = n * _sums(codes, x**2, size) - sum_x**2
+    variance_y = n * _sums(codes, y**2, size) - sum_y**2
+    with np.errstate(invalid="ignore"):
+        correlation = _divide(covariance, np.sqrt(variance_x * variance_y))
+
+    rated_codes, ranks, accepted = _recommend_ranks(reviewer_codes, scores, recommends)
+    number_accepted = np.bincount(rated_codes[accepted], minlength=size)
+    number_rejected = np.bincount(rated_codes[~accepted], minlength=size)
+    rank_sums = _sums(rated_codes[accepted], ranks[accepted], size)
+    # Mann-Whitney U of the accepted scores
+    ordered_pairs = rank_sums - number_accepted * (number_accepted + 1) / 2
+    pairs = (number_accepted * number_rejected).astype(np.float64)
+
+    reviewer_df = pd.DataFrame(
+        {
+            "number_of_consensus_reviews": n.astype(np.int64),
+            "consensus_correlation": correlation,
+            "consensus_mean_abs_deviation": _divide(
+                _sums(codes, np.abs(x - y), size), n
+            ),
+            "consensus_bias": _divide(sum_x - sum_y, n),
+            "recommend_consistency": _divide(ordered_pairs, pairs),
+        },
+        index=pd.Index(reviewer_ids, name="hash_id"),
+    )
+    panel_consistency = float(_divide(np.sum(ordered_pairs), np.sum(pairs)))
+
+    return reviewer_df, panel_consistency
+
+
+class ReliabilityTables(object):
+    """
+    Panel agreement and reviewer reliability of a set of reviews.
+
+    Typical usage:
+
+        reliability = bot.make_reliability_tables()
+        reliability.krippendorff_alpha
+        reliability.reviewer_df.sort_values("consensus_correlation")
+
+    Attributes:
+        krippendorff_alpha (float): interval alpha of the whole panel
+
+        icc (float): ICC(1) of the whole panel
+
+        recommend_consistency (float): recommendation consistency of the
+            whole panel
+
+        paper_df (DataFrame): PAPER_AGREEMENT_COLUMNS, indexed by paper_id
+
+        reviewer_df (DataFrame): REVIEWER_RELIABILITY_COLUMNS, indexed by
+            reviewer hash_id
+    """
+
+    def __init__(self, paper_ids, reviewer_ids, scores, recommends):
+        """
+        args:
+            paper_ids: the paper_id of each review
+            reviewer_ids: the reviewer hash_id of each review
+            scores: the presentation score of each review; reviews without
+                a score are skipped
+            recommends: the PRESENTATION_REC code of each review
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        scored = ~np.isnan(scores)
+        scores = scores[scored]
+        recommends = np.asarray(recommends, dtype=np.int64)[scored]
+        paper_codes, paper_uniques = pd.factorize(np.asarray(paper_ids)[scored])
+        reviewer_codes, reviewer_uniques = pd.factorize(
+            np.asarray(reviewer_ids)[scored]
+        )
+
+        self.krippendorff_alpha = krippendorff_alpha(paper_codes, scores)
+        self.icc = icc(paper_codes, scores)
+        self.paper_df = paper_agreement_df(
+            np.asarray(paper_uniques), paper_codes, scores
+        )
+        self.reviewer_df, self.recommend_consistency = reviewer_reliability_df(
+            np.asarray(reviewer_uniques),
+            paper_codes,
+            reviewer_codes,
+            scores,
+            recommends,
+        )
+
+    def panel(self) -> dict:
+        """
+        returns: the panel metrics by name
+        """
+        return {
+            "krippendorff_alpha": self.krippendorff_alpha,
+            "icc": self.icc,
+            "recommend_consistency": self.recommend_consistency,
+        }
@@ -0,0 +1,127 @@
+"""
+Reviewer score statistics over a trailing window of paper years.
+
+Reviewers drift: a reviewer who scored generously in 2019 may be strict by
+2023, so normalizing a review against every score the reviewer has ever
+given mixes scoring habits. The windowed normalization instead uses the
+reviewer's scores from the papers of the window years up to and including
+the year of the review's paper.
+
+Scores are first aggregated into a table with one row per (reviewer, year)
+holding the number of scores, their sum, and the sum of their squares.
+Window statistics are differences of cumulative sums over that table, so
+they cost one pass regardless of the window length. Because the window
+only looks back, a new review cycle only adds its year's rows to the
+table, and the reviews of earlier years keep their statistics.
+"""
+from __future__ import annotations
+
+from .lazy import np, pd
+
+REVIEWER_YEAR_COLUMNS = ["number_of_reviews", "score_sum", "score_sum_squares"]
+
+STATS_COLUMNS = ["mean_present_score", "std_dev_present_score", "number_of_reviews"]
+
+
+def aggregate_reviewer_years(reviewer_ids, years, scores) -> pd.DataFrame:
+    """
+    args:
+        reviewer_ids: the reviewer hash_id of each score
+        years: the paper year of each score
+        scores: the presentation scores; missing scores are skipped
+
+    returns: a DataFrame indexed by reviewer_id and year with the
+        REVIEWER_YEAR_COLUMNS
+    """
+    scores_df = pd.DataFrame(
+        {
+            "reviewer_id": np.asarray(reviewer_ids, dtype=object),
+            "year": np.asarray(years, dtype=np.int64),
+            "score": np.asarray(scores, dtype=np.float64),
+        }
+    ).dropna(subset=["score"])
+    scores_df["score_squared"] = scores_df["score"] ** 2
+    grouped = scores_df.groupby(["reviewer_id", "year"])
+
+    return pd.DataFrame(
+        {
+            "number_of_reviews": grouped["score"].count(),
+            "score_sum": grouped["score"].sum(),
+            "score_sum_squares": grouped["score_squared"].sum(),
+        }
+    )
+
+
+def update_reviewer_years(
+    reviewer_year_df: pd.DataFrame, slice_df: pd.DataFrame, years: list
+) -> pd.DataFrame:
+    """
+    Replace the rows of some years in an aggregate table.
+
+    args:
+        reviewer_year_df: the aggregate table, or None
+        slice_df: the aggregate of every score of the years
+        years: the years aggregated in slice_df
+
+    returns: the updated table, sorted by reviewer_id and year
+    """
+    if reviewer_year_df is None:
+        return slice_df.sort_index()
+
+    kept_df = reviewer_year_df.loc[
+        ~reviewer_year_df.index.get_level_values("year").isin(years)
+    ]
+    return pd.concat([kept_df, slice_df]).sort_index()
+
+
+def window_stats(reviewer_year_df: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    args:
+        reviewer_year_df: an aggregate table, see aggregate_reviewer_years
+        window: number of years in the window, counting the current one
+
+    returns: a DataFrame with the index of the table and the STATS_COLUMNS,
+        the mean, sample standard deviation, and number of the reviewer's
+        scores from year - window + 1 to year
+    """
+    table_df = reviewer_year_df.sort_index()
+    if len(table_df) == 0:
+        return pd.DataFrame(columns=STATS_COLUMNS, index=table_df.index)
+    reviewers = pd.factorize(table_df.index.get_level_values("reviewer_id"))[0]
+    years = table_df.index.get_level_values("year").to_numpy(dtype=np.int64)
+
+    # rows are sorted by (reviewer, year), so one global cumulative sum
+    # serves every reviewer: a window is the rows from the first row of the
+    # reviewer inside it to the current row
+    sums = np.cumsum(table_df[REVIEWER_YEAR_COLUMNS].to_numpy(np.float64), axis=0)
+    sums = np.vstack([np.zeros((1, len(REVIEWER_YEAR_COLUMNS))), sums])
+    span = years.max() - years.min() + window + 1
+    keys = reviewers * span + years - years.min()
+    starts = np.searchsorted(keys, keys - window, side="right")
+    count, total, total_squares = (sums[1:] - sums[starts]).T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        variance = np.maximum(total_squares - total * mean, 0) / (count - 1)
+        std = np.where(count > 1, np.sqrt(variance), np.nan)
+
+    return pd.DataFrame(
+        {
+            "mean_present_score": mean,
+            "std_dev_present_score": std,
+            "number_of_reviews": count.astype(np.int64),
+        },
+        index=table_df.index,
+    )
+
+
+def lookup_stats(stats_df: pd.DataFrame, reviewer_ids, years) -> pd.DataFrame:
+    """
+    returns: the rows of window_stats for each (reviewer, year) pair, in
+        order, with missing values for pairs without scores
+    """
+    keys = pd.MultiIndex.from_arrays(
+        [np.asarray(reviewer_ids, dtype=object), np.asarray(years, dtype=np.int64)],
+        names=stats_df.index.names,
+    )
+    return stats_df.reindex(keys)
@@ -0,0 +1,308 @@
+"""
+Packing accepted papers into lectern and poster sessions.
+
+Each session has a capacity and a time slot. A schedule puts every paper
+in one session and is scored by
+
+    topic_weight * topic_cost + clash_weight * author_clashes
+
+where topic_cost counts the pairs of papers in the same session with
+different topics, so sessions stay on one topic where the capacities
+allow, and author_clashes counts, for every author and time slot, the
+sessions of that slot holding the author's papers beyond the first, since
+an author cannot be in two rooms at once.
+
+The solver places the papers greedily, the largest topics first, each in
+the session where it adds the least cost. A local search then moves
+single papers to sessions with room and swaps pairs of papers between
+sessions while that lowers the cost. The change in topic_cost of every
+candidate move of a paper is computed at once with NumPy; author clashes
+are kept in per-author counters and only checked for the candidates whose
+topic change, plus every clash the move could remove, is an improvement.
+"""
+from __future__ import annotations
+
+import time
+
+from .lazy import np, pd
+
+SESSION_COLUMNS = ["slot", "capacity", "number_of_papers", "number_of_topics"]
+
+
+class _State(object):
+    # The assignment and its cost, updated incrementally
+
+    def __init__(self, topics, authors, capacities, slots, number_topics):
+        self.topics = topics
+        self.authors = authors
+        self.capacities = capacities
+        self.slots = slots
+        self.session_of = np.full(len(topics), -1)
+        self.sizes = np.zeros(len(capacities), dtype=np.int64)
+        self.topic_counts = np.zeros((len(capacities), number_topics), np.int64)
+        # (author, slot) -> {session: number of the author's papers}
+        self.author_sessions = {}
+        self.slot_sessions = {
+            slot: np.flatnonzero(slots == slot) for slot in np.unique(slots)
+        }
+        self.topic_cost = 0
+        self.author_clashes = 0
+
+    def add(self, paper: int, session: int):
+        topic = self.topics[paper]
+        self.topic_cost += self.sizes[session] - self.topic_counts[session, topic]
+        self.sizes[session] += 1
+        self.topic_counts[session, topic] += 1
+        self.session_of[paper] = session
+        for author in self.authors[paper]:
+            counts = self.author_sessions.setdefault((author, self.slots[session]), {})
+            if session not in counts:
+                self.author_clashes += len(counts) > 0
+                counts[session] = 0
+            counts[session] += 1
+
+    def remove(self, paper: int) -> int:
+        session = self.session_of[paper]
+        topic = self.topics[paper]
+        self.sizes[session] -= 1
+        self.topic_counts[session, topic] -= 1
+        self.topic_cost -= self.sizes[session] - self.topic_counts[session, topic]
+        self.session_of[paper] = -1
+        for author in self.authors[paper]:
+            counts = self.author_sessions[(author, self.slots[session])]
+            counts[session] -= 1
+            if counts[session] == 0:
+                del counts[session]
+                self.author_clashes -= len(counts) > 0
+        return session
+
+    def clashes_added(self, paper: int) -> np.ndarray:
+        # the clashes added by putting the paper in each session
+        added = np.zeros(len(self.capacities), dtype=np.int64)
+        for author in self.authors[paper]:
+            for slot, slot_sessions in self.slot_sessions.items():
+                counts = self.author_sessions.get((author, slot))
+                if counts:
+                    added[slot_sessions] += 1
+                    added[list(counts)] -= 1
+        return added
+
+    def clashes_removed(self) -> np.ndarray:
+        # the clashes removed by taking each paper out of its session
+        removed = np.zeros(len(self.topics), dtype=np.int64)
+        for paper, authors in enumerate(self.authors):
+            session = self.session_of[paper]
+            for author in authors:
+                counts = self.author_sessions[(author, self.slots[session])]
+                removed[paper] += counts[session] == 1 and len(counts) > 1
+        return removed
+
+
+class Schedule(object):
+    """
+    Session assignments of papers, found by a greedy start and a local
+    search.
+
+    Typical usage:
+
+        session_df = pd.DataFrame(
+            {"capacity": [8] * 20 + [40] * 3, "slot": ...}, index=names
+        )
+        schedule = bot.schedule_sessions(session_df, year=2023)
+        schedule.paper_df.groupby("session")["topic"].nunique()
+
+    Attributes:
+        paper_df (DataFrame): the session, slot, and topic of each paper,
+            indexed by paper_id
+
+        session_df (DataFrame): the SESSION_COLUMNS of each session
+
+        objective (float): the cost of the schedule
+
+        greedy_objective (float): the cost of the greedy start
+
+        topic_cost (int): pairs of papers in a session with different topics
+
+        author_clashes (int): extra sessions of a slot with the same author
+
+        number_of_moves (int): improving moves and swaps applied
+
+        runtime (float): seconds spent solving
+    """
+
+    def __init__(
+        self,
+        paper_ids,
+        topics,
+        authors,
+        session_df: pd.DataFrame,
+        topic_weight: float = 1.0,
+        clash_weight: float = 100.0,
+        time_limit: float = 5.0,
+        seed: int = None,
+    ):
+        """
+        args:
+            paper_ids: the paper_id of each paper
+            topics: the topic of each paper; see ChandraBot.cluster_paper_topics
+            authors: the author hash_ids of each paper
+            session_df: one row per session, indexed by session name, with
+                a capacity column and an optional slot column; sessions
+                without a slot are all in one slot
+            topic_weight, clash_weight: the weights of the objective
+            time_limit: the longest the local search runs, in seconds
+            seed: seed of the order in which papers are tried
+        """
+        start_time = time.perf_counter()
+        capacities = session_df["capacity"].to_numpy(np.int64)
+        if len(paper_ids) > capacities.sum():
+            raise ValueError(
+                f"{len(paper_ids)} papers do not fit in {capacities.sum()} places"
+            )
+        if "slot" in session_df.columns:
+            slot_values = session_df["slot"].to_numpy()
+        else:
+            slot_values = np.zeros(len(session_df), dtype=np.int64)
+        topic_codes = pd.factorize(np.asarray(topics))[0]
+        author_codes = {}
+        author_lists = [
+            [author_codes.setdefault(author, len(author_codes)) for author in set(a)]
+            for a in authors
+        ]
+
+        self._topic_weight = topic_weight
+        self._clash_weight = clash_weight
+        state = _State(
+            topic_codes,
+            author_lists,
+            capacities,
+            pd.factorize(slot_values)[0],
+            topic_codes.max() + 1 if len(topic_codes) else 0,
+        )
+
+        self._place_greedily(state)
+        self.greedy_objective = self._objective(state)
+        self.number_of_moves = self._search(
+            state, np.random.default_rng(seed), start_time + time_limit
+        )
+
+        self.objective = self._objective(state)
+        self.topic_cost = int(state.topic_cost)
+        self.author_clashes = int(state.author_clashes)
+        session_names = session_df.index.to_numpy()
+        self.paper_df = pd.DataFrame(
+            {
+                "session": session_names[state.session_of],
+                "slot": slot_values[state.session_of],
+                "topic": np.asarray(topics),
+            },
+            index=pd.Index(np.asarray(paper_ids), name="paper_id"),
+        )
+        self.session_df = pd.DataFrame(
+            {
+                "slot": slot_values,
+                "capacity": capacities,
+                "number_of_papers": state.sizes,
+                "number_of_topics": (state.topic_counts > 0).sum(axis=1),
+            },
+            index=session_df.index,
+        )
+        self.runtime = time.perf_counter() - start_time
+
+    def _objective(self, state: _State) -> float:
+        return float(
+            self._topic_weight * state.topic_cost
+            + self._clash_weight * state.author_clashes
+        )
+
+    def _place_greedily(self, state: _State):
+        topic_sizes = np.bincount(state.topics)
+        order = np.lexsort(
+            (
+                -np.array([len(a) for a in state.authors]),
+                state.topics,
+                -topic_sizes[state.topics],
+            )
+        )
+        for paper in order:
+            topic = state.topics[paper]
+            cost = (
+                self._topic_weight * (state.sizes - state.topic_counts[:, topic])
+                + self._clash_weight * state.clashes_added(paper)
+            ).astype(np.float64)
+            cost[state.sizes >= state.capacities] = np.inf
+            state.add(paper, int(np.argmin(cost)))
+
+    def _search(self, state: _State, rng, deadline: float) -> int:
+        moves = 0
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            removed = state.clashes_removed()
+            for paper in rng.permutation(len(state.topics)):
+                if time.perf_counter() > deadline:
+                    break
+                if self._improve(state, paper, removed):
+                    moves += 1
+                    improved = True
+                    removed = state.clashes_removed()
+        return moves
+
+    def _improve(self, state: _State, paper: int, removed: np.ndarray) -> bool:
+        # try the moves and swaps of one paper, the most promising first,
+        # and apply the first that lowers the cost
+        session = state.session_of[paper]
+        topic = state.topics[paper]
+        topics, sessions = state.topics, state.session_of
+        counts, sizes = state.topic_counts, state.sizes
+
+        # the topic cost change of moving the paper to each session, and
+        # of swapping it with each other paper
+        leave = sizes[session] - counts[session, topic]
+        move_cost = sizes - counts[:, topic] - leave
+        same = topics == topic
+        swap_cost = (
+            (sizes[session] - 1 - (counts[session, topics] - same))
+            - leave
+            + (sizes[sessions] - 1 - (counts[sessions, topic] - same))
+            - (sizes[sessions] - counts[sessions, topics])
+        )
+        swap_cost[same] = 0
+
+        # the costs if every clash the papers are in went away
+        move_bound = (
+            self._topic_weight * move_cost - self._clash_weight * removed[paper]
+        ).astype(np.float64)
+        move_bound[
+            (sizes >= state.capacities) | (np.arange(len(sizes)) == session)
+        ] = np.inf
+        swap_bound = (
+            self._topic_weight * swap_cost
+            - self._clash_weight * (removed[paper] + removed)
+        ).astype(np.float64)
+        swap_bound[sessions == session] = np.inf
+
+        bounds = np.concatenate([move_bound, swap_bound])
+        candidates = np.flatnonzero(bounds < 0)
+        before = self._objective(state)
+        for candidate in candidates[np.argsort(bounds[candidates], kind="stable")]:
+            if candidate < len(sizes):
+                state.remove(paper)
+                state.add(paper, candidate)
+                if self._objective(state) < before - 1e-9:
+                    return True
+                state.remove(paper)
+                state.add(paper, session)
+            else:
+                other = candidate - len(sizes)
+                other_session = state.remove(other)
+                state.remove(paper)
+                state.add(paper, other_session)
+                state.add(other, session)
+                if self._objective(state) < before - 1e-9:
+                    return True
+                state.remove(paper)
+                state.remove(other)
+                state.add(paper, session)
+                state.add(other, other_session)
+        return False
@@ -0,0 +1,294 @@
+"""
+An asyncio HTTP service that serves paper summaries, reviewer summaries,
+and conflict checks as JSON for the committee dashboard.
+
+The PaperBook is read once and its index, reviewer statistics, and
+reviewer collaboration histories are kept in memory, so most requests are
+dictionary lookups answered on the event loop. Requests that scan many papers, and reloading the book, run in a
+thread pool so the loop keeps serving other requests. aiohttp is an
+optional dependency: pip install aiohttp.
+
+Endpoints:
+
+    GET  /health
+    GET  /papers?year=2020            summaries of the papers in a year
+    GET  /papers/{paper_id}           one paper summary, e.g. /papers/2020/17
+    GET  /reviewers/{hash_id}         one reviewer summary
+    GET  /conflicts/{paper_id}        reviewers of a paper who have written
+                                      with its authors
+    POST /refresh                     re-read the book file
+
+Typical usage:
+
+    python -m chandra_bot.service --book-file book.bin --port 8080
+
+Normalized scores are given, as in SummaryTables, only for reviewers with
+at least --min-number-reviews reviews (default 10).
+"""
+import argparse
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .chandra_bot import ChandraBot
+
+
+def _number(value):
+    # JSON has no NaN
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return float(value)
+
+
+class ServiceState(object):
+    """
+    The in-memory data behind the service: the bot, its PaperBookIndex,
+    reviewer statistics, and the collaboration history of every reviewer.
+    A refresh builds a new state and swaps it in whole.
+
+    Attributes:
+        min_number_reviews (int): reviewers with fewer reviews get no
+            normalized scores
+    """
+
+    def __init__(self, bot: ChandraBot, min_number_reviews: int = 10):
+        self.bot = bot
+        self.min_number_reviews = min_number_reviews
+        self.index = bot.index_paper_book()
+        self.reviewer_stats = self._make_reviewer_stats()
+        # built here rather than on the first conflict check, which runs on
+        # the event loop
+        self.collaborations = {
+            hash_id: bot._collaborations(self.index, hash_id)
+            for hash_id in self.index.by_reviewer
+        }
+
+    @staticmethod
+    def from_file(book_file: str, min_number_reviews: int = 10):
+        bot = ChandraBot.read_paper_book(book_file)
+        return ServiceState(bot, min_number_reviews)
+
+    def _make_reviewer_stats(self) -> dict:
+        stats = {}
+        for hash_id, positions in self.index.by_reviewer.items():
+            scores = np.array(
+                [
+                    self.bot.paper_book.paper[p].reviews[r].presentation_score
+                    for p, r in positions
+                ],
+                dtype=float,
+            )
+            stats[hash_id] = {
+                "number_of_reviews": len(scores),
+                "mean_present_score": float(scores.mean()),
+                "std_dev_present_score": (
+                    float(scores.std(ddof=1)) if len(scores) > 1 else None
+                ),
+            }
+        return stats
+
+    def _normalized(self, review) -> float:
+        stats = self.reviewer_stats[review.reviewer.human.hash_id]
+        if (
+            stats["number_of_reviews"] < self.min_number_reviews
+            or not stats["std_dev_present_score"]
+        ):
+            return None
+        return (review.presentation_score - stats["mean_present_score"]) / stats[
+            "std_dev_present_score"
+        ]
+
+    def paper_summary(self, paper_id: str) -> dict:
+        paper = self.index.paper(paper_id)
+        if paper is None:
+            return None
+
+        scores = [review.presentation_score for review in paper.reviews]
+        normalized = [self._normalized(review) for review in paper.reviews]
+        normalized = [value for value in normalized if value is not None]
+        verified = [r.presentation_score for r in paper.reviews if r.reviewer.verified]
+        return {
+            "paper_id": paper.number,
+            "title": paper.title,
+            "year": paper.year,
+            "authors": [
+                self.bot.resolve_human(author.human).name for author in paper.authors
+            ],
+            "committee_presentation_decision": paper.committee_presentation_decision,
+            "committee_publication_decision": paper.committee_publication_decision,
+            "number_of_reviews": len(scores),
+            "mean_score": _number(np.mean(scores)) if scores else None,
+            "mean_normalized_score": (
+                _number(np.mean(normalized)) if normalized else None
+            ),
+            "mean_verified_score": _number(np.mean(verified)) if verified else None,
+            "number_of_conflicts": len(self.conflicts(paper_id)),
+        }
+
+    def year_summaries(self, year: int) -> list:
+        return [
+            self.paper_summary(paper.number)
+            for paper in self.index.papers_in_year(year)
+        ]
+
+    def reviewer_summary(self, hash_id: str) -> dict:
+        stats = self.reviewer_stats.get(hash_id)
+        if stats is None:
+            return None
+
+        reviews = self.index.reviews_by_reviewer(hash_id)
+        reviewer = reviews[0][1].reviewer
+        return dict(
+            stats,
+            hash_id=hash_id,
+            name=self.bot.resolve_human(reviewer.human).name,
+            verified=any(review.reviewer.verified for _, review in reviews),
+            paper_ids=[paper.number for paper, _ in reviews],
+        )
+
+    def conflicts(self, paper_id: str) -> list:
+        paper = self.index.paper(paper_id)
+        if paper is None:
+            return None
+
+        conflicts = []
+        for review in paper.reviews:
+            hash_id = review.reviewer.human.hash_id
+            for author in paper.authors:
+                found = self.collaborations[hash_id].get(author.human.hash_id)
+                if found is not None and found[1] <= paper.year:
+                    conflicts.append(
+                        {
+                            "reviewer_hash_id": hash_id,
+                            "author_hash_id": author.human.hash_id,
+                            "papers_written": found[0],
+                            "year_first_collab": found[1],
+                        }
+                    )
+        return conflicts
+
+
+class BotService(object):
+    """
+    The aiohttp application around a ServiceState.
+
+    Attributes:
+        book_file (str): the PaperBook file served, re-read on refresh
+
+        state (ServiceState): the current in-memory data
+
+        executor (ThreadPoolExecutor): runs the scans and reloads
+
+        min_number_reviews (int): reviewers with fewer reviews get no
+            normalized scores
+    """
+
+    def __init__(
+        self,
+        book_file: str = None,
+        bot: ChandraBot = None,
+        workers=4,
+        min_number_reviews: int = 10,
+    ):
+        self.book_file = book_file
+        self.min_number_reviews = min_number_reviews
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        if bot is not None:
+            self.state = ServiceState(bot, min_number_reviews)
+        else:
+            self.state = ServiceState.from_file(book_file, min_number_reviews)
+
+    def make_app(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.add_routes(
+            [
+                web.get("/health", self.health),
+                web.get("/papers", self.papers),
+                web.get("/papers/{paper_id:.+}", self.paper),
+                web.get("/reviewers/{hash_id}", self.reviewer),
+                web.get("/conflicts/{paper_id:.+}", self.conflicts),
+                web.post("/refresh", self.refresh),
+            ]
+        )
+        app.on_cleanup.append(self._shutdown)
+        return app
+
+    async def _shutdown(self, app):
+        self.executor.shutdown(wait=False)
+
+    async def _offload(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    @staticmethod
+    def _json(data, not_found: str = None):
+        from aiohttp import web
+
+        if data is None:
+            return web.json_response({"error": not_found}, status=404)
+        return web.json_response(data)
+
+    async def health(self, request):
+        return self._json(
+            {"status": "ok", "papers": len(self.state.bot.paper_book.paper)}
+        )
+
+    async def papers(self, request):
+        from aiohttp import web
+
+        try:
+            year = int(request.query["year"])
+        except (KeyError, ValueError):
+            return web.json_response({"error": "year is required"}, status=400)
+        return self._json(await self._offload(self.state.year_summaries, year))
+
+    async def paper(self, request):
+        paper_id = request.match_info["paper_id"]
+        return self._json(self.state.paper_summary(paper_id), "paper not found")
+
+    async def reviewer(self, request):
+        hash_id = request.match_info["hash_id"]
+        return self._json(self.state.reviewer_summary(hash_id), "reviewer not found")
+
+    async def conflicts(self, request):
+        paper_id = request.match_info["paper_id"]
+        return self._json(self.state.conflicts(paper_id), "paper not found")
+
+    async def refresh(self, request):
+        from aiohttp import web
+
+        if self.book_file is None:
+            return web.json_response({"error": "no book file"}, status=400)
+        self.state = await self._offload(
+            ServiceState.from_file, self.book_file, self.min_number_reviews
+        )
+        return self._json(
+            {"status": "refreshed", "papers": len(self.state.bot.paper_book.paper)}
+        )
+
+
+def main():
+    from aiohttp import web
+
+    parser = argparse.ArgumentParser(description="Serve bot queries over HTTP.")
+    parser.add_argument("--book-file", required=True)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--min-number-reviews", type=int, default=10)
+    args = parser.parse_args()
+
+    service = BotService(
+        book_file=args.book_file,
+        workers=args.workers,
+        min_number_reviews=args.min_number_reviews,
+    )
+    web.run_app(service.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
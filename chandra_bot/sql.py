@@ -0,0 +1,179 @@
+"""
+SQL over the bot tables with an embedded DuckDB database.
+
+The paper, review, and human DataFrames are registered with DuckDB, which
+scans them in place rather than copying, and each table is a SQL view over
+its registered frame. DuckDB does not scan a DataFrame index, so a
+paper_df indexed by paper_id is registered as is, next to a one-column
+frame of its index, and the papers view joins the two by position. The
+derived reviewer statistics and conflict tables are SQL views over the
+tables. Queries run multi-threaded inside the process and need no server or
+network access. DuckDB is an optional dependency: pip install duckdb.
+
+Typical usage:
+
+    bot.sql(
+        '''
+        SELECT p.year, avg(r.presentation_score) AS mean_score
+        FROM reviews r JOIN papers p USING (paper_id)
+        GROUP BY p.year ORDER BY p.year
+        '''
+    )
+"""
+from __future__ import annotations
+
+from .lazy import pd
+
+DERIVED_VIEWS = {
+    "reviewer_stats": """
+        SELECT
+            reviewer_human_hash_id AS hash_id,
+            avg(presentation_score) AS mean_present_score,
+            stddev_samp(presentation_score) AS std_dev_present_score,
+            count(presentation_score) AS number_of_reviews
+        FROM reviews
+        GROUP BY reviewer_human_hash_id
+    """,
+    "paper_authors": """
+        SELECT l.paper_id, l.author_position, l.author_id, h.hash_id
+        FROM paper_author_links l
+        LEFT JOIN (
+            SELECT DISTINCT TRY_CAST(author_id AS INTEGER) AS author_id, hash_id
+            FROM humans
+            WHERE author_id IS NOT NULL
+        ) h USING (author_id)
+    """,
+    "collaborations": """
+        SELECT
+            a.hash_id,
+            b.hash_id AS coauthor_hash_id,
+            count(*) AS papers_written,
+            min(p.year) AS year_first_collab
+        FROM paper_authors a
+        JOIN paper_authors b ON a.paper_id = b.paper_id AND a.hash_id <> b.hash_id
+        JOIN papers p ON p.paper_id = a.paper_id
+        GROUP BY a.hash_id, b.hash_id
+    """,
+    "conflicts": """
+        SELECT
+            r.paper_id,
+            r.reviewer_human_hash_id,
+            a.hash_id AS author_hash_id,
+            c.papers_written,
+            c.year_first_collab
+        FROM reviews r
+        JOIN papers p ON p.paper_id = r.paper_id
+        JOIN paper_authors a ON a.paper_id = r.paper_id
+        JOIN collaborations c
+            ON c.hash_id = r.reviewer_human_hash_id
+            AND c.coauthor_hash_id = a.hash_id
+        WHERE c.year_first_collab <= p.year
+    """,
+}
+
+
+class SqlView(object):
+    """
+    An in-memory DuckDB connection with the tables of a ChandraBot
+    registered as views.
+
+    Views:
+        papers, reviews, humans: the bot's paper_df, review_df, and
+            human_df, with paper_id as a column
+
+        paper_author_links: the bot's paper_author_df
+
+        reviewer_stats: mean, standard deviation, and number of
+            presentation scores per reviewer hash_id
+
+        paper_authors: paper_author_links with each author's hash_id
+
+        collaborations: papers written together and the year of the first
+            one, for every pair of coauthors
+
+        conflicts: one row per review and paper author the reviewer had
+            written with by the year of the paper
+
+    Attributes:
+        bot (ChandraBot): the bot whose tables are exposed
+
+        connection (DuckDBPyConnection): the DuckDB connection
+    """
+
+    def __init__(self, bot, threads: int = None):
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError("SqlView requires duckdb: pip install duckdb")
+
+        self.bot = bot
+        self.connection = duckdb.connect(database=":memory:")
+        if threads is not None:
+            self.connection.execute(f"SET threads TO {int(threads)}")
+        self._registered = {}
+        self.refresh()
+        for name, query in DERIVED_VIEWS.items():
+            self.connection.execute(f"CREATE VIEW {name} AS {query}")
+
+    def _tables(self) -> dict:
+        # read only: a bot built from a PaperBook builds its lazy tables on
+        # first access, and no table is assigned to the bot here
+        bot = self.bot
+        tables = {
+            "papers": bot.paper_df,
+            "reviews": bot.review_df,
+            "humans": bot.human_df,
+            "paper_author_links": bot.paper_author_df,
+        }
+        for name, data_df in tables.items():
+            if data_df is None:
+                raise ValueError(f"the bot has no table for the {name} view")
+
+        return tables
+
+    def refresh(self) -> list:
+        """
+        Re-register any bot table that has been replaced since it was last
+        registered, as most bot methods replace rather than modify their
+        DataFrames.
+
+        returns: the names of the re-registered tables
+        """
+        refreshed = []
+        for name, data_df in self._tables().items():
+            if self._registered.get(name) is data_df:
+                continue
+            self.connection.register(f"{name}_data", data_df)
+            if "paper_id" not in data_df.columns and data_df.index.name == "paper_id":
+                self.connection.register(
+                    f"{name}_index", pd.DataFrame({"paper_id": data_df.index})
+                )
+                query = (
+                    f"SELECT i.paper_id, d.* FROM {name}_index i "
+                    f"POSITIONAL JOIN {name}_data d"
+                )
+            else:
+                query = f"SELECT * FROM {name}_data"
+            self.connection.execute(f"CREATE OR REPLACE VIEW {name} AS {query}")
+            self._registered[name] = data_df
+            refreshed.append(name)
+
+        return refreshed
+
+    def execute(self, query: str, parameters: list = None) -> pd.DataFrame:
+        """
+        Run a SQL query against the current bot tables.
+
+        args:
+            query: DuckDB SQL
+            parameters: optional values for ? placeholders in the query
+
+        returns: the result as a DataFrame
+        """
+        self.refresh()
+        if parameters is None:
+            return self.connection.execute(query).df()
+        return self.connection.execute(query, parameters).df()
+
+    def close(self) -> None:
+        self.connection.close()
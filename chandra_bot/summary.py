@@ -0,0 +1,415 @@
+"""
+Reviewer and paper summary tables, kept up to date as reviews and papers
+change, and their export to the CSV files read by the Tableau workbooks in
+notebooks/.
+
+The summaries are built once from the bot DataFrames. After that, apply
+recomputes only the rows that depend on the changed reviews and papers: the
+statistics of the reviewers whose scores changed, the normalized scores and
+conflict counts of those reviewers' reviews, and the aggregates of the
+papers those reviews belong to.
+"""
+from __future__ import annotations
+
+import os
+
+from .lazy import np, pd
+
+REVIEW_KEYS = ["paper_id", "reviewer_human_hash_id"]
+
+# the columns of the paper and review series CSV files in examples/
+PAPER_SERIES_COLUMNS = [
+    "paper_id",
+    "authors",
+    "author_ids",
+    "title",
+    "year",
+    "committee_presentation_decision",
+    "committee_publication_decision",
+    "abstract",
+    "body",
+]
+
+REVIEW_SERIES_COLUMNS = [
+    "paper_id",
+    "presentation_score",
+    "commentary_to_author",
+    "commentary_to_chair",
+    "reviewer_human_hash_id",
+    "presentation_recommendation",
+    "publication_recommendation",
+]
+
+REVIEWER_COLUMNS = [
+    "number_of_reviews",
+    "mean_present_score",
+    "std_dev_present_score",
+    "verified",
+]
+
+REVIEW_COLUMNS = ["normalized_present_score", "papers_written_with_authors"]
+
+PAPER_COLUMNS = [
+    "number_of_reviews",
+    "mean_score",
+    "mean_normalized_score",
+    "mean_verified_score",
+    "mean_verified_normalized_score",
+    "number_of_conflicts",
+]
+
+# the files written for the workbooks in notebooks/. The reduced workbooks
+# read the reduced files under these names; the full files are named after
+# their workbooks with a prefix such as "fake", so they do not overwrite the
+# {prefix}_paper_series.csv and {prefix}_review_series.csv inputs.
+TABLEAU_FILES = {
+    "paper-summaries": "{prefix}-paper-summaries.csv",
+    "paper-summaries-reduced": "tableau-reduced-papers.csv",
+    "reviewer-summaries": "{prefix}-reviewer-summaries.csv",
+    "reviewer-summaries-reduced": "tableau-reduced-reviews.csv",
+}
+
+# summary columns under the names used by the reduced reviewer workbook
+REDUCED_REVIEW_NAMES = {
+    "number_of_reviews": "total_reviews",
+    "mean_present_score": "reviewer_mean_score",
+    "std_dev_present_score": "reviewer_sd_score",
+    "score_diff_mean": "score_diff_mean",
+    "normalized_present_score": "score_dist_mean",
+    "papers_written_with_authors": "sum_coauthor_count",
+    "verified": "reviewer_verified",
+    "mean_verified_normalized_score": "mean_verified_score_dist_mean",
+}
+
+PAPER_DECISION_COLUMNS = [
+    "committee_presentation_decision",
+    "committee_publication_decision",
+]
+
+
+def _mean(values: list) -> float:
+    return float(np.mean(values)) if values else np.nan
+
+
+class SummaryTables(object):
+    """
+    Per-reviewer, per-review, and per-paper summaries of a ChandraBot.
+
+    Reviews are keyed by paper_id and reviewer_human_hash_id. A review's
+    papers_written_with_authors counts the papers its reviewer wrote with
+    each author of the reviewed paper, for the authors first written with
+    by the year of that paper, as in count_former_coauthors.
+
+    Typical usage:
+
+        summaries = bot.make_summary_tables()
+        bot.update_reviews(new_review_df)  # summaries updated incrementally
+        summaries.export("data/interim", prefix="fake")
+
+    Attributes:
+        bot (ChandraBot): the bot summarized
+
+        min_number_reviews (int): reviewers with fewer reviews get no
+            normalized scores
+
+        min_verified_reviews (int): papers with fewer reviews by verified
+            reviewers get no verified means
+    """
+
+    def __init__(
+        self, bot, min_number_reviews: int = 10, min_verified_reviews: int = 1
+    ):
+        self.bot = bot
+        self.min_number_reviews = min_number_reviews
+        self.min_verified_reviews = min_verified_reviews
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Rebuild every summary from the bot DataFrames.
+        """
+        self._scores = {}
+        self._reviews_by_reviewer = {}
+        self._reviewers_by_paper = {}
+        self._authors = {}
+        self._papers_by_author = {}
+        self._years = {}
+        self._reviewer_rows = {}
+        self._review_rows = {}
+        self._paper_rows = {}
+
+        humans = self.bot.human_df
+        self._author_ids = {
+            hash_id: int(author_id)
+            for hash_id, author_id in zip(humans["hash_id"], humans["author_id"])
+            if not pd.isna(author_id)
+        }
+        self._verified = dict(zip(humans["hash_id"], humans["verified"]))
+
+        self.apply(paper_df=self.bot.paper_df, review_df=self.bot.review_df)
+
+    def _set_papers(self, paper_df: pd.DataFrame) -> tuple:
+        if "paper_id" not in paper_df.columns:
+            paper_df = paper_df.reset_index()
+
+        # the authors of each paper, from the paper-author link table
+        paper_authors = {}
+        links_df = self.bot.paper_author_df
+        if links_df is not None:
+            links_df = links_df.loc[
+                links_df["paper_id"].isin(paper_df["paper_id"])
+            ].dropna(subset=["author_id"])
+            for paper_id, author_id in zip(links_df["paper_id"], links_df["author_id"]):
+                paper_authors.setdefault(paper_id, []).append(int(author_id))
+
+        changed_authors = set()
+        for paper_id, year in zip(paper_df["paper_id"], paper_df["year"]):
+            for author_id in self._authors.get(paper_id, []):
+                self._papers_by_author[author_id].discard(paper_id)
+                changed_authors.add(author_id)
+            authors = paper_authors.get(paper_id, [])
+            for author_id in authors:
+                self._papers_by_author.setdefault(author_id, set()).add(paper_id)
+                changed_authors.add(author_id)
+            self._authors[paper_id] = authors
+            self._years[paper_id] = int(year)
+            self._reviewers_by_paper.setdefault(paper_id, {})
+
+        return set(paper_df["paper_id"]), changed_authors
+
+    def _set_reviews(self, review_df: pd.DataFrame) -> tuple:
+        for paper_id, hash_id, score in zip(
+            review_df["paper_id"],
+            review_df["reviewer_human_hash_id"],
+            review_df["presentation_score"],
+        ):
+            self._scores[(paper_id, hash_id)] = float(score)
+            self._reviews_by_reviewer.setdefault(hash_id, {})[paper_id] = None
+            self._reviewers_by_paper.setdefault(paper_id, {})[hash_id] = None
+
+        return set(zip(review_df["paper_id"], review_df["reviewer_human_hash_id"]))
+
+    def _conflicts(self, paper_id: str, hash_id: str) -> int:
+        author_id = self._author_ids.get(hash_id)
+        if author_id is None or paper_id not in self._years:
+            return 0
+
+        written = self._papers_by_author.get(author_id, set())
+        count = 0
+        for coauthor_id in self._authors[paper_id]:
+            if coauthor_id == author_id:
+                continue
+            together = written & self._papers_by_author[coauthor_id]
+            if together and min(self._years[p] for p in together) <= (
+                self._years[paper_id]
+            ):
+                count += len(together)
+        return count
+
+    def _reviewer_row(self, hash_id: str) -> tuple:
+        scores = [
+            self._scores[(p, hash_id)] for p in self._reviews_by_reviewer[hash_id]
+        ]
+        return (
+            len(scores),
+            float(np.mean(scores)),
+            float(np.std(scores, ddof=1)) if len(scores) > 1 else np.nan,
+            bool(self._verified.get(hash_id, False)),
+        )
+
+    def _review_row(self, paper_id: str, hash_id: str) -> tuple:
+        count, mean, std, _ = self._reviewer_rows[hash_id]
+        normalized = np.nan
+        if count >= self.min_number_reviews and std > 0:
+            normalized = (self._scores[(paper_id, hash_id)] - mean) / std
+        return (normalized, self._conflicts(paper_id, hash_id))
+
+    def _paper_row(self, paper_id: str) -> tuple:
+        hash_ids = list(self._reviewers_by_paper.get(paper_id, {}))
+        scores = [self._scores[(paper_id, h)] for h in hash_ids]
+        rows = [self._review_rows[(paper_id, h)] for h in hash_ids]
+        normalized = [row[0] for row in rows if not np.isnan(row[0])]
+        verified = [h for h in hash_ids if self._verified.get(h, False)]
+        verified_scores = [self._scores[(paper_id, h)] for h in verified]
+        verified_normalized = [
+            self._review_rows[(paper_id, h)][0]
+            for h in verified
+            if not np.isnan(self._review_rows[(paper_id, h)][0])
+        ]
+        if len(verified) < self.min_verified_reviews:
+            verified_scores = verified_normalized = []
+        return (
+            len(scores),
+            _mean(scores),
+            _mean(normalized),
+            _mean(verified_scores),
+            _mean(verified_normalized),
+            sum(1 for row in rows if row[1] > 0),
+        )
+
+    def apply(
+        self, paper_df: pd.DataFrame = None, review_df: pd.DataFrame = None
+    ) -> dict:
+        """
+        Update the summaries for added or changed papers and reviews. A
+        paper or review that is already summarized is replaced.
+
+        args:
+            paper_df: new or changed papers, with paper_id and year; their
+                authors are read from the bot's paper_author_df
+            review_df: new or changed reviews, with paper_id,
+                reviewer_human_hash_id, and presentation_score
+
+        returns: the number of reviewer, review, and paper rows recomputed
+        """
+        reviewers = set()
+        review_keys = set()
+        papers = set()
+        if paper_df is not None:
+            papers, authors = self._set_papers(paper_df)
+            # collaborations between the authors of a changed paper, and so
+            # the conflicts of their reviews, may have changed
+            author_hash_ids = {h for h, a in self._author_ids.items() if a in authors}
+            for hash_id in author_hash_ids:
+                review_keys.update(
+                    (p, hash_id) for p in self._reviews_by_reviewer.get(hash_id, {})
+                )
+            for paper_id in papers:
+                review_keys.update(
+                    (paper_id, h) for h in self._reviewers_by_paper[paper_id]
+                )
+        if review_df is not None:
+            changed = self._set_reviews(review_df)
+            reviewers = {hash_id for _, hash_id in changed}
+            review_keys.update(changed)
+
+        for hash_id in reviewers:
+            self._reviewer_rows[hash_id] = self._reviewer_row(hash_id)
+            # a new mean or standard deviation changes every normalized score
+            review_keys.update((p, hash_id) for p in self._reviews_by_reviewer[hash_id])
+        for paper_id, hash_id in review_keys:
+            self._review_rows[(paper_id, hash_id)] = self._review_row(paper_id, hash_id)
+            papers.add(paper_id)
+        for paper_id in papers:
+            self._paper_rows[paper_id] = self._paper_row(paper_id)
+
+        self._frames = {}
+        return {
+            "reviewers": len(reviewers),
+            "reviews": len(review_keys),
+            "papers": len(papers),
+        }
+
+    def _frame(self, name: str, rows: dict, columns: list, index) -> pd.DataFrame:
+        if name not in self._frames:
+            if isinstance(index, list):
+                index = pd.MultiIndex.from_tuples(list(rows), names=index)
+            else:
+                index = pd.Index(list(rows), name=index)
+            self._frames[name] = pd.DataFrame(
+                list(rows.values()), index=index, columns=columns
+            )
+        return self._frames[name]
+
+    @property
+    def reviewer_summary_df(self) -> pd.DataFrame:
+        """
+        number_of_reviews, mean_present_score, std_dev_present_score, and
+        verified, indexed by reviewer hash_id
+        """
+        return self._frame("reviewer", self._reviewer_rows, REVIEWER_COLUMNS, "hash_id")
+
+    @property
+    def review_summary_df(self) -> pd.DataFrame:
+        """
+        normalized_present_score and papers_written_with_authors, indexed by
+        paper_id and reviewer_human_hash_id
+        """
+        return self._frame("review", self._review_rows, REVIEW_COLUMNS, REVIEW_KEYS)
+
+    @property
+    def paper_summary_df(self) -> pd.DataFrame:
+        """
+        number_of_reviews, mean_score, mean_normalized_score,
+        mean_verified_score, mean_verified_normalized_score, and
+        number_of_conflicts (reviews by former coauthors), indexed by
+        paper_id
+        """
+        return self._frame("paper", self._paper_rows, PAPER_COLUMNS, "paper_id")
+
+    def tableau_tables(self) -> dict:
+        """
+        returns: a DataFrame for each workbook in notebooks/, keyed as in
+            TABLEAU_FILES. The reduced reviewer table has the columns of
+            the reduced reviewer workbook, in its order, with any other
+            review columns before the committee decisions.
+        """
+        paper_df = self.bot.paper_df
+        if "paper_id" not in paper_df.columns:
+            paper_df = paper_df.reset_index()
+        paper_df = paper_df.drop(columns=PAPER_COLUMNS, errors="ignore")
+        series_columns = [c for c in PAPER_SERIES_COLUMNS if c in paper_df]
+        other_columns = [c for c in paper_df.columns if c not in series_columns]
+        paper_df = paper_df[series_columns + other_columns].join(
+            self.paper_summary_df, on="paper_id"
+        )
+
+        review_df = self.bot.review_df.drop(
+            columns=REVIEWER_COLUMNS + REVIEW_COLUMNS + ["score_diff_mean"],
+            errors="ignore",
+        )
+        review_columns = [c for c in REVIEW_SERIES_COLUMNS if c in review_df]
+        other_review_columns = [c for c in review_df.columns if c not in review_columns]
+        review_df = (
+            review_df[review_columns + other_review_columns]
+            .join(self.review_summary_df, on=REVIEW_KEYS)
+            .join(self.reviewer_summary_df, on="reviewer_human_hash_id")
+        )
+        # the distance from the reviewer's mean, for the reviewers whose
+        # scores are normalized
+        review_df["score_diff_mean"] = (
+            review_df["presentation_score"] - review_df["mean_present_score"]
+        ).where(review_df["number_of_reviews"] >= self.min_number_reviews)
+
+        reduced_df = review_df.join(
+            paper_df.set_index("paper_id")[
+                PAPER_DECISION_COLUMNS + ["mean_verified_normalized_score"]
+            ],
+            on="paper_id",
+        )
+        reduced_df = reduced_df[
+            review_columns
+            + list(REDUCED_REVIEW_NAMES)
+            + other_review_columns
+            + PAPER_DECISION_COLUMNS
+        ].rename(columns=REDUCED_REVIEW_NAMES)
+
+        summary_columns = REVIEWER_COLUMNS[1:] + REVIEW_COLUMNS
+        return {
+            "paper-summaries": paper_df[series_columns + PAPER_COLUMNS],
+            "paper-summaries-reduced": paper_df,
+            "reviewer-summaries": review_df[review_columns + summary_columns],
+            "reviewer-summaries-reduced": reduced_df,
+        }
+
+    def export(self, output_dir: str, prefix: str = "fake") -> list:
+        """
+        Write the CSV files read by the Tableau workbooks. The full files
+        hold the series columns and the summaries; the reduced files also
+        carry any other columns of the bot tables, such as the word counts
+        added by count_words_in_paper_abstract.
+
+        args:
+            output_dir: directory for the files
+            prefix: prefix of the full files, e.g. "fake" for
+                fake-paper-summaries.csv
+
+        returns: the paths written
+        """
+        paths = []
+        for name, output_df in self.tableau_tables().items():
+            path = os.path.join(output_dir, TABLEAU_FILES[name].format(prefix=prefix))
+            output_df.to_csv(path, index=False, na_rep="NA")
+            paths.append(path)
+
+        return paths
@@ -0,0 +1,91 @@
+"""
+Chunked, parallel text analytics over the paper and review Content fields.
+
+A text Series is split into contiguous chunks, a function is applied to
+each chunk in a thread or process pool, and the chunk results are joined
+back in their original order, so the result equals applying the function
+to the whole Series at once.
+
+Python regular expressions hold the GIL, so pattern counting only runs in
+parallel in a process pool; a thread pool helps functions that release the
+GIL, such as those calling into compiled libraries.
+"""
+from __future__ import annotations
+
+import functools
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .lazy import pd
+
+# the Content fields of each message, with the bot DataFrame holding them
+TEXT_FIELDS = {
+    "abstract": "paper",
+    "body": "paper",
+    "commentary_to_author": "review",
+    "commentary_to_chair": "review",
+}
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def _count_chunk(texts: pd.Series, pattern: str) -> pd.Series:
+    return texts.str.count(pattern)
+
+
+def map_text_chunks(
+    texts: pd.Series,
+    function,
+    workers: int = 1,
+    executor: str = "process",
+    chunk_size: int = None,
+) -> pd.Series:
+    """
+    Apply a function to contiguous chunks of a text Series in parallel.
+
+    args:
+        texts: the text Series
+        function: takes a chunk of texts and returns a Series of the same
+            length and index; it must be picklable for a process pool
+        workers: number of threads or processes; 1 runs serially
+        executor: "process" or "thread"
+        chunk_size: texts per chunk; by default each worker gets four chunks
+
+    returns: the chunk results concatenated in order
+    """
+    if workers <= 1 or len(texts) < 2:
+        return function(texts)
+    if executor not in EXECUTORS:
+        raise ValueError("executor must be 'process' or 'thread'")
+
+    if chunk_size is None:
+        chunk_size = math.ceil(len(texts) / (workers * 4))
+    chunks = [
+        texts.iloc[start : start + chunk_size]
+        for start in range(0, len(texts), chunk_size)
+    ]
+    with EXECUTORS[executor](max_workers=workers) as pool:
+        results = list(pool.map(function, chunks))
+
+    return pd.concat(results)
+
+
+def count_pattern(
+    texts: pd.Series,
+    pattern: str,
+    workers: int = 1,
+    executor: str = "process",
+    chunk_size: int = None,
+) -> pd.Series:
+    """
+    Count the matches of a regular expression in each text, in parallel.
+
+    returns: the same as texts.str.count(pattern)
+    """
+    return map_text_chunks(
+        texts,
+        functools.partial(_count_chunk, pattern=pattern),
+        workers=workers,
+        executor=executor,
+        chunk_size=chunk_size,
+    )
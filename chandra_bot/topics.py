@@ -0,0 +1,170 @@
+"""
+Topic clusters of papers, from their titles and abstracts.
+
+Each text becomes a sparse TF-IDF vector, truncated SVD projects the
+vectors onto about a hundred latent dimensions, and mini-batch k-means
+clusters the normalized projections. Every step works on sparse matrices
+or small dense blocks, so thousands of abstracts are clustered in
+seconds. The top terms of a topic are the largest weights of its centroid
+projected back onto the vocabulary.
+
+A fitted TopicModel assigns new texts, such as papers that arrive after
+the clustering, to the existing topics without refitting.
+
+Topics are numbered from 1, so that 0 can mean "not clustered" in the
+paper book. scikit-learn is an optional dependency: pip install
+scikit-learn.
+"""
+from __future__ import annotations
+
+from .lazy import np, pd
+
+
+def _sklearn():
+    try:
+        import sklearn  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "topic clustering requires scikit-learn: pip install scikit-learn"
+        )
+    from sklearn import cluster, decomposition, feature_extraction, preprocessing
+
+    return cluster, decomposition, feature_extraction, preprocessing
+
+
+def paper_texts(titles, abstracts) -> list:
+    """
+    returns: the title and abstract of each paper as one text
+    """
+    return [
+        " ".join(part for part in [title, abstract] if isinstance(part, str))
+        for title, abstract in zip(titles, abstracts)
+    ]
+
+
+class TopicModel(object):
+    """
+    TF-IDF, truncated SVD, and mini-batch k-means fitted to paper texts.
+
+    Typical usage:
+
+        model = TopicModel(number_topics=40, seed=0)
+        topics = model.fit(texts)
+        late_topics = model.assign(late_texts)
+        model.top_terms[topics[0] - 1]
+
+    Attributes:
+        number_topics (int): the number of topics
+
+        top_terms (list): the top terms of each topic, topic 1 first
+    """
+
+    def __init__(
+        self,
+        number_topics: int = 20,
+        number_components: int = 100,
+        number_terms: int = 8,
+        seed: int = None,
+        batch_size: int = 1024,
+    ):
+        """
+        args:
+            number_topics: the number of topics
+            number_components: the number of SVD dimensions; fewer are
+                used when the vocabulary is smaller
+            number_terms: the number of top terms kept per topic
+            seed: seed of the SVD and k-means
+            batch_size: the number of texts per k-means batch
+        """
+        self.number_topics = number_topics
+        self.number_components = number_components
+        self.number_terms = number_terms
+        self.seed = seed
+        self.batch_size = batch_size
+        self.top_terms = None
+        self._vectorizer = None
+        self._svd = None
+        self._kmeans = None
+
+    def _project(self, texts: list) -> np.ndarray:
+        _, _, _, preprocessing = _sklearn()
+        vectors = self._svd.transform(self._vectorizer.transform(texts))
+        return preprocessing.normalize(vectors)
+
+    def fit(self, texts: list) -> np.ndarray:
+        """
+        args:
+            texts: the text of each paper
+
+        returns: the topic of each text
+        """
+        cluster, decomposition, feature_extraction, _ = _sklearn()
+        if len(texts) < self.number_topics:
+            raise ValueError(
+                f"{len(texts)} texts cannot make {self.number_topics} topics"
+            )
+
+        self._vectorizer = feature_extraction.text.TfidfVectorizer(
+            stop_words="english",
+            sublinear_tf=True,
+            min_df=2 if len(texts) > 100 else 1,
+            max_df=0.5 if len(texts) > 100 else 1.0,
+            dtype=np.float32,
+        )
+        tfidf = self._vectorizer.fit_transform(texts)
+        self._svd = decomposition.TruncatedSVD(
+            n_components=max(1, min(self.number_components, tfidf.shape[1] - 1)),
+            random_state=self.seed,
+        )
+        self._svd.fit(tfidf)
+        self._kmeans = cluster.MiniBatchKMeans(
+            n_clusters=self.number_topics,
+            batch_size=self.batch_size,
+            n_init=3,
+            random_state=self.seed,
+        )
+        labels = self._kmeans.fit_predict(self._project(texts))
+
+        terms = self._vectorizer.get_feature_names_out()
+        weights = self._svd.inverse_transform(self._kmeans.cluster_centers_)
+        self.top_terms = [
+            list(terms[np.argsort(-row)[: self.number_terms]]) for row in weights
+        ]
+
+        return labels + 1
+
+    def assign(self, texts: list) -> np.ndarray:
+        """
+        Assign texts to the fitted topics without refitting.
+
+        args:
+            texts: the text of each paper
+
+        returns: the topic of each text
+        """
+        if self._kmeans is None:
+            raise ValueError("the topic model has not been fitted")
+        if len(texts) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        return self._kmeans.predict(self._project(texts)) + 1
+
+    def topic_df(self, topics=None) -> pd.DataFrame:
+        """
+        args:
+            topics: the topics of some papers, to count the papers of each
+                topic
+
+        returns: a DataFrame indexed by topic with the top terms, joined
+            by commas, and the number of papers if topics is given
+        """
+        output_df = pd.DataFrame(
+            {"top_terms": [",".join(terms) for terms in self.top_terms]},
+            index=pd.RangeIndex(1, self.number_topics + 1, name="topic"),
+        )
+        if topics is not None:
+            output_df["number_of_papers"] = (
+                pd.Series(topics).value_counts().reindex(output_df.index, fill_value=0)
+            )
+
+        return output_df
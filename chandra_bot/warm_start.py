@@ -0,0 +1,174 @@
+"""
+Warm-start snapshots of a fully loaded ChandraBot.
+
+A fresh process that opens a paper book parses it and then rebuilds the
+DataFrames, the index, and any summary tables before the first query. A
+warm-start snapshot stores all of them in one file. It is a pickle
+(protocol 5) whose large buffers, the serialized paper book and the NumPy
+arrays behind the DataFrames, are stored out of band at aligned offsets
+and memory-mapped copy-on-write when the snapshot is read. Reading only
+unpickles the object structure. Pages of the arrays are read when they
+are used, and the book is parsed on the first access of
+ChandraBot.paper_book.
+
+Snapshots are pickles: only read snapshots you wrote. They are tied to
+the versions of pandas and NumPy that wrote them.
+
+File layout, with little-endian integers:
+
+    b"CBW1"
+    pickle length (uint64), number of buffers (uint32)
+    per buffer: offset (uint64) and length (uint64)
+    pickle stream
+    buffers, each at an offset aligned to ALIGNMENT bytes
+"""
+import io
+import mmap
+import pickle
+import struct
+
+MAGIC = b"CBW1"
+ALIGNMENT = 64
+_HEADER = struct.Struct("<QI")
+_ENTRY = struct.Struct("<QQ")
+
+# references to these objects are stored by name and restored on reading
+_BOT = "bot"
+_PAPER_BOOK = "paper_book"
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, bot, buffer_callback):
+        super().__init__(file, protocol=5, buffer_callback=buffer_callback)
+        self.bot = bot
+        self.paper_book = bot._paper_book
+
+    def persistent_id(self, obj):
+        if obj is self.bot:
+            return _BOT
+        if obj is self.paper_book and obj is not None:
+            return _PAPER_BOOK
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, bot, buffers):
+        super().__init__(file, buffers=buffers)
+        self.bot = bot
+
+    def persistent_load(self, pid):
+        if pid == _BOT:
+            return self.bot
+        if pid == _PAPER_BOOK:
+            # set when the book is parsed; see ChandraBot.paper_book
+            return None
+        raise pickle.UnpicklingError(f"unknown persistent id: {pid}")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_snapshot(bot, output_file: str) -> int:
+    """
+    Write the bot as a warm-start snapshot. The bot should be fully loaded
+    first; see ChandraBot.write_warm_start.
+
+    args:
+        bot: a ChandraBot
+        output_file: the snapshot file
+
+    returns: the number of bytes written
+    """
+    if bot._paper_book_data is not None:
+        book_data = bot._paper_book_data
+    else:
+        book_data = bot.paper_book.SerializeToString()
+
+    state = {
+        "paper_book": pickle.PickleBuffer(book_data),
+        "dataframes": bot._dataframes,
+        "lazy_dataframes": bot._lazy_dataframes,
+        "paper_index": bot.paper_index,
+        "summary_tables": bot.summary_tables,
+        "reviewer_year_df": bot.reviewer_year_df,
+        "reliability_tables": bot.reliability_tables,
+        "topic_model": bot.topic_model,
+        "compact_tables": getattr(bot, "compact_tables", None),
+    }
+    buffers = []
+    stream = io.BytesIO()
+    _SnapshotPickler(stream, bot, buffers.append).dump(state)
+    data = stream.getvalue()
+
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    offset = len(MAGIC) + _HEADER.size + _ENTRY.size * len(raw_buffers) + len(data)
+    entries = []
+    for raw in raw_buffers:
+        offset = _aligned(offset)
+        entries.append((offset, raw.nbytes))
+        offset += raw.nbytes
+
+    with open(output_file, "wb") as file_pointer:
+        file_pointer.write(MAGIC + _HEADER.pack(len(data), len(raw_buffers)))
+        file_pointer.write(b"".join(_ENTRY.pack(*entry) for entry in entries))
+        file_pointer.write(data)
+        for (offset, _), raw in zip(entries, raw_buffers):
+            file_pointer.write(b"\0" * (offset - file_pointer.tell()))
+            file_pointer.write(raw)
+
+        return file_pointer.tell()
+
+
+def is_snapshot(input_file: str) -> bool:
+    """
+    returns: True if the file exists and is a warm-start snapshot
+    """
+    try:
+        with open(input_file, "rb") as file_pointer:
+            return file_pointer.read(len(MAGIC)) == MAGIC
+    except IOError:
+        return False
+
+
+def read_snapshot(bot, input_file: str, memory_map: bool = True) -> None:
+    """
+    Restore a warm-start snapshot into an empty bot.
+
+    args:
+        bot: a ChandraBot made without arguments
+        input_file: the snapshot file
+        memory_map: if True, map the buffers copy-on-write instead of
+            reading them
+    """
+    with open(input_file, "rb") as file_pointer:
+        if memory_map:
+            content = mmap.mmap(file_pointer.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            content = bytearray(file_pointer.read())
+
+    view = memoryview(content)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("not a warm-start snapshot")
+    position = len(MAGIC)
+    data_length, number_buffers = _HEADER.unpack_from(view, position)
+    position += _HEADER.size
+    buffers = []
+    for _ in range(number_buffers):
+        offset, length = _ENTRY.unpack_from(view, position)
+        buffers.append(view[offset : offset + length])
+        position += _ENTRY.size
+
+    stream = io.BytesIO(view[position : position + data_length])
+    state = _SnapshotUnpickler(stream, bot, buffers).load()
+
+    bot._paper_book_data = state["paper_book"]
+    bot._dataframes = state["dataframes"]
+    bot._lazy_dataframes = state["lazy_dataframes"]
+    bot.paper_index = state["paper_index"]
+    bot.summary_tables = state["summary_tables"]
+    bot.reviewer_year_df = state["reviewer_year_df"]
+    bot.reliability_tables = state.get("reliability_tables")
+    bot.topic_model = state.get("topic_model")
+    if state["compact_tables"] is not None:
+        bot.compact_tables = state["compact_tables"]
@@ -29,4 +29,15 @@ setup(
     packages=["chandra_bot"],
     include_package_data=True,
     install_requires=install_requires,
+    entry_points={
+        "console_scripts": ["chandra-bot=chandra_bot.cli:main"],
+    },
+    extras_require={
+        "sql": ["duckdb"],
+        "service": ["aiohttp"],
+        "compress": ["zstandard"],
+        "topics": ["scikit-learn"],
+        "rds": ["pyreadr"],
+        "bench": ["pytest-benchmark"],
+    },
 )
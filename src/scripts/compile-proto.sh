@@ -1,2 +1,3 @@
 #!/bin/sh
-protoc -I=. --python_out=. ./chandra_bot_data_model.proto
+# run from the chandra_bot directory
+protoc -I=. --python_out=. ./data_model.proto
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+@pytest.fixture
+def toy_bot():
+    """
+    A bot built from a handful of in-memory papers, reviews, and humans.
+    """
+    paper_df = pd.DataFrame(
+        {
+            "paper_id": ["2020/1", "2020/2", "2021/1"],
+            "authors": ["A,B", "B,C", "A"],
+            "author_ids": ["1,2", "2,3", "1"],
+            "title": ["one", "two", "three"],
+            "year": [2020, 2020, 2021],
+            "committee_presentation_decision": ["Accept", "Reject", "accept"],
+            "committee_publication_decision": ["Reject", "Accept", "unknown"],
+            "abstract": ["a", "b", "c"],
+            "body": ["NA", "NA", "NA"],
+        }
+    ).set_index("paper_id")
+    review_df = pd.DataFrame(
+        {
+            "paper_id": ["2020/1", "2020/1", "2020/2", "2021/1"],
+            "presentation_score": [3.0, 4.0, 5.0, 1.0],
+            "commentary_to_author": ["x", "y", "z", "w"],
+            "commentary_to_chair": ["x", "y", "z", "w"],
+            "reviewer_human_hash_id": ["hc", "hd", "hd", "hc"],
+            "presentation_recommendation": ["Accept", "Reject", "Accept", "Reject"],
+            "publication_recommendation": ["Reject", "Reject", "Accept", "Reject"],
+        }
+    )
+    human_df = pd.DataFrame(
+        {
+            "name": ["A", "B", "C", "D"],
+            "aliases": [np.nan] * 4,
+            "hash_id": ["ha", "hb", "hc", "hd"],
+            "current_affiliation": ["U"] * 4,
+            "previous_affiliation": [np.nan] * 4,
+            "last_degree_affiliation": [np.nan] * 4,
+            "orcid_url": [np.nan] * 4,
+            "orcid": ["0", "1", "2", "3"],
+            "author_id": ["1", "2", "3", "4"],
+            "verified": [False, False, True, True],
+        }
+    )
+    return cbot(paper_df=paper_df, review_df=review_df, human_df=human_df)
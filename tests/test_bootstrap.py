@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot.bootstrap import ScoreBootstrap, accept_probability
+
+
+@pytest.mark.basic
+def test_accept_probability():
+    means = np.array([[1.0, 2.0, 3.0], [3.0, 2.0, 2.0]])
+
+    assert list(accept_probability(means, threshold=2.0)) == [0.5, 1.0, 1.0]
+    # in the second resample papers 1 and 2 tie for the last place
+    assert list(accept_probability(means, capacity=2)) == [0.5, 0.75, 0.75]
+
+
+@pytest.mark.basic
+def test_score_bootstrap():
+    rng = np.random.default_rng(0)
+    paper_ids = np.repeat(["p0", "p1", "p2", "p3"], 4)
+    scores = np.repeat([1.0, 2.0, 3.0, 4.0], 4) + rng.normal(0, 0.5, 16)
+    scores[0] = np.nan
+    reviewer_ids = np.tile(["r0", "r1", "r2", "r3"], 4)
+
+    bootstrap = ScoreBootstrap(
+        paper_ids, reviewer_ids, scores, number_resamples=2500, capacity=2, seed=3
+    )
+    paper_df = bootstrap.paper_df
+    assert list(paper_df["number_of_reviews"]) == [3, 4, 4, 4]
+    assert paper_df.loc["p1", "mean_score"] == pytest.approx(scores[4:8].mean())
+    assert (paper_df["score_low"] <= paper_df["mean_score"]).all()
+    assert (paper_df["score_high"] >= paper_df["mean_score"]).all()
+    assert paper_df["accept_probability"].sum() == pytest.approx(2)
+    assert paper_df.loc["p3", "accept_probability"] > 0.99
+    assert bootstrap.means.shape == (2500, 4)
+
+    # batches have their own seeds, so workers do not change the result
+    for kwargs in [{"workers": 2, "batch_size": 1000}, {"reviewer_effects": True}]:
+        other = ScoreBootstrap(
+            paper_ids,
+            reviewer_ids,
+            scores,
+            number_resamples=2500,
+            capacity=2,
+            seed=3,
+            **kwargs,
+        )
+        same = np.array_equal(other.means, bootstrap.means)
+        assert same == ("workers" in kwargs)
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("dataframe_only", [True, False])
+def test_bootstrap_paper_scores(toy_bot, dataframe_only):
+    toy_bot.assemble_paper_book()
+    bootstrap = toy_bot.bootstrap_paper_scores(
+        number_resamples=200, threshold=3.5, seed=0, dataframe_only=dataframe_only
+    )
+    paper_df = bootstrap.paper_df
+
+    assert list(paper_df.index) == ["2020/1", "2020/2", "2021/1"]
+    # papers with one review never move
+    assert list(paper_df["accept_probability"].iloc[1:]) == [1.0, 0.0]
+    assert 0 < paper_df.loc["2020/1", "accept_probability"] < 1
+
+    bootstrap = toy_bot.bootstrap_paper_scores(
+        number_resamples=10, year=2021, dataframe_only=dataframe_only
+    )
+    assert list(bootstrap.paper_df.index) == ["2021/1"]
+    assert np.isnan(bootstrap.paper_df["accept_probability"].iloc[0])
+
+
+@pytest.mark.basic
+def test_bootstrap_normalized_scores_match(toy_bot):
+    toy_bot.assemble_paper_book()
+    toy_bot.compute_normalized_scores(dataframe_only=True)
+    toy_bot.compute_normalized_scores()
+
+    bootstraps = [
+        toy_bot.bootstrap_paper_scores(
+            number_resamples=200, normalized=True, seed=0, dataframe_only=flag
+        )
+        for flag in [True, False]
+    ]
+    pd.testing.assert_frame_equal(bootstraps[0].paper_df, bootstraps[1].paper_df)
+    # hc scored 3 and 1, hd scored 4 and 5
+    assert list(bootstraps[1].paper_df["mean_score"]) == pytest.approx(
+        [0.0, 2**-0.5, -(2**-0.5)]
+    )
@@ -0,0 +1,39 @@
+import copy
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+@pytest.mark.basic
+def test_protobuf_backend():
+    assert cbot.protobuf_backend() in ["python", "cpp", "upb"]
+
+
+@pytest.mark.basic
+def test_bulk_assembly_matches_setters(toy_bot):
+    bulk_bot = copy.deepcopy(toy_bot)
+
+    toy_bot.assemble_paper_book()
+    bulk_bot.assemble_paper_book(bulk=True)
+
+    assert len(bulk_bot.paper_book.paper) == 3
+    assert (
+        bulk_bot.paper_book.SerializeToString()
+        == toy_bot.paper_book.SerializeToString()
+    )
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("bulk", [False, True])
+def test_parallel_assembly_matches_serial(toy_bot, bulk):
+    parallel_bot = copy.deepcopy(toy_bot)
+
+    toy_bot.assemble_paper_book(bulk=bulk)
+    parallel_bot.assemble_paper_book(bulk=bulk, workers=2)
+
+    assert (
+        parallel_bot.paper_book.SerializeToString()
+        == toy_bot.paper_book.SerializeToString()
+    )
+    assert parallel_bot.paper_author_df.equals(toy_bot.paper_author_df)
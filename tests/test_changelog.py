@@ -0,0 +1,120 @@
+import os
+import struct
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot import changelog
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.changelog import (
+    append_changes,
+    log_file_name,
+    make_changes,
+    read_changes,
+)
+
+
+@pytest.mark.basic
+def test_change_log_replay(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+
+    review = dm.Review()
+    review.CopyFrom(toy_bot.paper_book.paper[0].reviews[0])
+    review.presentation_score = 5.0
+    new_review = dm.Review()
+    new_review.CopyFrom(review)
+    new_review.reviewer.human.hash_id = "hb"
+    paper = dm.Paper()
+    paper.CopyFrom(toy_bot.paper_book.paper[2])
+    paper.number = "2022/1"
+    paper.year = 2022
+
+    compacted = toy_bot.write_paper_book_changes(
+        book_file,
+        papers=[paper],
+        reviews=[("2020/1", review), ("2020/1", new_review)],
+        max_log_ratio=10,
+    )
+    assert not compacted
+    assert len(read_changes(book_file)) == 3
+
+    book_bot = cbot.read_paper_book(book_file)
+    assert book_bot.paper_book == toy_bot.paper_book
+    assert [p.number for p in book_bot.paper_book.paper][-1] == "2022/1"
+    reviews = book_bot.paper_book.paper[0].reviews
+    assert [r.presentation_score for r in reviews] == [5.0, 4.0, 5.0]
+
+    # a record cut short by an interrupted write is ignored
+    with open(log_file_name(book_file), "ab") as file_pointer:
+        file_pointer.write(b"\x40\x00\x00\x00partial")
+    assert len(read_changes(book_file)) == 3
+
+    toy_bot.write_paper_book(book_file)
+    assert not os.path.exists(log_file_name(book_file))
+    assert cbot.read_paper_book(book_file).paper_book == toy_bot.paper_book
+
+
+@pytest.mark.basic
+def test_change_log_append_after_torn_write(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+
+    review = toy_bot.paper_book.paper[0].reviews[0]
+    review.presentation_score = 5.0
+    toy_bot.write_paper_book_changes(book_file, reviews=[("2020/1", review)])
+    # an interrupted append of the next change leaves part of its record
+    log_file = log_file_name(book_file)
+    with open(log_file, "rb") as file_pointer:
+        record = file_pointer.read()
+    with open(log_file, "ab") as file_pointer:
+        file_pointer.write(record[:-3])
+
+    review.presentation_score = 1.0
+    toy_bot.write_paper_book_changes(book_file, reviews=[("2020/1", review)])
+
+    assert len(read_changes(book_file)) == 2
+    book_bot = cbot.read_paper_book(book_file)
+    assert book_bot.paper_book.paper[0].reviews[0].presentation_score == 1.0
+    assert book_bot.paper_book == toy_bot.paper_book
+
+
+@pytest.mark.basic
+def test_change_log_append_walks_headers(tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    papers = [dm.Paper(number=str(n), title="x" * 1000) for n in range(3)]
+    append_changes(book_file, make_changes(papers=papers[:2]))
+
+    # another process appends a record and is interrupted in the next one
+    log_file = log_file_name(book_file)
+    record = make_changes(papers=papers[2:])[0].SerializeToString()
+    with open(log_file, "ab") as file_pointer:
+        file_pointer.write(struct.pack("<I", len(record)) + record)
+        file_pointer.write(struct.pack("<I", len(record)) + record[:10])
+
+    for ends in [dict(changelog._record_ends), {}]:
+        # from the end this process last wrote, and from a cold start
+        changelog._record_ends.clear()
+        changelog._record_ends.update(ends)
+        with open(log_file, "ab") as file_pointer:
+            file_pointer.write(b"\x01\x02")
+        append_changes(book_file, make_changes(papers=papers[:1]))
+        numbers = [change.paper.number for change in read_changes(book_file)]
+        assert numbers[:3] == ["0", "1", "2"]
+        assert numbers[3:] == ["0"] * (len(numbers) - 3)
+    assert len(numbers) == 5
+
+
+@pytest.mark.basic
+def test_change_log_compaction(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+
+    paper = toy_bot.paper_book.paper[1]
+    paper.title = "changed"
+    assert toy_bot.write_paper_book_changes(book_file, papers=[paper], max_log_ratio=0)
+    assert not os.path.exists(log_file_name(book_file))
+    assert cbot.read_paper_book(book_file).paper_book.paper[1].title == "changed"
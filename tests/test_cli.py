@@ -0,0 +1,97 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from chandra_bot.cli import ResidentBots, Worker, main, run
+
+CONFLICTS = (
+    "paper_id,reviewer_hash_id,author_hash_id,papers_written,year_first_collab\n"
+    "2020/1,hc,hb,1,2020\n"
+)
+
+
+@pytest.fixture
+def book_file(toy_bot, tmp_path):
+    csv_files = {}
+    for name in ["paper", "review", "human"]:
+        csv_files[name] = str(tmp_path / f"{name}.csv")
+        getattr(toy_bot, name + "_df").to_csv(csv_files[name], index=(name == "paper"))
+    book_file = str(tmp_path / "book.bin")
+    status = run(
+        [
+            "build",
+            "--paper-file",
+            csv_files["paper"],
+            "--review-file",
+            csv_files["review"],
+            "--human-file",
+            csv_files["human"],
+            "--output-file",
+            book_file,
+        ],
+        ResidentBots(),
+    )
+    assert status == 0
+    return book_file
+
+
+@pytest.mark.basic
+def test_cli_commands(book_file, tmp_path, capsys):
+    bots = ResidentBots()
+    capsys.readouterr()
+    assert run(["conflicts", "--book-file", book_file], bots) == 0
+    assert capsys.readouterr().out == CONFLICTS
+
+    bot = bots.bot(book_file)
+    assert run(["normalize", "--book-file", book_file], bots) == 0
+    assert bots.bot(book_file) is bot
+
+    output_dir = str(tmp_path / "out")
+    assert (
+        run(["summaries", "--book-file", book_file, "--output-dir", output_dir], bots)
+        == 0
+    )
+    assert (
+        run(["export", "--book-file", book_file, "--output-dir", output_dir], bots) == 0
+    )
+    assert sorted(os.listdir(output_dir)) == [
+        "fake-paper-summaries.csv",
+        "fake-reviewer-summaries.csv",
+        "fake_human_table.csv",
+        "fake_paper_table.csv",
+        "fake_review_table.csv",
+        "tableau-reduced-papers.csv",
+        "tableau-reduced-reviews.csv",
+    ]
+
+    assert (
+        run(["conflicts", "--book-file", book_file, "--paper-id", "1999/1"], bots) == 1
+    )
+    assert run(["export", "--book-file", book_file], bots) == 1
+
+
+@pytest.mark.basic
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_cli_worker(book_file, tmp_path, capsys):
+    socket_file = str(tmp_path / "worker.sock")
+    worker = Worker(socket_file)
+    thread = threading.Thread(target=worker.serve)
+    thread.start()
+    try:
+        capsys.readouterr()
+        command = ["--socket", socket_file, "conflicts", "--book-file", book_file]
+        assert main(command) == 0
+        assert main(command) == 0
+        assert capsys.readouterr().out == CONFLICTS * 2
+        assert len(worker.bots.entries) == 1
+
+        with pytest.raises(SystemExit):
+            main(["--socket", socket_file, "conflicts"])
+        assert main(["--socket", socket_file, "--local"] + command[2:]) == 0
+    finally:
+        assert main(["--socket", socket_file, "--stop"]) == 0
+        thread.join()
+    assert not os.path.exists(socket_file)
+    assert main(["--socket", socket_file, "--stop"]) == 1
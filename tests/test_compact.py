@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot.compact import (
+    PRESENTATION_REC_DTYPE,
+    IdDictionary,
+    as_categorical,
+    make_paper_author_df,
+    recommendation_column,
+)
+
+
+@pytest.mark.basic
+def test_id_dictionary_round_trip():
+    ids = IdDictionary(["b", "a", "b"])
+    ids.add(["c", "a"])
+
+    codes = ids.encode(["a", "c", "missing"])
+    assert codes.dtype == np.int32
+    assert list(codes) == [1, 2, -1]
+    assert list(ids.decode(codes)) == ["a", "c", None]
+
+
+@pytest.mark.basic
+def test_recommendation_helpers(toy_bot):
+    review_df = toy_bot.review_df
+    column = recommendation_column(review_df, "presentation_recommend")
+    assert column == "presentation_recommendation"
+    assert recommendation_column(review_df, "missing_recommend") is None
+
+    labels = pd.Series(["accept", "REJECT", None, "maybe"])
+    codes = as_categorical(labels, PRESENTATION_REC_DTYPE).cat.codes
+    assert list(codes) == [1, 0, 2, 2]
+
+
+@pytest.mark.basic
+def test_paper_author_link_table(toy_bot):
+    link_df = make_paper_author_df(toy_bot.paper_df)
+
+    assert list(link_df["paper_id"]) == [
+        "2020/1",
+        "2020/1",
+        "2020/2",
+        "2020/2",
+        "2021/1",
+    ]
+    assert list(link_df["author_position"]) == [0, 1, 0, 1, 0]
+    assert list(link_df["author_id"]) == [1, 2, 2, 3, 1]
+    assert link_df["author_id"].dtype == np.int32
+
+
+@pytest.fixture
+def missing_author_id_bot(toy_bot):
+    """
+    The toy bot, with no author_id for D.
+    """
+    toy_bot.human_df.loc[toy_bot.human_df["hash_id"] == "hd", "author_id"] = np.nan
+    return toy_bot
+
+
+@pytest.mark.basic
+def test_compact_tables(missing_author_id_bot):
+    bot = missing_author_id_bot
+    tables = bot.make_compact_tables()
+
+    assert bot.compact_tables is tables
+    assert tables.review_df["reviewer_code"].dtype == np.int32
+    assert list(tables.hash_ids.decode(tables.review_df["reviewer_code"])) == list(
+        bot.review_df["reviewer_human_hash_id"]
+    )
+    assert list(tables.paper_df["committee_presentation_decision"].cat.codes) == [
+        1,
+        0,
+        1,
+    ]
+    assert list(tables.paper_df["committee_publication_decision"]) == [
+        "Reject",
+        "Accept",
+        "None",
+    ]
+    assert tables.human_df["author_id"].dtype == "Int32"
+    assert tables.human_df["author_id"].isna().sum() == 1
+    assert list(tables.hash_ids.decode(tables.paper_author_df["hash_code"])) == [
+        "ha",
+        "hb",
+        "hb",
+        "hc",
+        "ha",
+    ]
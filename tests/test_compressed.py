@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("zstandard")
+
+from chandra_bot import ChandraBot as cbot  # noqa: E402
+from chandra_bot.compressed import (  # noqa: E402
+    CompressedBookReader,
+    is_compressed_book,
+    write_compressed_book,
+)
+from chandra_bot.synth import make_fake_data  # noqa: E402
+
+
+@pytest.mark.basic
+def test_compressed_book_round_trip(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.cbz")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file, compress=True)
+    assert is_compressed_book(book_file)
+
+    book_bot = cbot.read_paper_book(book_file)
+    assert book_bot.paper_book == toy_bot.paper_book
+    assert list(book_bot.paper_df["paper_id"]) == ["2020/1", "2020/2", "2021/1"]
+
+
+@pytest.mark.basic
+def test_compressed_book_dictionary(tmp_path):
+    bot = make_fake_data(number_humans=60, papers_per_year=10, seed=3).to_bot()
+    bot.assemble_paper_book()
+    raw_file = str(tmp_path / "book.bin")
+    book_file = str(tmp_path / "book.cbz")
+    bot.write_paper_book(raw_file)
+    size = write_compressed_book(bot.paper_book, book_file)
+
+    with CompressedBookReader(book_file) as reader:
+        assert len(reader) == len(bot.paper_book.paper)
+        assert reader.paper(5) == bot.paper_book.paper[5]
+        number = bot.paper_book.paper[7].number
+        assert reader.paper(number) == bot.paper_book.paper[7]
+        assert reader.read_paper_book() == bot.paper_book
+    assert size < bot.paper_book.ByteSize()
+    assert not is_compressed_book(raw_file)
+
+
+@pytest.mark.basic
+def test_compressed_book_human_registry(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.cbz")
+    toy_bot.assemble_paper_book(bulk=True, human_registry=True)
+    toy_bot.write_paper_book(book_file, compress=True)
+
+    book_bot = cbot.read_paper_book(book_file)
+    assert len(book_bot.paper_book.humans) == 4
+    assert book_bot.paper_book == toy_bot.paper_book
+    assert list(book_bot.paper_df["authors"]) == ["A,B", "B,C", "A"]
+
+    # compaction rewrites the container and keeps the registry
+    paper = toy_bot.paper_book.paper[1]
+    paper.title = "changed"
+    assert toy_bot.write_paper_book_changes(book_file, papers=[paper], max_log_ratio=0)
+    book_bot = cbot.read_paper_book(book_file)
+    assert len(book_bot.paper_book.humans) == 4
+    assert book_bot.paper_book == toy_bot.paper_book
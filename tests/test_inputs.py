@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.inputs import read_input_files
+
+example_dir = os.path.join(os.getcwd(), "examples")
+
+
+@pytest.mark.basic
+def test_read_yearly_csv_files(tmp_path):
+    paper_file = os.path.join(example_dir, "fake_paper_series.csv")
+    paper_df = read_input_files(paper_file, cbot.PAPER_DICT, index_col="paper_id")
+
+    yearly_files = []
+    for year, year_df in paper_df.reset_index().groupby("year"):
+        yearly_files.append(str(tmp_path / f"papers-{year}.csv"))
+        year_df.to_csv(yearly_files[-1], index=False)
+    yearly_df = read_input_files(
+        yearly_files, cbot.PAPER_DICT, index_col="paper_id", workers=4
+    )
+
+    pd.testing.assert_frame_equal(yearly_df, paper_df)
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize(
+    "name,dtypes,index_col",
+    [
+        ("fake_paper_series", cbot.PAPER_DICT, "paper_id"),
+        ("fake_human", cbot.HUMAN_DICT, None),
+    ],
+)
+def test_rds_matches_csv(name, dtypes, index_col):
+    pytest.importorskip("pyreadr")
+    csv_df = read_input_files(
+        os.path.join(example_dir, name + ".csv"), dtypes, index_col=index_col
+    )
+    rds_df = read_input_files(
+        os.path.join(example_dir, name + ".RDS"), dtypes, index_col=index_col
+    )
+
+    pd.testing.assert_frame_equal(rds_df, csv_df)
+
+
+@pytest.mark.basic
+def test_create_bot_from_rds(tmp_path):
+    pyreadr = pytest.importorskip("pyreadr")
+    review_df = pyreadr.read_r(
+        os.path.join(example_dir, "small_fake_review_series.RDS")
+    )[None]
+    review_files = []
+    for year, year_df in review_df.groupby(review_df["paper_id"].str[:4]):
+        review_files.append(str(tmp_path / f"reviews-{year}.RDS"))
+        pyreadr.write_rds(review_files[-1], year_df.reset_index(drop=True))
+
+    bot = cbot.create_bot(
+        paper_file=os.path.join(example_dir, "small_fake_paper_series.RDS"),
+        review_file=review_files,
+        human_file=os.path.join(example_dir, "small_fake_human.RDS"),
+        workers=2,
+    )
+
+    assert len(bot.review_df) == len(review_df)
+    assert bot.review_df["presentation_score"].dtype == "float32"
+    assert bot.human_df["author_id"].dtype == "string"
+    assert bot.paper_df.index.name == "paper_id"
@@ -0,0 +1,58 @@
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+@pytest.fixture
+def book_bot(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+    return cbot.read_paper_book(book_file)
+
+
+@pytest.mark.basic
+def test_book_methods_do_not_build_dataframes(book_bot, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("DataFrame built")
+
+    monkeypatch.setattr(book_bot, "make_dataframe", fail)
+    monkeypatch.setattr(book_bot, "_make_paper_author_df_from_book", fail)
+
+    book_bot.index_paper_book()
+    book_bot.compute_normalized_scores(min_number_reviews=2)
+    book_bot.count_former_coauthors()
+    book_bot.append_verified_reviewer(min_count=0)
+    scores_df = (
+        book_bot.query("reviews")
+        .select("paper_id", "presentation_score")
+        .filter("reviewer_human_hash_id", "==", "hd")
+        .run()
+    )
+
+    assert list(scores_df["presentation_score"]) == [4.0, 5.0]
+    for name in cbot.LAZY_DATAFRAMES:
+        assert book_bot.materialized_dataframe(name) is None
+
+
+@pytest.mark.basic
+def test_dataframes_built_on_access_and_invalidated(book_bot):
+    assert book_bot.materialized_dataframe("review") is None
+    assert list(book_bot.review_df["presentation_score"]) == [3.0, 4.0, 5.0, 1.0]
+    review_df = book_bot.materialized_dataframe("review")
+    assert review_df is book_bot.review_df
+
+    book_bot.compute_normalized_scores(min_number_reviews=2)
+    assert book_bot.materialized_dataframe("review") is None
+    hd_df = book_bot.review_df.loc[book_bot.review_df["reviewer_human_hash_id"] == "hd"]
+    assert list(hd_df["normalized_present_score"].round(4)) == [-0.7071, 0.0]
+
+    assert list(book_bot.paper_author_df["author_id"]) == [1, 2, 2, 3, 1]
+    assert list(book_bot.paper_df["authors"]) == ["A,B", "B,C", "A"]
+
+    # DataFrames set directly are kept
+    paper_df = book_bot.paper_df.head(1)
+    book_bot.paper_df = paper_df
+    book_bot.invalidate_dataframes()
+    assert book_bot.paper_df is paper_df
+    assert book_bot.materialized_dataframe("human") is None
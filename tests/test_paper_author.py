@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+@pytest.mark.basic
+def test_link_table_matches_book(toy_bot):
+    toy_bot.assemble_paper_book()
+
+    book_authors = [
+        (paper.number, position, author.human.name)
+        for paper in toy_bot.paper_book.paper
+        for position, author in enumerate(paper.authors)
+    ]
+    link_rows = list(
+        toy_bot.paper_author_df[["paper_id", "author_position"]].itertuples(
+            index=False, name=None
+        )
+    )
+    assert [row[:2] for row in book_authors] == link_rows
+    assert list(toy_bot.paper_author_df["author_id"]) == [1, 2, 2, 3, 1]
+
+
+@pytest.mark.basic
+def test_link_table_survives_round_trip(toy_bot, tmp_path):
+    toy_bot.assemble_paper_book()
+    book_file = os.path.join(tmp_path, "book.bin")
+    toy_bot.write_paper_book(output_file=book_file)
+
+    bot = cbot.read_paper_book(book_file)
+
+    assert list(bot.paper_author_df["author_id"]) == [1, 2, 2, 3, 1]
+    assert list(bot.paper_df["author_ids"]) == ["1,2", "2,3", "1"]
+
+
+@pytest.mark.basic
+def test_coauthor_count_uses_link_table(toy_bot):
+    toy_bot.count_former_coauthors(dataframe_only=True)
+
+    counts = toy_bot.review_df.set_index(["paper_id", "reviewer_human_hash_id"])[
+        "papers_written_with_authors"
+    ]
+    assert counts[("2020/1", "hc")] == 1
+    assert counts.drop(("2020/1", "hc")).eq(0).all()
+
+
+@pytest.mark.basic
+def test_link_table_follows_book_edits(toy_bot):
+    toy_bot.assemble_paper_book()
+    assert list(toy_bot.make_dataframe("paper")["author_ids"]) == ["1,2", "2,3", "1"]
+
+    # replace B by C on 2020/1, which keeps the number of authors
+    papers = toy_bot.paper_book.paper
+    papers[0].authors[1].human.CopyFrom(papers[1].authors[1].human)
+
+    assert list(toy_bot.make_dataframe("paper")["author_ids"]) == ["1,2", "3,2", "1"]
+    human_df = toy_bot.make_dataframe("human").set_index("hash_id")
+    assert list(human_df.loc[["ha", "hc", "hb"], "author_id"]) == [1, 2, 3]
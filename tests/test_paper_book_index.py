@@ -0,0 +1,76 @@
+import pytest
+
+from chandra_bot.compact import make_paper_author_df
+from chandra_bot.index import PaperBookIndex
+
+
+@pytest.mark.basic
+def test_index_lookups(toy_bot):
+    toy_bot.assemble_paper_book()
+    index = toy_bot.index_paper_book()
+
+    assert toy_bot.paper_index is index
+    assert index.paper("2020/2").title == "two"
+    assert index.paper("missing") is None
+    assert [p.number for p in index.papers_in_year(2020)] == ["2020/1", "2020/2"]
+    assert [p.number for p in index.papers_by_author("ha")] == ["2020/1", "2021/1"]
+    assert [p.number for p in index.papers_by_author("ha", year=2021)] == ["2021/1"]
+    assert [
+        (paper.number, review.presentation_score)
+        for paper, review in index.reviews_by_reviewer("hd")
+    ] == [("2020/1", 4.0), ("2020/2", 5.0)]
+
+
+@pytest.mark.basic
+def test_index_update_after_append(toy_bot):
+    toy_bot.assemble_paper_book()
+    index = PaperBookIndex(toy_bot.paper_book)
+
+    paper = toy_bot.paper_book.paper.add(number="2022/1", year=2022)
+    paper.authors.add().human.hash_id = "hd"
+    paper.reviews.add().reviewer.human.hash_id = "ha"
+
+    assert index.update() == 1
+    assert index.paper("2022/1").year == 2022
+    assert index.by_author["hd"] == [3]
+    assert index.by_reviewer["ha"] == [(3, 0)]
+
+    del toy_bot.paper_book.paper[0]
+    index.update()
+    assert len(index) == 3
+    assert index.paper("2020/1") is None
+
+
+@pytest.mark.basic
+def test_indexed_former_coauthors(toy_bot):
+    toy_bot.paper_df.loc["2021/2"] = toy_bot.paper_df.loc["2020/2"]
+    toy_bot.paper_df.loc["2021/2", "year"] = 2021
+    toy_bot.paper_df.loc["2021/2", "author_ids"] = "1,3"
+    toy_bot.paper_author_df = make_paper_author_df(toy_bot.paper_df)
+    toy_bot.review_df.loc[4] = toy_bot.review_df.loc[2]
+    toy_bot.review_df.loc[4, "paper_id"] = "2021/2"
+    toy_bot.review_df.loc[4, "reviewer_human_hash_id"] = "hb"
+    toy_bot.assemble_paper_book()
+    toy_bot.count_former_coauthors()
+
+    # hb wrote 2020/1 with ha and 2020/2 with hc before reviewing 2021/2
+    review = toy_bot.paper_index.paper("2021/2").reviews[0]
+    assert review.reviewer.human.hash_id == "hb"
+    assert review.papers_written_with_authors == 2
+    # hc wrote 2020/2 with hb in the year it reviewed 2020/1; hd wrote nothing
+    assert [
+        r.papers_written_with_authors for r in toy_bot.paper_book.paper[0].reviews
+    ] == [1, 0]
+
+
+@pytest.mark.basic
+def test_indexed_normalized_scores(toy_bot):
+    toy_bot.assemble_paper_book()
+    toy_bot.compute_normalized_scores(min_number_reviews=2)
+
+    first, second = toy_bot.paper_book.paper[0].reviews
+    assert first.reviewer.mean_present_score == pytest.approx(2.0)
+    assert first.normalized_present_score == pytest.approx(2**-0.5)
+    assert second.reviewer.mean_present_score == pytest.approx(4.5)
+    assert second.normalized_present_score == pytest.approx(-(2**-0.5))
+    assert toy_bot.paper_book.paper[2].reviews[0].reviewer.number_of_reviews == 0
@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.profiling import Profiler
+
+
+@pytest.mark.basic
+def test_profiling_records_calls(toy_bot, tmp_path):
+    log_file = os.path.join(tmp_path, "profile.jsonl")
+    profiler = toy_bot.enable_profiling(log_file=log_file)
+
+    toy_bot.assemble_paper_book()
+    toy_bot.compute_normalized_scores(dataframe_only=True)
+    toy_bot.make_dataframe("paper")
+
+    names = [record.method for record in profiler.records]
+    assert names == [
+        "assemble_paper_book",
+        "compute_normalized_scores",
+        "make_dataframe",
+    ]
+    assert [record.rows for record in profiler.records] == [3, 4, 3]
+    assert all(record.peak_memory > 0 for record in profiler.records)
+
+    with open(log_file, encoding="utf-8") as file_pointer:
+        lines = [json.loads(line) for line in file_pointer]
+    assert [line["method"] for line in lines] == names
+
+    summary = profiler.summary()
+    assert summary.loc["make_dataframe", "calls"] == 1
+
+    assert toy_bot.disable_profiling() is profiler
+    toy_bot.make_dataframe("paper")
+    assert len(profiler.records) == 3
+
+
+@pytest.mark.basic
+def test_class_profiler_records_nested_calls(toy_bot, tmp_path):
+    book_file = os.path.join(tmp_path, "book.bin")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+
+    profiler = Profiler(trace_memory=False)
+    cbot.profiler = profiler
+    try:
+        book_bot = cbot.read_paper_book(book_file)
+        book_bot.compute_normalized_scores()
+    finally:
+        cbot.profiler = None
+
+    calls_df = profiler.to_dataframe()
+    assert list(calls_df["method"]) == [
+        "read_paper_book",
+        "index_paper_book",
+        "compute_normalized_scores",
+    ]
+    assert list(calls_df["depth"]) == [0, 1, 0]
+    assert list(calls_df["rows"]) == [3, 3, 4]
+    assert calls_df["peak_memory"].isna().all()
@@ -0,0 +1,76 @@
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+
+def _verified_means(bot):
+    return (
+        bot.query("reviews")
+        .filter("year", "==", 2020)
+        .filter("verified", "==", True)
+        .group_by("paper_id")
+        .aggregate(
+            mean_verified_score=("presentation_score", "mean"),
+            n=("presentation_score", "size"),
+        )
+        .having("mean_verified_score", ">", 3.5)
+        .order_by("paper_id")
+    )
+
+
+@pytest.mark.basic
+def test_query_dataframes(toy_bot):
+    query = _verified_means(toy_bot)
+    result_df = query.run()
+
+    assert list(result_df["paper_id"]) == ["2020/2"]
+    assert list(result_df["mean_verified_score"]) == [5.0]
+    assert list(result_df["n"]) == [1]
+
+    plan = query.explain()
+    # the paper and human filters run before the joins, and no text
+    # columns are read
+    assert plan.index("filter papers.year == 2020") < plan.index(
+        "inner join papers on ('paper_id', 'paper_id')"
+    )
+    assert not any("abstract" in step or "commentary" in step for step in plan)
+
+
+@pytest.mark.basic
+def test_query_paper_book_matches_dataframes(toy_bot):
+    toy_bot.assemble_paper_book()
+    book_bot = cbot(input_paper_book=toy_bot.paper_book)
+
+    query = _verified_means(book_bot)
+    assert query.explain()[0] == "index lookup papers.year == 2020"
+    result_df = query.run()
+    assert list(result_df["paper_id"]) == ["2020/2"]
+    assert list(result_df["mean_verified_score"]) == [5.0]
+
+    reviews_df = (
+        book_bot.query("reviews")
+        .filter("reviewer_human_hash_id", "==", "hc")
+        .select("paper_id", "presentation_score")
+        .run()
+    )
+    assert list(reviews_df["paper_id"]) == ["2020/1", "2021/1"]
+    assert list(reviews_df["presentation_score"]) == [3.0, 1.0]
+
+    humans_df = (
+        book_bot.query("humans")
+        .filter("verified", "==", True)
+        .select("hash_id")
+        .order_by("hash_id")
+        .run()
+    )
+    assert list(humans_df["hash_id"]) == ["hc", "hd"]
+
+
+@pytest.mark.basic
+def test_query_errors(toy_bot):
+    with pytest.raises(ValueError):
+        toy_bot.query("authors")
+    with pytest.raises(ValueError):
+        toy_bot.query("papers").filter("missing", "==", 1)
+    with pytest.raises(ValueError):
+        toy_bot.query("papers").filter("year", "~", 1)
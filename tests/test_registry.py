@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.registry import deduplicate_humans, embed_humans
+
+
+@pytest.mark.basic
+def test_human_registry_assembly(toy_bot):
+    toy_bot.assemble_paper_book(bulk=True)
+    embedded_book = toy_bot.paper_book
+    toy_bot.paper_book = dm.PaperBook()
+    toy_bot.assemble_paper_book(bulk=True, human_registry=True)
+    book = toy_bot.paper_book
+
+    assert [human.hash_id for human in book.humans] == ["ha", "hb", "hc", "hd"]
+    author = book.paper[0].authors[0]
+    assert author.human.hash_id == "ha"
+    assert author.human.name == ""
+    assert toy_bot.resolve_human(author.human).name == "A"
+    assert book.paper[0].reviews[0].reviewer.verified
+    assert book.ByteSize() < embedded_book.ByteSize()
+
+    assert deduplicate_humans(embedded_book) == book
+    assert deduplicate_humans(embed_humans(book)) == book
+    assert not embed_humans(book).humans
+
+
+@pytest.mark.basic
+def test_human_registry_dataframes(toy_bot):
+    toy_bot.assemble_paper_book(human_registry=True)
+    book_bot = cbot(input_paper_book=toy_bot.paper_book)
+
+    paper_df = book_bot.make_dataframe("paper")
+    assert list(paper_df["authors"]) == ["A,B", "B,C", "A"]
+
+    human_df = book_bot.make_dataframe("human")
+    assert list(human_df["hash_id"]) == ["ha", "hb", "hc", "hd"]
+    assert list(human_df["name"]) == ["A", "B", "C", "D"]
+    assert list(human_df["verified"].fillna(False)) == [False, False, True, True]
+
+    humans_df = book_bot.query("humans").select("hash_id", "name").run()
+    assert sorted(humans_df["name"]) == ["A", "B", "C", "D"]
+
+
+@pytest.mark.basic
+def test_human_registry_matches_embedded(toy_bot):
+    # hc reviews 2020/1 before authoring 2020/2, and the author and reviewer
+    # copies spell the missing last degree affiliation differently
+    toy_bot.assemble_paper_book(bulk=True)
+    embedded_book = toy_bot.paper_book
+    registry_book = deduplicate_humans(embedded_book)
+    assert embed_humans(registry_book) == embedded_book
+
+    embedded_df = cbot(input_paper_book=embedded_book).make_dataframe("human")
+    registry_df = cbot(input_paper_book=registry_book).make_dataframe("human")
+    pd.testing.assert_frame_equal(registry_df, embedded_df)
+    assert list(registry_df["last_degree_affiliation"]) == ["nan", "nan", "", ""]
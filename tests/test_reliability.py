@@ -0,0 +1,135 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot.reliability import ReliabilityTables
+
+
+def _random_reviews(seed=0, number_papers=40, number_reviewers=12):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for paper in range(number_papers):
+        quality = rng.normal(3, 1)
+        for reviewer in rng.choice(number_reviewers, rng.integers(1, 5), False):
+            score = float(np.round(quality + rng.normal(0, 0.8), 1))
+            rows.append((f"p{paper}", f"r{reviewer}", score, int(score > 3)))
+    return pd.DataFrame(rows, columns=["paper", "reviewer", "score", "recommend"])
+
+
+@pytest.mark.basic
+def test_panel_agreement_matches_definitions():
+    review_df = _random_reviews()
+    tables = ReliabilityTables(
+        review_df["paper"],
+        review_df["reviewer"],
+        review_df["score"],
+        [0] * 10 + list(review_df["recommend"])[10:],
+    )
+
+    # Krippendorff's alpha from every ordered pair of scores of a paper
+    groups = [
+        group.to_numpy()
+        for _, group in review_df.groupby("paper")["score"]
+        if len(group) > 1
+    ]
+    values = np.concatenate(groups)
+    observed = sum(
+        sum((a - b) ** 2 for a, b in itertools.permutations(group, 2))
+        / (len(group) - 1)
+        for group in groups
+    ) / len(values)
+    expected = sum((a - b) ** 2 for a, b in itertools.permutations(values, 2)) / (
+        len(values) * (len(values) - 1)
+    )
+    assert tables.krippendorff_alpha == pytest.approx(1 - observed / expected)
+
+    # ICC(1) from the one-way ANOVA
+    grand = values.mean()
+    between = sum(len(g) * (g.mean() - grand) ** 2 for g in groups) / (len(groups) - 1)
+    within = sum(((g - g.mean()) ** 2).sum() for g in groups) / (
+        len(values) - len(groups)
+    )
+    k0 = (len(values) - sum(len(g) ** 2 for g in groups) / len(values)) / (
+        len(groups) - 1
+    )
+    assert tables.icc == pytest.approx(
+        (between - within) / (between + (k0 - 1) * within)
+    )
+    assert tables.paper_df["number_of_reviews"].sum() == len(review_df)
+
+
+@pytest.mark.basic
+def test_reviewer_reliability_matches_loops():
+    review_df = _random_reviews(seed=1)
+    tables = ReliabilityTables(
+        review_df["paper"],
+        review_df["reviewer"],
+        review_df["score"],
+        review_df["recommend"],
+    )
+
+    paper_scores = review_df.groupby("paper")["score"]
+    review_df["others"] = (paper_scores.transform("sum") - review_df["score"]) / (
+        paper_scores.transform("count") - 1
+    )
+    pairs = total = 0
+    for reviewer, group in review_df.groupby("reviewer"):
+        row = tables.reviewer_df.loc[reviewer]
+        shared = group.dropna(subset=["others"])
+        shared = shared[np.isfinite(shared["others"])]
+        assert row["number_of_consensus_reviews"] == len(shared)
+        if len(shared) > 2:
+            assert row["consensus_correlation"] == pytest.approx(
+                np.corrcoef(shared["score"], shared["others"])[0, 1]
+            )
+            assert row["consensus_bias"] == pytest.approx(
+                (shared["score"] - shared["others"]).mean()
+            )
+            assert row["consensus_mean_abs_deviation"] == pytest.approx(
+                (shared["score"] - shared["others"]).abs().mean()
+            )
+
+        accepted = group.loc[group["recommend"] == 1, "score"]
+        rejected = group.loc[group["recommend"] == 0, "score"]
+        ordered = sum(
+            1.0 if a > r else 0.5 if a == r else 0.0 for a in accepted for r in rejected
+        )
+        pairs += ordered
+        total += len(accepted) * len(rejected)
+        if len(accepted) and len(rejected):
+            assert row["recommend_consistency"] == pytest.approx(
+                ordered / (len(accepted) * len(rejected))
+            )
+        else:
+            assert np.isnan(row["recommend_consistency"])
+    assert tables.recommend_consistency == pytest.approx(pairs / total)
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("dataframe_only", [True, False])
+def test_make_reliability_tables(toy_bot, dataframe_only):
+    toy_bot.assemble_paper_book()
+    tables = toy_bot.make_reliability_tables(dataframe_only=dataframe_only)
+
+    # only 2020/1 has two reviews: hc scored 3.0 and hd 4.0
+    assert toy_bot.reliability_tables is tables
+    assert tables.krippendorff_alpha == pytest.approx(0.0)
+    assert tables.recommend_consistency == 1.0
+    reviewer_df = tables.reviewer_df
+    assert list(reviewer_df["number_of_consensus_reviews"]) == [1, 1]
+    assert list(reviewer_df["consensus_bias"]) == [-1.0, 1.0]
+    assert list(reviewer_df["recommend_consistency"]) == [1.0, 1.0]
+
+    reviewers = [
+        review.reviewer
+        for paper in toy_bot.paper_book.paper
+        for review in paper.reviews
+    ]
+    if dataframe_only:
+        assert all(r.number_of_consensus_reviews == 0 for r in reviewers)
+    else:
+        assert [r.consensus_bias for r in reviewers] == [-1.0, 1.0, 1.0, -1.0]
+        assert all(r.recommend_consistency == 1.0 for r in reviewers)
+        assert reviewers[0].consensus_correlation == 0
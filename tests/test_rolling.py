@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot import data_model_pb2 as dm
+from chandra_bot.rolling import aggregate_reviewer_years, window_stats
+
+
+@pytest.mark.basic
+def test_window_stats():
+    table_df = aggregate_reviewer_years(
+        ["r", "r", "r", "r", "s"], [2019, 2020, 2020, 2022, 2020], [1, 2, 4, 5, 3]
+    )
+    stats_df = window_stats(table_df, window=2)
+
+    assert list(stats_df["number_of_reviews"]) == [1, 3, 1, 1]
+    assert list(stats_df["mean_present_score"].round(4)) == [1.0, 2.3333, 5.0, 3.0]
+    assert stats_df.loc[("r", 2020), "std_dev_present_score"] == pytest.approx(
+        np.std([1, 2, 4], ddof=1)
+    )
+    assert np.isnan(stats_df.loc[("r", 2022), "std_dev_present_score"])
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("dataframe_only", [True, False])
+def test_windowed_normalized_scores(toy_bot, dataframe_only):
+    toy_bot.assemble_paper_book()
+    toy_bot.compute_normalized_scores(
+        min_number_reviews=2, dataframe_only=dataframe_only, window=2
+    )
+    if dataframe_only:
+        review_df = toy_bot.review_df
+    else:
+        review_df = pd.DataFrame(
+            [
+                {
+                    "number_of_reviews": review.reviewer.number_of_reviews,
+                    "mean_present_score": review.reviewer.mean_present_score,
+                    "normalized_present_score": review.normalized_present_score,
+                }
+                for paper in toy_bot.paper_book.paper
+                for review in paper.reviews
+            ]
+        )
+
+    # hc: 3.0 in 2020 and 1.0 in 2021; hd: 4.0 and 5.0 in 2020
+    assert list(review_df["number_of_reviews"]) == [1, 2, 2, 2]
+    assert list(review_df["mean_present_score"]) == [3.0, 4.5, 4.5, 2.0]
+    normalized = review_df["normalized_present_score"].round(4)
+    assert list(normalized.iloc[1:]) == [-0.7071, 0.7071, -0.7071]
+    if dataframe_only:
+        assert np.isnan(normalized.iloc[0])
+    else:
+        assert normalized.iloc[0] == 0
+
+    toy_bot.compute_normalized_scores(
+        min_number_reviews=1, dataframe_only=dataframe_only, window=1
+    )
+    assert toy_bot.reviewer_year_df.loc[("hc", 2021), "score_sum"] == 1.0
+    if dataframe_only:
+        assert list(toy_bot.review_df["mean_present_score"]) == [3.0, 4.5, 4.5, 1.0]
+
+
+@pytest.mark.basic
+def test_windowed_normalized_scores_by_year(toy_bot):
+    toy_bot.assemble_paper_book()
+    toy_bot.compute_normalized_scores(min_number_reviews=1, window=2)
+    full_book = toy_bot.paper_book.SerializeToString()
+    full_df = toy_bot.reviewer_year_df
+
+    year_bot = cbot(input_paper_book=dm.PaperBook())
+    year_bot.paper_book.ParseFromString(full_book)
+    for paper in year_bot.paper_book.paper:
+        for review in paper.reviews:
+            review.ClearField("normalized_present_score")
+            review.reviewer.ClearField("mean_present_score")
+    year_bot.compute_normalized_scores(min_number_reviews=1, window=2, years=[2020])
+    year_bot.compute_normalized_scores(min_number_reviews=1, window=2, years=[2021])
+
+    # NaN standard deviations compare unequal, so compare the serialized books
+    assert year_bot.paper_book.SerializeToString() == full_book
+    assert year_bot.reviewer_year_df.equals(full_df)
@@ -0,0 +1,92 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot.schedule import Schedule
+
+
+def _costs(schedule, authors):
+    paper_df = schedule.paper_df.assign(authors=authors)
+    topic_cost = sum(
+        a != b
+        for _, group in paper_df.groupby("session")
+        for a, b in itertools.combinations(group["topic"], 2)
+    )
+    author_df = paper_df.explode("authors").drop_duplicates(["authors", "session"])
+    sessions = author_df.groupby(["authors", "slot"])["session"].count()
+    return topic_cost, int((sessions - 1).sum())
+
+
+@pytest.mark.basic
+def test_schedule_costs():
+    rng = np.random.default_rng(0)
+    number_papers = 120
+    topics = rng.integers(0, 9, number_papers)
+    authors = [
+        list(rng.choice(150, rng.integers(1, 4), replace=False))
+        for _ in range(number_papers)
+    ]
+    session_df = pd.DataFrame(
+        {"capacity": [6] * 20 + [20], "slot": [i % 5 for i in range(20)] + [9]},
+        index=[f"lectern {i}" for i in range(20)] + ["poster"],
+    )
+    schedule = Schedule(range(number_papers), topics, authors, session_df, seed=0)
+
+    assert schedule.objective <= schedule.greedy_objective
+    assert (schedule.topic_cost, schedule.author_clashes) == _costs(schedule, authors)
+    assert schedule.objective == schedule.topic_cost + 100 * schedule.author_clashes
+    assert (schedule.session_df["number_of_papers"] <= session_df["capacity"]).all()
+    assert schedule.session_df["number_of_papers"].sum() == number_papers
+    assert schedule.runtime > 0
+
+
+@pytest.mark.basic
+def test_schedule_avoids_clashes():
+    # two topics of four papers, and an author on one paper of each topic
+    session_df = pd.DataFrame(
+        {"capacity": [4, 4, 4], "slot": ["am", "am", "pm"]}, index=["a", "b", "c"]
+    )
+    schedule = Schedule(
+        list("pqrstuvw"),
+        [1, 1, 1, 1, 2, 2, 2, 2],
+        [["x"], [], [], [], ["x"], [], [], []],
+        session_df,
+        seed=0,
+    )
+
+    assert schedule.author_clashes == 0
+    assert schedule.topic_cost == 0
+    # the topics of p and t are in different slots
+    assert schedule.paper_df.loc["p", "slot"] != schedule.paper_df.loc["t", "slot"]
+
+    with pytest.raises(ValueError):
+        Schedule(list("pqrst"), [1] * 5, [[]] * 5, session_df.iloc[:1])
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("dataframe_only", [True, False])
+def test_schedule_sessions(toy_bot, dataframe_only):
+    toy_bot.assemble_paper_book()
+    session_df = pd.DataFrame({"capacity": [1, 1], "slot": [1, 1]}, index=["a", "b"])
+    schedule = toy_bot.schedule_sessions(session_df, dataframe_only=dataframe_only)
+
+    # the accepted papers 2020/1 and 2021/1 share author A
+    paper_df = schedule.paper_df
+    assert list(paper_df.index) == ["2020/1", "2021/1"]
+    assert sorted(paper_df["session"]) == ["a", "b"]
+    assert schedule.author_clashes == 1
+
+
+@pytest.mark.basic
+def test_schedule_sessions_missing_author_ids(toy_bot):
+    paper_df = toy_bot.paper_df.loc[["2021/1"]].copy()
+    paper_df["author_ids"] = pd.NA
+    toy_bot.update_papers(paper_df)
+    session_df = pd.DataFrame({"capacity": [1, 1], "slot": [1, 1]}, index=["a", "b"])
+    schedule = toy_bot.schedule_sessions(session_df, dataframe_only=True)
+
+    # 2021/1 has no authors left to clash with 2020/1
+    assert list(schedule.paper_df.index) == ["2020/1", "2021/1"]
+    assert schedule.author_clashes == 0
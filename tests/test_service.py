@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+from chandra_bot.service import BotService, ServiceState  # noqa: E402
+
+
+async def _get_all(service, paths):
+    async with TestClient(TestServer(service.make_app())) as client:
+        results = []
+        for method, path in paths:
+            response = await client.request(method, path)
+            results.append((response.status, await response.json()))
+        return results
+
+
+@pytest.mark.basic
+def test_service_endpoints(toy_bot, tmp_path):
+    toy_bot.assemble_paper_book()
+    book_file = str(tmp_path / "book.bin")
+    toy_bot.write_paper_book(book_file)
+    service = BotService(book_file=book_file, workers=2)
+
+    results = asyncio.run(
+        _get_all(
+            service,
+            [
+                ("GET", "/health"),
+                ("GET", "/papers/2020/1"),
+                ("GET", "/papers?year=2020"),
+                ("GET", "/reviewers/hc"),
+                ("GET", "/conflicts/2020/1"),
+                ("GET", "/papers/1999/1"),
+                ("GET", "/papers"),
+                ("POST", "/refresh"),
+            ],
+        )
+    )
+    statuses = [status for status, _ in results]
+    assert statuses == [200, 200, 200, 200, 200, 404, 400, 200]
+
+    health, paper, year, reviewer, conflicts = [data for _, data in results[:5]]
+    assert health["papers"] == 3
+
+    assert paper["authors"] == ["A", "B"]
+    assert paper["number_of_reviews"] == 2
+    assert paper["mean_score"] == 3.5
+    assert paper["mean_verified_score"] == 3.5
+    # neither reviewer has the default 10 reviews
+    assert paper["mean_normalized_score"] is None
+
+    assert [summary["paper_id"] for summary in year] == ["2020/1", "2020/2"]
+
+    assert reviewer["paper_ids"] == ["2020/1", "2021/1"]
+    assert reviewer["mean_present_score"] == 2.0
+    assert reviewer["verified"]
+
+    # hc wrote 2020/2 with B, an author of 2020/1
+    assert conflicts == [
+        {
+            "reviewer_hash_id": "hc",
+            "author_hash_id": "hb",
+            "papers_written": 1,
+            "year_first_collab": 2020,
+        }
+    ]
+    assert paper["number_of_conflicts"] == 1
+
+
+@pytest.mark.basic
+def test_service_min_number_reviews(toy_bot):
+    toy_bot.assemble_paper_book()
+    state = ServiceState(toy_bot, min_number_reviews=2)
+    assert set(state.collaborations) == {"hc", "hd"}
+
+    # hd scored 5.0 on 2020/2 and 4.0 on 2020/1
+    summary = state.paper_summary("2020/2")
+    assert summary["mean_normalized_score"] == pytest.approx(2**-0.5)
+    assert (
+        ServiceState(toy_bot, 3).paper_summary("2020/2")["mean_normalized_score"]
+        is None
+    )
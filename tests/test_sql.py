@@ -0,0 +1,92 @@
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+
+duckdb = pytest.importorskip("duckdb")
+
+
+@pytest.mark.basic
+def test_sql_tables(toy_bot):
+    year_df = toy_bot.sql(
+        """
+        SELECT p.year, count(*) AS n, avg(r.presentation_score) AS mean_score
+        FROM reviews r JOIN papers p USING (paper_id)
+        GROUP BY p.year ORDER BY p.year
+        """
+    )
+    assert list(year_df["year"]) == [2020, 2021]
+    assert list(year_df["n"]) == [3, 1]
+    assert list(year_df["mean_score"]) == [4.0, 1.0]
+
+    stats_df = toy_bot.sql("SELECT * FROM reviewer_stats ORDER BY hash_id")
+    assert list(stats_df["mean_present_score"]) == [2.0, 4.5]
+    assert list(stats_df["number_of_reviews"]) == [2, 2]
+
+    verified_df = toy_bot.sql(
+        "SELECT name FROM humans WHERE verified AND hash_id = ?", ["hd"]
+    )
+    assert list(verified_df["name"]) == ["D"]
+
+
+@pytest.mark.basic
+def test_sql_refreshes_replaced_tables(toy_bot):
+    assert "normalized_present_score" not in list(
+        toy_bot.sql("DESCRIBE reviews")["column_name"]
+    )
+    toy_bot.compute_normalized_scores(dataframe_only=True)
+    assert "normalized_present_score" in list(
+        toy_bot.sql("DESCRIBE reviews")["column_name"]
+    )
+
+
+@pytest.mark.basic
+def test_sql_conflicts_match_paper_book(toy_bot):
+    toy_bot.assemble_paper_book()
+    toy_bot.count_former_coauthors()
+    book_counts = {
+        (paper.number, review.reviewer.human.hash_id): (
+            review.papers_written_with_authors
+        )
+        for paper in toy_bot.paper_book.paper
+        for review in paper.reviews
+    }
+
+    conflict_df = toy_bot.sql(
+        """
+        SELECT paper_id, reviewer_human_hash_id, sum(papers_written) AS n
+        FROM conflicts GROUP BY ALL
+        """
+    )
+    sql_counts = {
+        (row.paper_id, row.reviewer_human_hash_id): row.n
+        for row in conflict_df.itertuples()
+    }
+    assert sql_counts == {k: v for k, v in book_counts.items() if v > 0}
+
+
+@pytest.mark.basic
+def test_sql_on_paper_book_bot(toy_bot):
+    toy_bot.assemble_paper_book()
+    book_bot = cbot(input_paper_book=toy_bot.paper_book)
+
+    paper_df = book_bot.sql("SELECT paper_id, year FROM papers ORDER BY paper_id")
+    assert list(paper_df["paper_id"]) == ["2020/1", "2020/2", "2021/1"]
+    # the view reads the lazy tables without assigning them to the bot
+    assert book_bot._lazy_dataframes == set(cbot.LAZY_DATAFRAMES)
+
+    with pytest.raises(ValueError):
+        cbot().sql("SELECT * FROM papers")
+
+
+@pytest.mark.basic
+def test_sql_papers_view_keeps_index(toy_bot):
+    columns = list(toy_bot.sql("DESCRIBE papers")["column_name"])
+    assert columns == ["paper_id"] + list(toy_bot.paper_df.columns)
+
+    # the frame is registered as is, with its paper_id index
+    assert toy_bot.sql_view._registered["papers"] is toy_bot.paper_df
+    title_df = toy_bot.sql(
+        "SELECT paper_id, title FROM papers WHERE year = 2020 ORDER BY paper_id"
+    )
+    assert list(title_df["paper_id"]) == ["2020/1", "2020/2"]
+    assert list(title_df["title"]) == ["one", "two"]
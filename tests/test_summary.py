@@ -0,0 +1,160 @@
+import os
+
+import pandas as pd
+import pytest
+
+from chandra_bot.summary import TABLEAU_FILES, SummaryTables
+
+
+def _assert_same_summaries(summaries, bot):
+    fresh = SummaryTables(bot, min_number_reviews=1)
+    for name in ["reviewer_summary_df", "review_summary_df", "paper_summary_df"]:
+        pd.testing.assert_frame_equal(
+            getattr(summaries, name).sort_index(), getattr(fresh, name).sort_index()
+        )
+
+
+@pytest.mark.basic
+def test_summary_tables(toy_bot):
+    summaries = toy_bot.make_summary_tables(min_number_reviews=1)
+
+    reviewer = summaries.reviewer_summary_df.loc["hc"]
+    assert reviewer["number_of_reviews"] == 2
+    assert reviewer["mean_present_score"] == 2.0
+    assert reviewer["verified"]
+
+    paper = summaries.paper_summary_df.loc["2020/1"]
+    assert paper["mean_score"] == 3.5
+    assert paper["mean_verified_score"] == 3.5
+    # hc wrote 2020/2 with B, an author of 2020/1
+    assert paper["number_of_conflicts"] == 1
+    assert (
+        summaries.review_summary_df.loc[("2020/1", "hc"), "papers_written_with_authors"]
+        == 1
+    )
+
+
+@pytest.mark.basic
+def test_summary_tables_incremental(toy_bot):
+    summaries = toy_bot.make_summary_tables(min_number_reviews=1)
+
+    counts = summaries.apply(review_df=toy_bot.review_df.iloc[[3]])
+    # hc's reviews and the two papers they reviewed, but not 2020/2
+    assert counts == {"reviewers": 1, "reviews": 2, "papers": 2}
+
+    toy_bot.update_reviews(
+        pd.DataFrame(
+            {
+                "paper_id": ["2020/2", "2021/1"],
+                "presentation_score": [2.0, 4.0],
+                "commentary_to_author": ["u", "v"],
+                "commentary_to_chair": ["u", "v"],
+                "reviewer_human_hash_id": ["hd", "hd"],
+                "presentation_recommendation": ["Reject", "Accept"],
+                "publication_recommendation": ["Reject", "Accept"],
+            }
+        )
+    )
+    assert len(toy_bot.review_df) == 5
+    _assert_same_summaries(summaries, toy_bot)
+
+    paper_df = toy_bot.paper_df.loc[["2021/1"]].copy()
+    paper_df["author_ids"] = "1,3"
+    toy_bot.update_papers(paper_df)
+    assert summaries.paper_summary_df.loc["2021/1", "number_of_conflicts"] == 1
+    _assert_same_summaries(summaries, toy_bot)
+
+
+@pytest.mark.basic
+def test_summary_tables_missing_author_ids(toy_bot):
+    summaries = toy_bot.make_summary_tables(min_number_reviews=1)
+
+    paper_df = toy_bot.paper_df.loc[["2020/2"]].copy()
+    paper_df["author_ids"] = pd.NA
+    toy_bot.update_papers(paper_df)
+    assert summaries.paper_summary_df.loc["2020/1", "number_of_conflicts"] == 0
+    _assert_same_summaries(summaries, toy_bot)
+
+
+@pytest.mark.basic
+def test_summary_tables_export(toy_bot, tmp_path):
+    toy_bot.count_words_in_paper_abstract(["a"], "abstract_a_count")
+    toy_bot.count_words_in_review_commentary(["x"], "comment_x_count")
+    summaries = toy_bot.make_summary_tables(min_number_reviews=2)
+    paths = summaries.export(str(tmp_path), prefix="toy")
+
+    assert [os.path.basename(path) for path in paths] == [
+        "toy-paper-summaries.csv",
+        "tableau-reduced-papers.csv",
+        "toy-reviewer-summaries.csv",
+        "tableau-reduced-reviews.csv",
+    ]
+    assert list(TABLEAU_FILES) == [
+        "paper-summaries",
+        "paper-summaries-reduced",
+        "reviewer-summaries",
+        "reviewer-summaries-reduced",
+    ]
+    papers_df, reduced_papers_df, reviews_df, reduced_reviews_df = [
+        pd.read_csv(path) for path in paths
+    ]
+
+    series_columns = [
+        "paper_id",
+        "authors",
+        "author_ids",
+        "title",
+        "year",
+        "committee_presentation_decision",
+        "committee_publication_decision",
+        "abstract",
+        "body",
+    ]
+    summary_columns = [
+        "number_of_reviews",
+        "mean_score",
+        "mean_normalized_score",
+        "mean_verified_score",
+        "mean_verified_normalized_score",
+        "number_of_conflicts",
+    ]
+    assert list(papers_df.columns) == series_columns + summary_columns
+    assert (
+        list(reduced_papers_df.columns)
+        == series_columns + ["abstract_a_count"] + summary_columns
+    )
+    assert list(papers_df["number_of_conflicts"]) == [1, 0, 0]
+
+    review_columns = [
+        "paper_id",
+        "presentation_score",
+        "commentary_to_author",
+        "commentary_to_chair",
+        "reviewer_human_hash_id",
+        "presentation_recommendation",
+        "publication_recommendation",
+    ]
+    assert list(reviews_df.columns) == review_columns + [
+        "mean_present_score",
+        "std_dev_present_score",
+        "verified",
+        "normalized_present_score",
+        "papers_written_with_authors",
+    ]
+    # the columns of notebooks/fake-reviewer-summaries-reduced.twb, in order
+    assert list(reduced_reviews_df.columns) == review_columns + [
+        "total_reviews",
+        "reviewer_mean_score",
+        "reviewer_sd_score",
+        "score_diff_mean",
+        "score_dist_mean",
+        "sum_coauthor_count",
+        "reviewer_verified",
+        "mean_verified_score_dist_mean",
+        "comment_x_count",
+        "committee_presentation_decision",
+        "committee_publication_decision",
+    ]
+    assert list(reduced_reviews_df["total_reviews"]) == [2, 2, 2, 2]
+    # hc scored 3 and 1, hd scored 4 and 5
+    assert list(reduced_reviews_df["score_diff_mean"]) == [1.0, -0.5, 0.5, -1.0]
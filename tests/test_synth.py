@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.synth import load_sources, make_fake_data
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return load_sources()
+
+
+def _small_data(sources, seed=7):
+    return make_fake_data(
+        number_humans=60,
+        papers_per_year=25,
+        start_year=2019,
+        end_year=2020,
+        verified_reviewers=5,
+        seed=seed,
+        sources=sources,
+    )
+
+
+@pytest.mark.basic
+def test_fake_data_shape(sources):
+    data = _small_data(sources)
+
+    assert len(data.paper_df) == 50
+    assert len(data.human_df) == 60
+    assert data.human_df["hash_id"].is_unique
+    assert data.human_df["verified"].sum() == 5
+    assert set(data.paper_df.columns) == set(cbot.PAPER_DICT.keys())
+    assert data.review_df["presentation_score"].between(1, 5).all()
+    assert data.review_df.groupby("paper_id").size().between(1, 6).all()
+
+
+@pytest.mark.basic
+def test_fake_data_is_seeded(sources):
+    first = _small_data(sources, seed=3)
+    second = _small_data(sources, seed=3)
+
+    pd.testing.assert_frame_equal(first.review_df, second.review_df)
+    pd.testing.assert_frame_equal(first.paper_df, second.paper_df)
+
+
+@pytest.mark.basic
+def test_authors_do_not_review_own_papers(sources):
+    data = _small_data(sources)
+    bot = data.to_bot()
+
+    author_df = bot.paper_author_df.merge(
+        data.human_df[["author_id", "hash_id"]], on="author_id"
+    )
+    pairs = set(zip(author_df["paper_id"], author_df["hash_id"]))
+    reviews = zip(data.review_df["paper_id"], data.review_df["reviewer_human_hash_id"])
+    assert not any(review in pairs for review in reviews)
+
+
+@pytest.mark.basic
+def test_fake_data_loads_into_bot(sources, tmp_path):
+    data = _small_data(sources)
+    files = data.write_csv(str(tmp_path))
+
+    bot = cbot.create_bot(**files)
+    bot.assemble_paper_book(bulk=True)
+
+    assert len(bot.paper_book.paper) == 50
+    assert sum(len(p.reviews) for p in bot.paper_book.paper) == len(data.review_df)
+    assert data.to_paper_book() == bot.paper_book
+    assert np.isin(bot.paper_author_df["author_id"], data.human_df["author_id"]).all()
+    assert os.path.exists(files["human_file"])
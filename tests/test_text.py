@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from chandra_bot.text import count_pattern
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_count_pattern_matches_serial(executor):
+    texts = pd.Series(
+        ["a dog and a cat", None, "", "cat cat dog", "bird"] * 5,
+        index=range(100, 125),
+        dtype=pd.StringDtype(),
+    )
+
+    counts = count_pattern(texts, "cat|dog", workers=3, executor=executor)
+
+    pd.testing.assert_series_equal(counts, texts.str.count("cat|dog"))
+
+
+@pytest.mark.basic
+def test_count_words_in_text(toy_bot):
+    toy_bot.review_df["commentary_to_chair"] = ["x y", "y", "z", "xx"]
+    toy_bot.count_words_in_text(
+        ["x", "y"], "xy_count", "commentary_to_chair", workers=2, executor="thread"
+    )
+    assert list(toy_bot.review_df["xy_count"]) == [2, 1, 0, 2]
+
+    toy_bot.count_words_in_paper_abstract(["a", "b"], "ab_count")
+    assert list(toy_bot.paper_df["ab_count"]) == [1, 1, 0]
+
+
+@pytest.mark.basic
+def test_count_words_in_paper_book(toy_bot):
+    toy_bot.assemble_paper_book()
+    toy_bot.count_words_in_review_commentary(
+        ["x", "w"], "xw_count", dataframe_only=False, workers=2
+    )
+
+    counts = [
+        review.commentary_to_author.word_counts["xw_count"]
+        for paper in toy_bot.paper_book.paper
+        for review in paper.reviews
+    ]
+    assert counts == [1, 0, 0, 1]
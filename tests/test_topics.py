@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from chandra_bot.topics import TopicModel
+
+TRAFFIC = "traffic signal timing intersection delay queue"
+TRANSIT = "transit bus ridership fare route passenger"
+
+
+def _texts(words, number, seed):
+    rng = np.random.default_rng(seed)
+    vocabulary = words.split()
+    return [" ".join(rng.choice(vocabulary, 6)) for _ in range(number)]
+
+
+@pytest.mark.basic
+def test_topic_model():
+    texts = _texts(TRAFFIC, 20, 0) + _texts(TRANSIT, 20, 1)
+    model = TopicModel(number_topics=2, number_terms=3, seed=0)
+    topics = model.fit(texts)
+
+    assert set(topics) == {1, 2}
+    assert len(set(topics[:20])) == 1 and len(set(topics[20:])) == 1
+    traffic_terms = model.top_terms[topics[0] - 1]
+    assert len(traffic_terms) == 3 and set(traffic_terms) <= set(TRAFFIC.split())
+
+    late = model.assign(["bus fare", "signal delay", ""])
+    assert list(late[:2]) == [topics[20], topics[0]]
+    assert list(model.topic_df(topics)["number_of_papers"]) == [20, 20]
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("dataframe_only", [True, False])
+def test_cluster_paper_topics(toy_bot, dataframe_only):
+    toy_bot.paper_df["title"] = ["Signal timing", "Bus ridership", "Signal delay"]
+    toy_bot.paper_df["abstract"] = [TRAFFIC, TRANSIT, "intersection queue"]
+    toy_bot.assemble_paper_book()
+
+    # cluster the 2020 papers, then assign the late 2021 paper
+    topic_df = toy_bot.cluster_paper_topics(
+        number_topics=2, year=2020, seed=0, dataframe_only=dataframe_only
+    )
+    assert list(topic_df["number_of_papers"]) == [1, 1]
+    assert toy_bot.assign_paper_topics(dataframe_only=dataframe_only) == 1
+    assert toy_bot.assign_paper_topics(dataframe_only=dataframe_only) == 0
+
+    if dataframe_only:
+        topics = list(toy_bot.paper_df["topic"])
+        terms = list(toy_bot.paper_df["topic_terms"])
+        assert all(paper.topic == 0 for paper in toy_bot.paper_book.paper)
+    else:
+        topics = [paper.topic for paper in toy_bot.paper_book.paper]
+        terms = [",".join(paper.topic_terms) for paper in toy_bot.paper_book.paper]
+    assert topics[0] == topics[2] != topics[1]
+    assert terms[0] == terms[2] == topic_df.loc[topics[0], "top_terms"]
+
+
+@pytest.mark.basic
+def test_cluster_accepted_papers(toy_bot):
+    toy_bot.paper_df["title"] = ["Signal timing", "Bus ridership", "Signal delay"]
+    toy_bot.assemble_paper_book()
+    toy_bot.cluster_paper_topics(number_topics=1, accepted_only=True)
+
+    # 2020/2 is the only paper rejected for presentation
+    assert [paper.topic for paper in toy_bot.paper_book.paper] == [1, 0, 1]
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import pytest
+
+from chandra_bot import ChandraBot as cbot
+from chandra_bot.warm_start import is_snapshot
+
+
+@pytest.mark.basic
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_warm_start_round_trip(toy_bot, tmp_path, memory_map):
+    snapshot_file = str(tmp_path / "bot.cbw")
+    toy_bot.assemble_paper_book()
+    toy_bot.make_summary_tables(min_number_reviews=1)
+    toy_bot.write_warm_start(snapshot_file)
+    assert is_snapshot(snapshot_file)
+
+    warm_bot = cbot.read_warm_start(snapshot_file, memory_map=memory_map)
+    assert warm_bot._paper_book_data is not None
+    assert warm_bot.paper_df.equals(toy_bot.paper_df)
+    assert warm_bot.review_df.equals(toy_bot.review_df)
+    assert warm_bot.human_df.equals(toy_bot.human_df)
+    assert warm_bot.summary_tables.bot is warm_bot
+    assert warm_bot.summary_tables.reviewer_summary_df.equals(
+        toy_bot.summary_tables.reviewer_summary_df
+    )
+    scores_df = warm_bot.query("reviews").filter("paper_id", "==", "2020/1").run()
+    assert list(scores_df["presentation_score"]) == [3.0, 4.0]
+    assert warm_bot._paper_book_data is not None
+
+    # the book is parsed on first use and the stored index attached to it
+    assert warm_bot.paper_book == toy_bot.paper_book
+    assert warm_bot.paper_index.paper_book is warm_bot.paper_book
+    assert warm_bot.index_paper_book() is warm_bot.paper_index
+    assert [paper.number for paper in warm_bot.paper_index.papers_in_year(2020)] == [
+        "2020/1",
+        "2020/2",
+    ]
+
+    # the mapped arrays are writable copies
+    review_df = toy_bot.review_df.iloc[[0]].copy()
+    review_df["presentation_score"] = 5.0
+    warm_bot.update_reviews(review_df)
+    assert warm_bot.review_df["presentation_score"].iloc[0] == 5.0
+
+
+@pytest.mark.basic
+def test_warm_start_of_paper_book_bot(toy_bot, tmp_path):
+    book_file = str(tmp_path / "book.bin")
+    snapshot_file = str(tmp_path / "bot.cbw")
+    toy_bot.assemble_paper_book()
+    toy_bot.write_paper_book(book_file)
+    book_bot = cbot.read_paper_book(book_file)
+    book_bot.write_warm_start(snapshot_file)
+
+    warm_bot = cbot.read_warm_start(snapshot_file)
+    for name in cbot.LAZY_DATAFRAMES:
+        assert warm_bot.materialized_dataframe(name) is not None
+    assert list(warm_bot.paper_df["authors"]) == ["A,B", "B,C", "A"]
+
+    # DataFrames built from the book are still dropped when it changes
+    warm_bot.compute_normalized_scores(min_number_reviews=1)
+    assert warm_bot.materialized_dataframe("review") is None
+
+
+@pytest.mark.basic
+def test_import_defers_heavy_dependencies():
+    statement = (
+        "import sys, chandra_bot; "
+        "assert 'pandas' not in sys.modules; "
+        "assert 'chandra_bot.data_model_pb2' not in sys.modules; "
+        "from chandra_bot import ChandraBot; "
+        "assert 'pandas' not in sys.modules; "
+        "assert 'numpy' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)